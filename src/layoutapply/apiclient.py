@@ -13,8 +13,8 @@
 #  under the License.
 """API client package"""
 
-import copy
 import json
+import random
 import time
 from dataclasses import asdict
 from http import HTTPMethod, HTTPStatus
@@ -68,6 +68,7 @@ class HarwareManageAPIBase(AbstractAPIBase):
         self.isosboot_conf = api_config.get("isosboot")
         self.retry_targets = api_config.get("retry").get("targets")
         self.retry_default = api_config.get("retry").get("default")
+        self.retry_backoff = api_config.get("retry").get("backoff")
         self.conn_retry_interval = server_connection_conf.get("retry").get("interval")
         self.conn_retry_max_count = server_connection_conf.get("retry").get("max_count")
         self.detail = Details()
@@ -236,7 +237,7 @@ class HarwareManageAPIBase(AbstractAPIBase):
         """
         cnt = 0
         while cnt != max_count:
-            time.sleep(interval)
+            time.sleep(self._get_backoff_interval(interval, cnt, self.retry_backoff))
             code, body = self._requests_wrapper(procedure)
             if code == HTTPStatus.OK or self.exception_flg is True:
                 break
@@ -246,6 +247,27 @@ class HarwareManageAPIBase(AbstractAPIBase):
                 cnt += 1
         return code, body
 
+    @staticmethod
+    def _get_backoff_interval(interval: int, cnt: int, backoff: dict | None) -> float:
+        """Get the wait time before the next retry or poll.
+        Without backoff settings, the configured interval is used as is. With backoff settings, the interval is
+        multiplied by the base for each retry or poll up to the cap, and with full jitter a random value between 0
+        and that is used.
+
+        Args:
+            interval (int): Interval setting for retry or polling
+            cnt (int): Number of retries or polls already waited for
+            backoff (dict | None): Backoff setting for retry or polling
+        Returns:
+            float: Wait time before the next retry or poll (unit: s)
+        """
+        if not backoff:
+            return interval
+        wait = min(backoff["cap"], interval * backoff["base"] ** cnt)
+        if backoff["jitter"] == "full":
+            wait = random.uniform(0, wait)
+        return wait
+
     @classmethod
     def _parse_response(cls, response: Response) -> tuple[int, Any]:
         """Analyze the response and return the HTTP status code and response body.
@@ -258,16 +280,17 @@ class HarwareManageAPIBase(AbstractAPIBase):
             tuple[int, Any]: HTTP status code, response body
         """
         code = response.status_code
-        body = response.text
         try:
-            body = json.loads(body)
+            # Parse the raw bytes; decoding them to text first is only needed when the body is not JSON.
+            body = json.loads(response.content)
         except Exception:  # pylint: disable=W0703
-            pass
+            body = response.text
         return code, body
 
     # fmt: off
     def _check_power_status(
         self, target_state: str, count: int, interval: int, get_info_obj: Any, procedure: Procedure,
+        backoff: dict | None = None,
     ) -> tuple[bool, None | dict, str]:
         """Check the expected power state transition
 
@@ -277,6 +300,7 @@ class HarwareManageAPIBase(AbstractAPIBase):
             interval (int): Interval setting for polling
             get_info_obj (Any): API object for retrieving device information
             procedure (Procedure): Migration procedure
+            backoff (dict | None): Backoff setting for polling
 
         Returns:
             tuple[bool, bool str]: Whether the expected state was achieved, error flag, current power state
@@ -294,7 +318,9 @@ class HarwareManageAPIBase(AbstractAPIBase):
                 is_expected_power_state = True
                 break
             cnt += 1
-            time.sleep(interval)
+            # No need to wait after the last attempt, as the state is not checked again.
+            if cnt != count:
+                time.sleep(self._get_backoff_interval(interval, cnt - 1, backoff))
         if cnt == count:
             self.logger.error(f"[E40029]{PowerStateNotChangeException(target_state, procedure.targetDeviceID,
                                                                       power_state).message}", stack_info=False)
@@ -330,6 +356,10 @@ class HarwareManageAPIBase(AbstractAPIBase):
             bool | None: Returns True if the device type is CPU, otherwise returns False.
             Returns None if the response code for obtaining device information is not 200.
         """
+        # The device type never changes, so reuse it if it has already been retrieved.
+        device_type = get_info_obj.device_types.get(procedure.targetDeviceID)
+        if device_type is not None:
+            return device_type == "CPU"
         get_information_responce = get_info_obj.execute(procedure)
         if get_information_responce["code"] == HTTPStatus.OK:
             return get_information_responce.get("device_information")["type"] == "CPU"
@@ -380,7 +410,7 @@ class PowerOnAPI(HarwareManageAPIBase):
             requests.Response: Response
         """
         self.detail.uri = ApiUri.POWERON_API.format(self.host, self.port, self.uri, procedure.targetDeviceID)
-        self.recent_request_uri = copy.deepcopy(self.detail.uri)
+        self.recent_request_uri = self.detail.uri
         self.detail.method = HTTPMethod.PUT
         self.detail.requestBody = {"action": RequestBodyAction.POWERON}
         self.logger.info(
@@ -457,6 +487,7 @@ class IsOSBootAPI(HarwareManageAPIBase):
         polling_conf = self.isosboot_conf.get("polling")
         self.polling_interval = polling_conf.get("interval")
         self.polling_count = polling_conf.get("count")
+        self.polling_backoff = polling_conf.get("backoff")
         self.skip_status_codes = [x.get("status_code") for x in polling_conf.get("skip")]
         self.skip_codes = [x.get("code") for x in polling_conf.get("skip")]
         self.is_os_boot_detail = IsOsBoot()
@@ -476,7 +507,7 @@ class IsOSBootAPI(HarwareManageAPIBase):
         self.is_os_boot_detail.uri = ApiUri.ISOSBOOT_API.format(
             self.host, self.port, self.uri, procedure.targetDeviceID
         )
-        self.recent_request_uri = copy.deepcopy(self.is_os_boot_detail.uri)
+        self.recent_request_uri = self.is_os_boot_detail.uri
         self.logger.info(
             (
                 f"Start request. url:[{self.is_os_boot_detail.uri}], ",
@@ -582,7 +613,9 @@ class IsOSBootAPI(HarwareManageAPIBase):
                     polling[count:{cnt}, limit:{self.polling_count}],
                 """
             )
-            time.sleep(self.polling_interval)
+            # No need to wait after the last attempt, as the status is not checked again.
+            if cnt != self.polling_count:
+                time.sleep(self._get_backoff_interval(self.polling_interval, cnt - 1, self.polling_backoff))
         elif code in self.skip_status_codes and body.get("code") in self.skip_codes:
             self.is_os_boot_detail.code = body.get("code")
             is_polling = False
@@ -628,6 +661,7 @@ class PowerOffAPI(HarwareManageAPIBase):
 
         self.interval = polling_conf.get("interval")
         self.count = polling_conf.get("count")
+        self.backoff = polling_conf.get("backoff")
 
     def _requests(self, procedure: Procedure):
         """Request the Power OFF API.
@@ -638,7 +672,7 @@ class PowerOffAPI(HarwareManageAPIBase):
             requests.Response: Response
         """
         self.detail.uri = ApiUri.POWEROFF_API.format(self.host, self.port, self.uri, procedure.targetDeviceID)
-        self.recent_request_uri = copy.deepcopy(self.detail.uri)
+        self.recent_request_uri = self.detail.uri
         self.detail.method = HTTPMethod.PUT
         self.detail.requestBody = {"action": RequestBodyAction.POWEROFF}
         self.logger.info(
@@ -676,7 +710,7 @@ class PowerOffAPI(HarwareManageAPIBase):
 
             if is_cpu is True:
                 is_expected, _, power_state = self._check_power_status(
-                    "Off", self.count, self.interval, self.get_info_api, procedure
+                    "Off", self.count, self.interval, self.get_info_api, procedure, self.backoff
                 )
                 if is_expected is False:
                     exc = PowerStateNotChangeException("Off", procedure.targetDeviceID, power_state)
@@ -718,6 +752,8 @@ class GetDeviceInformationAPI(HarwareManageAPIBase):
         self.get_information_uri = get_info_conf.get("uri")
         specs_conf = get_info_conf.get("specs")
         self.get_information_timeout = specs_conf.get("timeout")
+        # Device types retrieved so far, keyed by device ID
+        self.device_types: dict[str, str] = {}
 
     def _requests(self, procedure: Procedure):
         """Make a request to the device information retrieval API.
@@ -733,7 +769,7 @@ class GetDeviceInformationAPI(HarwareManageAPIBase):
             self.get_information_uri,
             procedure.targetDeviceID,
         )
-        self.recent_request_uri = copy.deepcopy(get_device_information_uri)
+        self.recent_request_uri = get_device_information_uri
         get_device_information_method = HTTPMethod.GET
         self.logger.info(
             (
@@ -767,6 +803,7 @@ class GetDeviceInformationAPI(HarwareManageAPIBase):
         if code == HTTPStatus.OK:
             try:
                 validate(body, schema=device_information_scheme)
+                self.device_types[procedure.targetDeviceID] = body["type"]
             except ValidationError as err:
                 code = HTTPStatus.BAD_REQUEST
                 error_message = err.message.split("\n")[-1]
@@ -792,9 +829,11 @@ class DisconnectAPI(HarwareManageAPIBase):
         args = [hardware_control_conf, get_info_conf, api_config, logger_args, server_connection_conf]
         super().__init__(*args)
         self.poweroff_api = PowerOffAPI(*args)
-        self.get_info_api = GetDeviceInformationAPI(*args)
+        # Share the device information API with the power-off so that it does not retrieve the device type again.
+        self.get_info_api = self.poweroff_api.get_info_api
         conf = get_info_conf.get("specs").get("disconnect").get("polling")
         self.count, self.interval = conf.get("count"), conf.get("interval")
+        self.backoff = conf.get("backoff")
 
     def _requests(self, procedure: Procedure):
         """Make a request to the cutting API.
@@ -805,7 +844,7 @@ class DisconnectAPI(HarwareManageAPIBase):
             requests.Response: Response
         """
         self.detail.uri = ApiUri.DISCONNECT_API.format(self.host, self.port, self.uri, procedure.targetCPUID)
-        self.recent_request_uri = copy.deepcopy(self.detail.uri)
+        self.recent_request_uri = self.detail.uri
         self.detail.method = HTTPMethod.PUT
         self.detail.requestBody = {
             "action": RequestBodyAction.DISCONNECT,
@@ -849,7 +888,7 @@ class DisconnectAPI(HarwareManageAPIBase):
                 return poweroff_detail, self.is_suspended
 
             is_expected, err_resp, power_state = self._check_power_status(
-                "Off", self.count, self.interval, self.get_info_api, procedure
+                "Off", self.count, self.interval, self.get_info_api, procedure, self.backoff
             )
             if is_expected is False or err_resp is not None:
                 exc = PowerStateNotChangeException("Off", procedure.targetDeviceID, power_state)
@@ -887,6 +926,7 @@ class ConnectAPI(HarwareManageAPIBase):
         self.poweron_api = PowerOnAPI(*args)
         conf = get_info_conf.get("specs").get("connect").get("polling")
         self.count, self.interval = conf.get("count"), conf.get("interval")
+        self.backoff = conf.get("backoff")
 
     def _requests(self, procedure: Procedure):
         """Make a request to the connection API
@@ -903,7 +943,7 @@ class ConnectAPI(HarwareManageAPIBase):
             self.uri,
             procedure.targetCPUID,
         )
-        self.recent_request_uri = copy.deepcopy(self.detail.uri)
+        self.recent_request_uri = self.detail.uri
         self.detail.method = HTTPMethod.PUT
         self.detail.requestBody = {
             "action": RequestBodyAction.CONNECT,
@@ -946,7 +986,7 @@ class ConnectAPI(HarwareManageAPIBase):
                 return poweron_detail, self.is_suspended
 
             is_expected, err_resp, power_state = self._check_power_status(
-                "On", self.count, self.interval, self.get_info_api, procedure
+                "On", self.count, self.interval, self.get_info_api, procedure, self.backoff
             )
             if is_expected is False or err_resp is not None:
                 exc = PowerStateNotChangeException("Off", procedure.targetDeviceID, power_state)
@@ -44,13 +44,29 @@ class Session(Singleton):
     def __init__(self):
         self.session = requests.Session()
 
+    @classmethod
+    def current(cls):
+        """Get the session shared by the API clients created in the current process.
+        Keeping one session lets the requests reuse pooled connections, including across retries.
+        Clients created after a fork, such as in the apply process that server.py starts, get a new session
+        instead of the connections of the parent. API clients pickled to a worker process keep the session they
+        were created with; the unpickled copy has its own connection pool.
+
+        Returns:
+            Session: Session of the current process
+        """
+        if getattr(cls, "_pid", None) != os.getpid():
+            cls._instance = cls()
+            cls._pid = os.getpid()
+        return cls._instance
+
 
 class BaseApiClient:
     """Base class for executing API requests"""
 
     def __init__(self, logger: Logger, conn_retry_interval: int = 0, conn_retry_max_count: int = 0) -> None:
         """Constructor"""
-        self.session = Session().session
+        self.session = Session.current().session
         self.conn_retry_interval = conn_retry_interval
         self.conn_retry_max_count = conn_retry_max_count + 1
         self.logger = logger
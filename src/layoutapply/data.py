@@ -20,7 +20,7 @@ from typing import Any
 from layoutapply.const import Operation
 
 
-@dataclass
+@dataclass(slots=True)
 class Procedure:
     """Migration Procedure"""
 
@@ -103,12 +103,12 @@ class MigrationBaseAPI(BaseApiClient):
         Returns:
             tuple[int, Any]: HTTP status code, response body
         """
-        code, body = response.status_code, response.text
+        code = response.status_code
         try:
-            body = json.loads(body)
+            body = json.loads(response.content)
         # pylint: disable=W0703
         except Exception:  # pragma: no cover
-            pass
+            body = response.text
         return code, body
 
 
@@ -135,6 +135,10 @@ config = {
                                 },
                             },
                         },
+                        # Definition of exponential backoff applied to the retry interval
+                        "backoff": {
+                            "$ref": "#/$defs/backoff",
+                        },
                     },
                 },
                 # Timeout seconds (unit s, maximum 600s)
@@ -165,10 +169,36 @@ config = {
                             "minimum": 0,
                             "maximum": 240,
                         },
+                        "backoff": {
+                            "$ref": "#/$defs/backoff",
+                        },
                     },
                 }
             },
         },
+        # Definition of exponential backoff applied to the retry and polling intervals
+        "backoff": {
+            "type": "object",
+            "properties": {
+                # Multiplier of the interval for each retry or poll (minimum 1, maximum 4)
+                "base": {
+                    "type": "number",
+                    "minimum": 1,
+                    "maximum": 4,
+                },
+                # Upper limit of the interval (unit: s, maximum 240s)
+                "cap": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 240,
+                },
+                # Randomization of the interval ("full": 0 to the backoff interval)
+                "jitter": {
+                    "type": "string",
+                    "enum": ["none", "full"],
+                },
+            },
+        },
     },
     "type": "object",
     "required": [
@@ -374,6 +404,9 @@ config = {
                                     "minimum": 0,
                                     "maximum": 240,
                                 },
+                                "backoff": {
+                                    "$ref": "#/$defs/backoff",
+                                },
                                 # Definition regarding the response to skip the isOSboot API
                                 "skip": {
                                     "type": "array",
@@ -200,11 +200,10 @@ class ServiceAPIBase(AbstractAPIBase):
             tuple[int, Any]: HTTP status code, response body
         """
         code = response.status_code
-        body = response.text
         try:
-            body = json.loads(body)
+            body = json.loads(response.content)
         except Exception:  # pylint: disable=W0703
-            pass
+            body = response.text
         return code, body
 
     # fmt: off
@@ -181,6 +181,7 @@ class LayoutApplyConfig(BaseConfig):
         for o in [x for x, y in default_specs.items() if x != "timeout"]:
             _set_specs_polling_count(read_conf, o, specs_conf.get(o).get("polling"))
             _set_specs_polling_interval(read_conf, o, specs_conf.get(o).get("polling"))
+            _set_specs_polling_backoff(read_conf, o, specs_conf.get(o).get("polling"))
         _set_specs_timeout(read_conf, specs_conf)
 
         return read_conf
@@ -248,6 +249,7 @@ class LayoutApplyConfig(BaseConfig):
             retry_conf = read_conf["retry"]
             _set_retry_targets(conf, retry_conf)
             _set_retry_default(conf, retry_conf)
+            _set_retry_backoff(conf, retry_conf)
         _set_timeout(conf, read_conf)
         return conf
 
@@ -311,6 +313,7 @@ class LayoutApplyConfig(BaseConfig):
         _set_polling_count(conf, polling_conf)
         _set_polling_interval(conf, polling_conf)
         _set_polling_skip(conf, polling_conf)
+        _set_polling_backoff(conf, polling_conf)
         _set_request(conf, read_conf)
         _set_timeout(conf, read_conf)
         return conf
@@ -392,6 +395,19 @@ def _set_specs_polling_interval(read_conf: dict, operation: str, polling_conf: d
         read_conf["specs"][operation]["polling"]["interval"] = polling_conf["interval"]
 
 
+def _set_specs_polling_backoff(read_conf: dict, operation: str, polling_conf: dict):
+    """set config value if exists.
+
+    Args:
+        read_conf (dict): target config dict.
+        operation (str): operation name.
+        polling_conf (dict): default config value.
+    """
+    if "backoff" in polling_conf:
+        read_conf["specs"][operation]["polling"]["backoff"] = {"base": 1.3, "cap": 240, "jitter": "none"}
+        read_conf["specs"][operation]["polling"]["backoff"].update(polling_conf["backoff"])
+
+
 def _set_specs_timeout(read_conf: dict, specs_conf: dict):
     """set config value if exists.
 
@@ -453,6 +469,18 @@ def _set_retry_default(conf: dict, retry_conf: dict):
             conf["retry"]["default"]["max_count"] = retry_conf["default"]["max_count"]
 
 
+def _set_retry_backoff(conf: dict, retry_conf: dict):
+    """set config value if exists.
+
+    Args:
+        conf (dict): target config dict.
+        retry_conf (dict): default config value.
+    """
+    if "backoff" in retry_conf:
+        conf["retry"]["backoff"] = {"base": 2, "cap": 60, "jitter": "full"}
+        conf["retry"]["backoff"].update(retry_conf["backoff"])
+
+
 def _set_polling_count(conf: dict, polling_conf: dict):
     """set config value if exists.
 
@@ -475,6 +503,18 @@ def _set_polling_interval(conf: dict, polling_conf: dict):
         conf["polling"]["interval"] = polling_conf["interval"]
 
 
+def _set_polling_backoff(conf: dict, polling_conf: dict):
+    """set config value if exists.
+
+    Args:
+        conf (dict): target config dict.
+        polling_conf (dict): default config value.
+    """
+    if "backoff" in polling_conf:
+        conf["polling"]["backoff"] = {"base": 1.3, "cap": 240, "jitter": "none"}
+        conf["polling"]["backoff"].update(polling_conf["backoff"])
+
+
 def _set_polling_skip(conf: dict, polling_conf: dict):
     """set config value if exists.
 
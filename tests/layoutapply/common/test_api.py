@@ -66,6 +66,7 @@ class DummayApiClient(BaseApiClient):
         pass
 
 
+@pytest.mark.usefixtures("secret_store")
 class TestBaseApiClient:
     """Base Class for Making API Requests"""
 
@@ -82,7 +83,7 @@ class TestBaseApiClient:
             ),
         ],
     )
-    def test_get_can_request(self, params, payload, httpserver: HTTPServer, init_db_instance):
+    def test_get_can_request(self, params, payload, httpserver: HTTPServer):
         # arrange
         # Set to respond_with_json when returning the response body.
         httpserver.expect_request("/test", method="GET").respond_with_json(payload)
@@ -95,9 +96,7 @@ class TestBaseApiClient:
         assert response.status_code == 200
         assert json.loads(response.text) == payload
 
-    def test_get_timeout_setting_enabled_when_wait_2_seconds_with_timeout_1_second(
-        self, httpserver: HTTPServer, init_db_instance
-    ):
+    def test_get_timeout_setting_enabled_when_wait_2_seconds_with_timeout_1_second(self, httpserver: HTTPServer):
         # arrange
         # When performing server-side processing (such as waiting for a timeout), bind the method to respond_with_handler.
         def sleeping(request):
@@ -114,12 +113,8 @@ class TestBaseApiClient:
         "wait",
         [4, 6],
     )
-    def test_get_default_timeout_of_5_seconds_when_wait_4_and_6_senconds(
-        self, wait, httpserver: HTTPServer, init_db_instance
-    ):
+    def test_get_default_timeout_of_5_seconds_when_wait_4_and_6_senconds(self, wait, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
-
         def sleeping(request: Request):
             time.sleep(wait)
 
@@ -150,10 +145,8 @@ class TestBaseApiClient:
             ),
         ],
     )
-    def test_post_can_request(self, params, data, httpserver: HTTPServer, init_db_instance):
+    def test_post_can_request(self, params, data, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
-
         # If simply returning a status code, set the status_code in a requests.Response object to respond_with_response.
         def response(request: Request):
             resp = Response().status_code = 201
@@ -174,12 +167,8 @@ class TestBaseApiClient:
         # assert
         assert response.status_code == 201
 
-    def test_post_timeout_setting_enabled_when_wait_2_seconds_with_timeout_1_second(
-        self, httpserver: HTTPServer, init_db_instance
-    ):
+    def test_post_timeout_setting_enabled_when_wait_2_seconds_with_timeout_1_second(self, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
-
         def sleeping(request):
             time.sleep(2)
 
@@ -194,12 +183,8 @@ class TestBaseApiClient:
         "wait",
         [4, 6],
     )
-    def test_post_default_timeout_of_5_seconds_when_wait_4_and_6_senconds(
-        self, wait, httpserver: HTTPServer, init_db_instance
-    ):
+    def test_post_default_timeout_of_5_seconds_when_wait_4_and_6_senconds(self, wait, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
-
         def sleeping(request: Request):
             time.sleep(wait)
 
@@ -230,9 +215,8 @@ class TestBaseApiClient:
             ),
         ],
     )
-    def test_put_can_request(self, params, data, httpserver: HTTPServer, init_db_instance):
+    def test_put_can_request(self, params, data, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
         # If you simply want to return a status code, set the status_code of the requests.Response object with respond_with_response.
         # If there is data in JSON format, check if the header includes "Content-Type": "application/json".
         if data:
@@ -249,12 +233,8 @@ class TestBaseApiClient:
         # assert
         assert response.status_code == 204
 
-    def test_put_timeout_setting_enabled_when_wait_2_seconds_with_timeout_1_second(
-        self, httpserver: HTTPServer, init_db_instance
-    ):
+    def test_put_timeout_setting_enabled_when_wait_2_seconds_with_timeout_1_second(self, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
-
         def sleeping(request: Request):
             time.sleep(2)
 
@@ -271,12 +251,8 @@ class TestBaseApiClient:
         "wait",
         [4, 6],
     )
-    def test_put_default_timeout_of_5_seconds_when_wait_4_and_6_senconds(
-        self, wait, httpserver: HTTPServer, init_db_instance
-    ):
+    def test_put_default_timeout_of_5_seconds_when_wait_4_and_6_senconds(self, wait, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
-
         def sleeping(request: Request):
             time.sleep(wait)
 
@@ -307,9 +283,8 @@ class TestBaseApiClient:
             ),
         ],
     )
-    def test_delete_can_request(self, params, data, httpserver: HTTPServer, init_db_instance):
+    def test_delete_can_request(self, params, data, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
         # If you simply return a status code, set the status_code in the requests.Response object with respond_with_response.
         # If JSON data exists, check if the header contains "Content-Type": "application/json".
         if data:
@@ -326,12 +301,8 @@ class TestBaseApiClient:
         # assert
         assert response.status_code == 204
 
-    def test_delete_timeout_setting_enabled_when_wait_2_seconds_with_timeout_1_second(
-        self, httpserver: HTTPServer, init_db_instance
-    ):
+    def test_delete_timeout_setting_enabled_when_wait_2_seconds_with_timeout_1_second(self, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
-
         def sleeping(request: Request):
             time.sleep(2)
 
@@ -348,12 +319,8 @@ class TestBaseApiClient:
         "wait",
         [4, 6],
     )
-    def test_delete_default_timeout_of_5_seconds_when_wait_4_and_6_senconds(
-        self, wait, httpserver: HTTPServer, init_db_instance
-    ):
+    def test_delete_default_timeout_of_5_seconds_when_wait_4_and_6_senconds(self, wait, httpserver: HTTPServer):
         # arrange
-        httpserver.clear()
-
         def sleeping(request: Request):
             time.sleep(wait)
 
@@ -394,7 +361,7 @@ class TestBaseApiClient:
         ],
     )
     def test_modify_headers_and_data_are_properly_modified_when_modify_data_and_the_header_contenttype_is_applicationJson(
-        self, headers, data, init_db_instance
+        self, headers, data
     ):
         client = DummayApiClient("")
         res_header, res_data = client._modify_data_and_header(headers=headers, data=data)
@@ -434,9 +401,34 @@ class TestBaseApiClient:
         ],
     )
     def test_modify_headers_and_data_are_not_modified_when_modify_data_but_the_header_contenttype_is_not_applicationJson(
-        self, headers, data, init_db_instance
+        self, headers, data
     ):
         client = DummayApiClient("")
         res_header, res_data = client._modify_data_and_header(headers=headers, data=data)
         assert res_header == headers
         assert res_data == data
+
+    def test_session_shared_by_clients_in_same_process(self, httpserver: HTTPServer):
+        # arrange
+        httpserver.expect_request("/test", method="GET").respond_with_json({})
+
+        # act
+        client = DummayApiClient(httpserver.url_for("/test"))
+        other_client = DummayApiClient(httpserver.url_for("/test"))
+        client.get()
+        other_client.get()
+
+        # assert
+        assert client.session is other_client.session
+        assert isinstance(client.session, requests.Session)
+
+    def test_session_not_shared_with_forked_process(self, mocker):
+        # arrange
+        client = DummayApiClient("")
+        mocker.patch("layoutapply.common.api.os.getpid", return_value=-1)
+
+        # act
+        forked_client = DummayApiClient("")
+
+        # assert
+        assert forked_client.session is not client.session
@@ -11,21 +11,23 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 #  under the License.
+import itertools
 import json
 import logging.config
 import os
 import re
-import uuid
 
 import psycopg2
 import pytest
+import requests
 from psycopg2.extras import DictCursor
 from pytest_httpserver import HTTPServer
 from werkzeug import Response
 
 from layoutapply.common.logger import Logger
+from layoutapply.const import RequestParameter
 from layoutapply.db import DbAccess
-from layoutapply.setting import LayoutApplyLogConfig
+from layoutapply.setting import LayoutApplyConfig, LayoutApplyLogConfig
 from tests.layoutapply.test_data.migration import (
     CONF_NODES_API_RESP_DATA,
     CONF_NODES_API_RESP_DATA_MULTIDEVICE,
@@ -59,6 +61,66 @@ GET_WORKFLOW_MANAGER_URI = "cdim/api/v1"
 EXTENDED_PROCEDURE_URI = "extended-procedure"
 EXTENDED_PROCEDURE_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
 
+# URL patterns of the mocked endpoints, compiled once for all tests.
+OPERATION_PATTERN = re.compile(f"/{HARDWARE_CONTROL_URI}/{OPERATION_URL}")
+POWER_OPERATION_PATTERN = re.compile(f"/{HARDWARE_CONTROL_URI}/{POWER_OPERATION_URL}")
+OS_BOOT_PATTERN = re.compile(f"/{HARDWARE_CONTROL_URI}/{OS_BOOT_URL}")
+DEVICE_INFO_PATTERN = re.compile(f"/{GET_INFORMATION_URI}/{DEVICE_INFO_URL}")
+NODES_PATTERN = re.compile(f"/{CONFIG_MANAGER_URI}/{CONF_NODES_URL}")
+AVAILABLE_RESOURCES_PATTERN = re.compile(f"/{CONFIG_MANAGER_URI}/{GET_AVAILABLE_RESOURCES_URL}")
+MIGRATION_PROCEDURES_PATTERN = re.compile(f"/{MIGRATION_PROCEDURE_URI}/{MIGRATION_URL}")
+WORKFLOW_MANAGER_PATTERN = re.compile(f"/{GET_WORKFLOW_MANAGER_URI}")
+EXTENDED_PROCEDURE_PATTERN = re.compile(f"/{WORKFLOW_MANAGER_URI}/{EXTENDED_PROCEDURE_URI}")
+EXTENDED_PROCEDURE_STATUS_PATTERN = re.compile(
+    f"/{WORKFLOW_MANAGER_URI}/{EXTENDED_PROCEDURE_URI}/{EXTENDED_PROCEDURE_ID}"
+)
+
+# The tests only need distinct, well-formed IDs, so they are numbered instead of generated randomly.
+_uuid_counter = itertools.count(1)
+
+
+def fake_uuid() -> str:
+    """Return the next ID in UUID format.
+
+    Returns:
+        str: ID that is unique within the test session
+    """
+    return f"00000000-0000-0000-0000-{next(_uuid_counter):012x}"
+
+
+def is_secret_store_ready():
+    try:
+        return requests.get(url=f"{RequestParameter.URL}", timeout=1).ok
+    except Exception:
+        return False
+
+
+@pytest.fixture(scope="session")
+def secret_store(docker_services):
+    """Wait until the dapr secret store started by docker compose answers.
+    LayoutApplyConfig reads the database settings from it when it is created.
+
+    Args:
+        docker_services (Services): docker compose services started for the session
+    """
+    docker_services.wait_until_responsive(timeout=30.0, pause=0.1, check=lambda: is_secret_store_ready())
+
+
+@pytest.fixture(scope="session")
+def layout_config(secret_store) -> LayoutApplyConfig:
+    """Configuration with the log settings loaded, read once per session.
+    Tests that change a setting must work on a copy of it.
+
+    Args:
+        secret_store (None): ensures the secret store is up before the configuration is read
+
+    Returns:
+        LayoutApplyConfig: configuration shared by the tests
+    """
+    config = LayoutApplyConfig()
+    config.load_log_configs()
+    return config
+
 
 @pytest.fixture(scope="session")
 def httpserver_listen_address():
@@ -85,6 +147,46 @@ def httpserver_listen_address():
     return (host, port)
 
 
+@pytest.fixture(scope="session")
+def make_httpserver(httpserver_listen_address, httpserver_ssl_context):
+    """Dummy server started once per session, replacing the one from pytest-httpserver.
+    It handles each request in its own thread, so werkzeug serves it over HTTP/1.1 and the client can keep
+    its connection alive without an idle connection holding up the other clients.
+
+    Args:
+        httpserver_listen_address (tuple): (IP, Port) of the dummy server
+        httpserver_ssl_context (ssl.SSLContext): SSL context of the dummy server, None for HTTP
+
+    Yields:
+        HTTPServer: Dummy server object
+    """
+    host, port = httpserver_listen_address
+    server = HTTPServer(host=host, port=port, ssl_context=httpserver_ssl_context, threaded=True)
+    server.start()
+
+    yield server
+
+    server.clear()
+    if server.is_running():
+        server.stop()
+
+
+@pytest.fixture
+def httpserver(make_httpserver: HTTPServer):
+    """Dummy server shared by the session, cleared before and after each test that uses it.
+    Clearing it after the test keeps its handlers from answering tests that reach the port without this fixture.
+
+    Args:
+        make_httpserver (HTTPServer): Dummy server object started once per session
+
+    Yields:
+        HTTPServer: Dummy server object
+    """
+    make_httpserver.clear()
+    yield make_httpserver
+    make_httpserver.clear()
+
+
 @pytest.fixture(scope="function")
 def hardwaremgr_fixture(httpserver: HTTPServer):
     """Create a mockup of the hardware control API.
@@ -96,73 +198,69 @@ def hardwaremgr_fixture(httpserver: HTTPServer):
     #    config = LayoutApplyConfig()
     #    uri = config.hardware_control.get("uri")
     #    get_information_uri = config.get_information.get("uri")
-    uri = HARDWARE_CONTROL_URI
-    get_information_uri = GET_INFORMATION_URI
-
-    # httpserver.clear()
-    # httpserver.clear_all_handlers()
 
     # with httpserver.wait(stop_on_nohandler=False, timeout=0.1) as waiter:
-    httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-        Response("", status=200)
-    )
-    httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-        Response("", status=200)
-    )
-    httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-        Response("", status=200)
-    )
-    httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-        Response("", status=200)
-    )
-    httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+    httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+    httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+    httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+    httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+    httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
         {"status": True, "IPAddress": "192.168.122.11"}, status=200
     )
-    httpserver.expect_request(
-        re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-    ).respond_with_json(
+    httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_json(
         {"type": "CPU", "powerState": "Off", "powerCapability": False},
         status=200,
     )
 
     yield
 
-    httpserver.clear()
+
+@pytest.fixture(scope="session")
+def workflow_manager_httpserver():
+    """Dummy workflow manager server, started once and shared by the whole session.
+    Like make_httpserver, it handles each request in its own thread.
+
+    Returns:
+        HTTPServer: Dummy server object
+    """
+    workflow_manager_server = HTTPServer(host=WORKFLOW_MANAGER_HOST, port=WORKFLOW_MANAGER_PORT, threaded=True)
+    workflow_manager_server.start()
+
+    yield workflow_manager_server
+
+    workflow_manager_server.clear()
+    if workflow_manager_server.is_running():
+        workflow_manager_server.stop()
 
 
 @pytest.fixture(scope="function")
-def extended_procedure_fixture():
+def extended_procedure_fixture(workflow_manager_httpserver: HTTPServer):
     """Mock up the workflow manager API
     Everything completes successfully.
 
     Args:
-        httpserver (HTTPServer): Dummy server object
+        workflow_manager_httpserver (HTTPServer): Dummy server object
     """
-    workflow_manager_uri = GET_WORKFLOW_MANAGER_URI
-    workflow_manager_server = HTTPServer(host=WORKFLOW_MANAGER_HOST, port=WORKFLOW_MANAGER_PORT)
-    workflow_manager_server.start()
+    workflow_manager_server = workflow_manager_httpserver
 
-    workflow_manager_server.expect_request(
-        re.compile(f"\/{workflow_manager_uri}\/{EXTENDED_PROCEDURE_URI}"), method="POST"
-    ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-    workflow_manager_server.expect_request(
-        re.compile(f"\/{workflow_manager_uri}\/{EXTENDED_PROCEDURE_URI}\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-    ).respond_with_json(
+    workflow_manager_server.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+        {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+    )
+    workflow_manager_server.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
         {
-            "applyID": str(uuid.uuid4()),
-            "targetCPUID": str(uuid.uuid4()),
-            "targetRequestInstanceID": str(uuid.uuid4()),
+            "applyID": fake_uuid(),
+            "targetCPUID": fake_uuid(),
+            "targetRequestInstanceID": fake_uuid(),
             "operation": "stop",
             "id": EXTENDED_PROCEDURE_ID,
             "status": "COMPLETED",
-            "serviceInstanceID": str(uuid.uuid4()),
+            "serviceInstanceID": fake_uuid(),
         },
         status=200,
     )
 
     yield
 
-    workflow_manager_server.stop()
     workflow_manager_server.clear()
 
 
@@ -177,17 +275,12 @@ def migration_server_fixture(httpserver: HTTPServer):
     #    config = LayoutApplyConfig()
     #    migration_uri = config.migration_procedure.get("uri")
     #    config_manager_uri = config.configuration_manager.get("uri")
-    migration_uri = MIGRATION_PROCEDURE_URI
-    config_manager_uri = CONFIG_MANAGER_URI
 
-    httpserver.clear()
-    httpserver.clear_all_handlers()
-
-    httpserver.expect_request(re.compile(f"\/{migration_uri}\/{MIGRATION_URL}"), method="POST").respond_with_response(
+    httpserver.expect_request(MIGRATION_PROCEDURES_PATTERN, method="POST").respond_with_response(
         Response(bytes(json.dumps(MIGRATION_API_RESP_DATA), encoding="utf-8"), status=200)
     )
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{CONF_NODES_URL}"),
+        NODES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -196,7 +289,7 @@ def migration_server_fixture(httpserver: HTTPServer):
         )
     )
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{GET_AVAILABLE_RESOURCES_URL}"),
+        AVAILABLE_RESOURCES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -207,8 +300,6 @@ def migration_server_fixture(httpserver: HTTPServer):
 
     yield
 
-    httpserver.clear()
-
 
 @pytest.fixture(scope="function")
 def migration_server_fixture_multi(httpserver: HTTPServer):
@@ -221,17 +312,12 @@ def migration_server_fixture_multi(httpserver: HTTPServer):
     #    config = LayoutApplyConfig()
     #    migration_uri = config.migration_procedure.get("uri")
     #    config_manager_uri = config.configuration_manager.get("uri")
-    migration_uri = MIGRATION_PROCEDURE_URI
-    config_manager_uri = CONFIG_MANAGER_URI
 
-    httpserver.clear()
-    httpserver.clear_all_handlers()
-
-    httpserver.expect_request(re.compile(f"\/{migration_uri}\/{MIGRATION_URL}"), method="POST").respond_with_response(
+    httpserver.expect_request(MIGRATION_PROCEDURES_PATTERN, method="POST").respond_with_response(
         Response(bytes(json.dumps(MIGRATION_API_RESP_DATA), encoding="utf-8"), status=200)
     )
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{CONF_NODES_URL}"),
+        NODES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -240,7 +326,7 @@ def migration_server_fixture_multi(httpserver: HTTPServer):
         )
     )
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{GET_AVAILABLE_RESOURCES_URL}"),
+        AVAILABLE_RESOURCES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -251,8 +337,6 @@ def migration_server_fixture_multi(httpserver: HTTPServer):
 
     yield
 
-    httpserver.clear()
-
 
 @pytest.fixture(scope="function")
 def migration_server_fixture_nodeid_specified(httpserver: HTTPServer):
@@ -265,17 +349,12 @@ def migration_server_fixture_nodeid_specified(httpserver: HTTPServer):
     #    config = LayoutApplyConfig()
     #    migration_uri = config.migration_procedure.get("uri")
     #    config_manager_uri = config.configuration_manager.get("uri")
-    migration_uri = MIGRATION_PROCEDURE_URI
-    config_manager_uri = CONFIG_MANAGER_URI
-
-    httpserver.clear()
-    httpserver.clear_all_handlers()
 
-    httpserver.expect_request(re.compile(f"\/{migration_uri}\/{MIGRATION_URL}"), method="POST").respond_with_response(
+    httpserver.expect_request(MIGRATION_PROCEDURES_PATTERN, method="POST").respond_with_response(
         Response(bytes(json.dumps(MIGRATION_API_RESP_DATA), encoding="utf-8"), status=200)
     )
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{CONF_NODES_URL}"),
+        NODES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -284,7 +363,7 @@ def migration_server_fixture_nodeid_specified(httpserver: HTTPServer):
         )
     )
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{GET_AVAILABLE_RESOURCES_URL}"),
+        AVAILABLE_RESOURCES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -295,8 +374,6 @@ def migration_server_fixture_nodeid_specified(httpserver: HTTPServer):
 
     yield
 
-    httpserver.clear()
-
 
 @pytest.fixture(scope="function")
 def get_available_resources_nothing_bound_devices(httpserver: HTTPServer):
@@ -306,17 +383,12 @@ def get_available_resources_nothing_bound_devices(httpserver: HTTPServer):
     Args:
         httpserver (HTTPServer): Dummy server object
     """
-    migration_uri = MIGRATION_PROCEDURE_URI
-    config_manager_uri = CONFIG_MANAGER_URI
-
-    httpserver.clear()
-    httpserver.clear_all_handlers()
 
-    httpserver.expect_request(re.compile(f"\/{migration_uri}\/{MIGRATION_URL}"), method="POST").respond_with_response(
+    httpserver.expect_request(MIGRATION_PROCEDURES_PATTERN, method="POST").respond_with_response(
         Response(bytes(json.dumps(MIGRATION_API_RESP_DATA), encoding="utf-8"), status=200)
     )
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{CONF_NODES_URL}"),
+        NODES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -325,7 +397,7 @@ def get_available_resources_nothing_bound_devices(httpserver: HTTPServer):
         )
     )
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{GET_AVAILABLE_RESOURCES_URL}"),
+        AVAILABLE_RESOURCES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -336,8 +408,6 @@ def get_available_resources_nothing_bound_devices(httpserver: HTTPServer):
 
     yield
 
-    httpserver.clear()
-
 
 @pytest.fixture(scope="function")
 def hardwaremgr_error_fixture(httpserver: HTTPServer):
@@ -349,60 +419,39 @@ def hardwaremgr_error_fixture(httpserver: HTTPServer):
     #    config = LayoutApplyConfig()
     #    uri = config.hardware_control.get("uri")
     #    get_information_uri = config.get_information.get("uri")
-    uri = HARDWARE_CONTROL_URI
-    get_information_uri = GET_INFORMATION_URI
     err_msg = {"code": "xxxx", "message": "Internal Server Error."}
     err_code = 500
 
-    httpserver.clear()
-    httpserver.clear_all_handlers()
-
-    httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_json(
-        err_msg, status=err_code
-    )
-    httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_json(
-        err_msg, status=err_code
-    )
-    httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_json(
-        err_msg, status=err_code
-    )
-    httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_json(
-        err_msg, status=err_code
-    )
-    httpserver.expect_request(
-        re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-    ).respond_with_json(
+    httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=err_code)
+    httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=err_code)
+    httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=err_code)
+    httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=err_code)
+    httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_json(
         {"type": "CPU", "powerState": "Off", "powerCapability": False},
         status=200,
     )
     yield
-    httpserver.clear()
 
 
 @pytest.fixture(scope="function")
-def extended_procedure_error_fixture():
+def extended_procedure_error_fixture(workflow_manager_httpserver: HTTPServer):
     """Mock up the workflow manager API
     Everything ends failed.
 
     Args:
-        httpserver (HTTPServer): Dummy server object
+        workflow_manager_httpserver (HTTPServer): Dummy server object
     """
     err_msg = {"code": "xxxx", "message": "Internal Server Error."}
     err_code = 500
-    workflow_manager_uri = GET_WORKFLOW_MANAGER_URI
-    workflow_manager_server = HTTPServer(host=WORKFLOW_MANAGER_HOST, port=WORKFLOW_MANAGER_PORT)
-    workflow_manager_server.start()
+    workflow_manager_server = workflow_manager_httpserver
 
-    workflow_manager_server.expect_request(re.compile(f"\/{workflow_manager_uri}"), method="POST").respond_with_json(
-        err_msg, err_code
+    workflow_manager_server.expect_request(WORKFLOW_MANAGER_PATTERN, method="POST").respond_with_json(err_msg, err_code)
+    workflow_manager_server.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
+        {}, status=503
     )
-    workflow_manager_server.expect_request(
-        re.compile(f"\/{workflow_manager_uri}\/{EXTENDED_PROCEDURE_URI}\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-    ).respond_with_json({}, status=503)
 
     yield
 
-    workflow_manager_server.stop()
     workflow_manager_server.clear()
 
 
@@ -416,18 +465,13 @@ def migration_server_err_fixture(httpserver: HTTPServer):
     #    config = LayoutApplyConfig()
 
     #    uri = config.migration_procedure.get("uri")
-    migration_uri = MIGRATION_PROCEDURE_URI
-    config_manager_uri = CONFIG_MANAGER_URI
     api_err_msg = {
         "code": "xxxx",
         "message": "desiredLayout is a required property.",
     }
 
-    httpserver.clear()
-    httpserver.clear_all_handlers()
-
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{CONF_NODES_URL}"),
+        NODES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -436,7 +480,7 @@ def migration_server_err_fixture(httpserver: HTTPServer):
         )
     )
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{GET_AVAILABLE_RESOURCES_URL}"),
+        AVAILABLE_RESOURCES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -445,7 +489,7 @@ def migration_server_err_fixture(httpserver: HTTPServer):
         )
     )
 
-    httpserver.expect_request(re.compile(f"\/{migration_uri}\/{MIGRATION_URL}"), method="POST").respond_with_response(
+    httpserver.expect_request(MIGRATION_PROCEDURES_PATTERN, method="POST").respond_with_response(
         Response(
             bytes(json.dumps(api_err_msg), encoding="utf-8"),
             status=500,
@@ -454,8 +498,6 @@ def migration_server_err_fixture(httpserver: HTTPServer):
 
     yield
 
-    httpserver.clear()
-
 
 @pytest.fixture(scope="function")
 def conf_manager_server_err_fixture(httpserver: HTTPServer):
@@ -466,14 +508,13 @@ def conf_manager_server_err_fixture(httpserver: HTTPServer):
     """
     #    config = LayoutApplyConfig()
     #    uri = config.configuration_manager.get("uri")
-    uri = CONFIG_MANAGER_URI
 
     api_err_msg = {
         "code": "xxxx",
         "message": "Failed to access to DB",
     }
 
-    httpserver.expect_request(re.compile(f"\/{uri}\/{CONF_NODES_URL}"), method="GET").respond_with_response(
+    httpserver.expect_request(NODES_PATTERN, method="GET").respond_with_response(
         Response(
             bytes(json.dumps(api_err_msg), encoding="utf-8"),
             status=500,
@@ -482,8 +523,6 @@ def conf_manager_server_err_fixture(httpserver: HTTPServer):
 
     yield
 
-    httpserver.clear()
-
 
 @pytest.fixture(scope="function")
 def get_available_resources_err_fixture(httpserver: HTTPServer):
@@ -492,17 +531,13 @@ def get_available_resources_err_fixture(httpserver: HTTPServer):
     Args:
         httpserver (HTTPServer): Dummy server object
     """
-    config_manager_uri = CONFIG_MANAGER_URI
     api_err_msg = {
         "code": "xxxx",
         "message": "Failed to access to DB",
     }
 
-    httpserver.clear()
-    httpserver.clear_all_handlers()
-
     httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{CONF_NODES_URL}"),
+        NODES_PATTERN,
         method="GET",
     ).respond_with_response(
         Response(
@@ -510,9 +545,7 @@ def get_available_resources_err_fixture(httpserver: HTTPServer):
             status=200,
         )
     )
-    httpserver.expect_request(
-        re.compile(f"\/{config_manager_uri}\/{GET_AVAILABLE_RESOURCES_URL}"), method="GET"
-    ).respond_with_response(
+    httpserver.expect_request(AVAILABLE_RESOURCES_PATTERN, method="GET").respond_with_response(
         Response(
             bytes(json.dumps(api_err_msg), encoding="utf-8"),
             status=500,
@@ -521,8 +554,6 @@ def get_available_resources_err_fixture(httpserver: HTTPServer):
 
     yield
 
-    httpserver.clear()
-
 
 DB_CONNECT = None
 
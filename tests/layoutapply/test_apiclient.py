@@ -13,14 +13,17 @@
 #  under the License.
 """Test of the API Client Package"""
 
+import copy
+import functools
 import io
+import json
 import logging
 import logging.config
-import re
+import pickle
 import types
+from dataclasses import replace
 from logging import ERROR
 from time import sleep
-from uuid import uuid4
 
 import pytest
 import requests
@@ -41,7 +44,175 @@ from layoutapply.common.logger import Logger
 from layoutapply.const import ApiExecuteResultIdx, ApiUri
 from layoutapply.data import Details, IsOsBoot, Procedure
 from layoutapply.setting import LayoutApplyConfig
-from tests.layoutapply.conftest import DEVICE_INFO_URL, OPERATION_URL, OS_BOOT_URL, POWER_OPERATION_URL
+from tests.layoutapply.conftest import GET_INFORMATION_URI, HARDWARE_CONTROL_URI
+
+
+def _json_response(body: dict, status: int) -> Response:
+    """Serialize a JSON body once so the mock server can replay it as is.
+
+    Args:
+        body (dict): response body
+        status (int): status code
+
+    Returns:
+        Response: prebuilt response for respond_with_response
+    """
+    return Response(json.dumps(body), status=status, content_type="application/json")
+
+
+def _expect_ordered_responses(httpserver: HTTPServer, uri: str, method: str, responses: list) -> None:
+    """Register the responses that one endpoint returns, one per request, in the given order.
+
+    Args:
+        httpserver (HTTPServer): Dummy server object
+        uri (str): path of the endpoint
+        method (str): HTTP method of the endpoint
+        responses (list): responses to be returned in order
+    """
+    _expect_ordered_sequence(httpserver, [(uri, method, response) for response in responses])
+
+
+def _expect_ordered_sequence(httpserver: HTTPServer, sequence: list) -> None:
+    """Register the requests of a scenario that spans several endpoints, in the order they are expected.
+
+    Args:
+        httpserver (HTTPServer): Dummy server object
+        sequence (list): (uri, method, responder) of each request. The responder is either a Response
+            or a handler that builds one from the request.
+    """
+    expect_ordered_request = httpserver.expect_ordered_request
+    for uri, method, responder in sequence:
+        handler = expect_ordered_request(uri, method=method)
+        if isinstance(responder, Response):
+            handler.respond_with_response(responder)
+        else:
+            handler.respond_with_handler(responder)
+
+
+# Bodiless responses, shared by every handler that returns them.
+EMPTY_OK_RESPONSE = Response("", status=200)
+EMPTY_ERROR_RESPONSE = Response("", status=500)
+DUPLICATE_REQUEST_RESPONSE = _json_response({"code": "ER005BAS001", "message": "Duplicate requests CPU"}, 503)
+OS_BOOT_COMPLETED_RESPONSE = _json_response({"status": True, "IPAddress": "192.168.122.11"}, 200)
+OS_BOOT_NOT_SUPPORTED_RESPONSE = _json_response(
+    {"code": "EF003BAS010", "message": "A request that is not supported was made for the specified device ID."}, 400
+)
+# Transitional states returned by the polling handlers until the expected state is reached.
+MEMORY_POWERING_ON_RESPONSE = Response(
+    '{"type": "MEMORY", "powerState": "PoweringOn", "powerCapability":true}', status=200
+)
+MEMORY_POWERING_OFF_RESPONSE = Response(
+    '{"type": "MEMORY", "powerState": "PoweringOff", "powerCapability":true}', status=200
+)
+CPU_POWERING_OFF_RESPONSE = Response('{"type": "CPU", "powerState": "PoweringOff"}', status=200)
+OS_BOOT_IN_PROGRESS_RESPONSE = Response('{"status": false, "IPAddress": "192.168.122.11"}', status=200)
+# Final states that end the polling.
+MEMORY_POWERED_ON_RESPONSE = Response('{"type": "MEMORY", "powerState": "On", "powerCapability": true}', status=200)
+MEMORY_POWERED_OFF_RESPONSE = Response('{"type": "MEMORY", "powerState": "Off", "powerCapability": true}', status=200)
+CPU_POWERED_OFF_RESPONSE = Response('{"type": "CPU", "powerState": "Off"}', status=200)
+# The tests only need well-formed IDs, not unique ones.
+TEST_DEVICE_ID = "00000000-0000-0000-0000-000000000001"
+TEST_CPU_ID = "00000000-0000-0000-0000-000000000002"
+# Paths requested for the test device. The IDs are fixed, so the mock server matches them exactly.
+OPERATION_URI = f"/{HARDWARE_CONTROL_URI}/cpu/{TEST_CPU_ID}/aggregations"
+POWER_OPERATION_URI = f"/{HARDWARE_CONTROL_URI}/devices/{TEST_DEVICE_ID}/power"
+OS_BOOT_URI = f"/{HARDWARE_CONTROL_URI}/cpu/{TEST_DEVICE_ID}/is-os-ready"
+DEVICE_INFO_URI = f"/{GET_INFORMATION_URI}/devices/{TEST_DEVICE_ID}/specs"
+# Procedure shared by the tests, each of which only replaces the operation and target IDs.
+PROCEDURE_TEMPLATE = Procedure(operationID=1, operation="boot", dependencies=[])
+# API settings shared by the tests; each test passes its own deep copy to the API under test.
+RETRY_CONF = {
+    "targets": [{"status_code": 503, "code": "ER005BAS001", "interval": 2, "max_count": 1}],
+    "default": {"interval": 2, "max_count": 1},
+}
+RETRY_API_CONFIG = {"retry": RETRY_CONF}
+RETRY_POWEROFF_API_CONFIG = {"retry": RETRY_CONF, "poweroff": {"retry": RETRY_CONF}}
+API_CONFIG = {
+    "retry": RETRY_CONF,
+    "timeout": 10,
+    "isosboot": {
+        "polling": {"count": 5, "interval": 1, "skip": [{"status_code": 400, "code": "EF003BAS010"}]},
+        "request": {"timeout": 2},
+        "timeout": 10,
+    },
+}
+POWEROFF_API_CONFIG = {**API_CONFIG, "poweroff": {"retry": RETRY_CONF}}
+ISOSBOOT_POLLING_API_CONFIG = {
+    **API_CONFIG,
+    "isosboot": {
+        "polling": {"count": 3, "interval": 1, "skip": [{"status_code": 400, "code": "EF003BAS010"}]},
+        "request": {"timeout": 2},
+        "timeout": 200,
+    },
+}
+POLLING_GET_INFO_CONF = {
+    "host": "localhost",
+    "port": 48889,
+    "uri": "cdim/api/v1",
+    "specs": {
+        "poweroff": {"polling": {"count": 3, "interval": 1}},
+        "connect": {"polling": {"count": 3, "interval": 1}},
+        "disconnect": {"polling": {"count": 3, "interval": 1}},
+        # Ceiling of each request to the dummy server on loopback; keeps a stalled response from holding the test.
+        "timeout": 1,
+    },
+}
+POWEROFF_POLLING_GET_INFO_CONF = {
+    **POLLING_GET_INFO_CONF,
+    "specs": {
+        **POLLING_GET_INFO_CONF["specs"],
+        "connect": {"polling": {"count": 15, "interval": 6}},
+        "disconnect": {"polling": {"count": 15, "interval": 6}},
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def hc(layout_config: LayoutApplyConfig) -> types.SimpleNamespace:
+    """Hardware control settings, read once per module.
+
+    Args:
+        layout_config (LayoutApplyConfig): configuration shared by the tests
+
+    Returns:
+        types.SimpleNamespace: host, port and uri of the hardware control API
+    """
+    return types.SimpleNamespace(**layout_config.hardware_control)
+
+
+@pytest.fixture(scope="module")
+def poweron_uri(hc: types.SimpleNamespace) -> functools.partial:
+    """Power-on URI builder with the hardware control host, port and uri already filled in.
+
+    Args:
+        hc (types.SimpleNamespace): hardware control settings
+
+    Returns:
+        functools.partial: builds the power-on URI of the device ID it is given
+    """
+    return functools.partial(ApiUri.POWERON_API.format, hc.host, hc.port, hc.uri)
+
+
+@pytest.fixture(autouse=True)
+def api_sleep(mocker):
+    """Make the waits between retries and between polling attempts return at once.
+
+    Only the time module seen by apiclient is replaced, so mock handlers can still sleep.
+
+    Returns:
+        MagicMock: sleep function called before each retry and between polling attempts
+    """
+    return mocker.patch("layoutapply.apiclient.time").sleep
+
+
+@pytest.fixture
+def procedure() -> Procedure:
+    """Boot procedure for the test device, shared within a single test.
+
+    Returns:
+        Procedure: procedure to be passed to the API under test
+    """
+    return replace(PROCEDURE_TEMPLATE, targetDeviceID=TEST_DEVICE_ID)
 
 
 class TestHarwareManageAPIBase:
@@ -50,84 +221,32 @@ class TestHarwareManageAPIBase:
     the test will only be conducted for the power-on API regarding this process.
     """
 
-    def test_common_can_request(self, httpserver: HTTPServer, init_db_instance):
+    def test_common_can_request(self, httpserver: HTTPServer, procedure, hc, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            {"status": True, "IPAddress": "192.168.122.11"}, status=200
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        host = hc.host
+        port = hc.port
+        uri = hc.uri
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_response(OS_BOOT_COMPLETED_RESPONSE)
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-
-        index = result.uri.rfind("devices")
-        start_deviceid = result.uri[index + 8 : index + 12]
 
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
-        assert start_deviceid != "None"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-            result.uri,
-        )
+        assert result.uri == f"http://{host}:{port}/{uri}/devices/{TEST_DEVICE_ID}/power"
         assert result.requestBody == {"action": "on"}
         assert result.queryParameter == ""
         assert result.responseBody == ""
@@ -174,14 +293,15 @@ class TestHarwareManageAPIBase:
     def test_common_retry_when_response_is_retry_set(
         self,
         httpserver: HTTPServer,
+        procedure,
         retry_status_code,
         retry_err_code,
         retry_targets,
-        init_db_instance,
+        hc,
+        layout_config,
     ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -211,42 +331,26 @@ class TestHarwareManageAPIBase:
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
         # initial run, plus 4 retries, envisions the fifth execution.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": retry_err_code, "message": "retry0"}, status=retry_status_code)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": retry_err_code, "message": "retry1"}, status=retry_status_code)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": retry_err_code, "message": "retry2"}, status=retry_status_code)
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
-        # Insert the retry target to confirm that retries are not counted again, even if the retry target is received again midway.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": retry_err_code, "message": "retry3"}, status=retry_status_code)
-        # This message is expected to be returned as the final response.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": retry_err_code, "message": "retry4"}, status=500)
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        _expect_ordered_responses(
+            httpserver,
+            POWER_OPERATION_URI,
+            "PUT",
+            [
+                _json_response({"code": retry_err_code, "message": "retry0"}, retry_status_code),
+                _json_response({"code": retry_err_code, "message": "retry1"}, retry_status_code),
+                _json_response({"code": retry_err_code, "message": "retry2"}, retry_status_code),
+                # Insert the retry target to confirm that retries are not counted again,
+                # even if the retry target is received again midway.
+                _json_response({"code": retry_err_code, "message": "retry3"}, retry_status_code),
+                # This message is expected to be returned as the final response.
+                _json_response({"code": retry_err_code, "message": "retry4"}, 500),
+            ],
         )
+
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -260,12 +364,22 @@ class TestHarwareManageAPIBase:
         assert result.status == "FAILED"
         assert result.statusCode == 500
 
+    @pytest.mark.parametrize(
+        "failure_count",
+        [
+            # pattern where the first attempt fails and the second attempt succeeds.
+            1,
+            # pattern where the first attempt fails and the thrid attempt succeeds.
+            2,
+            # pattern where the first attempt fails and the last attempt succeeds.
+            3,
+        ],
+    )
     def test_common_stop_retry_when_received_normal_response_during_retry(
-        self, httpserver: HTTPServer, init_db_instance
+        self, httpserver: HTTPServer, procedure, failure_count, hc, layout_config
     ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -302,105 +416,17 @@ class TestHarwareManageAPIBase:
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            {"status": True, "IPAddress": "192.168.122.11"}, status=200
-        )
-        # pattern where the first attempt fails and the second attempt succeeds.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "Duplicate requests CPU"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_response(Response("", status=200))
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-        # act
-        execute_result = api_obj.execute(paylod)
-        result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-
-        # assert
-        assert result.operationID == 1
-        assert result.method == "PUT"
-        assert result.requestBody == {"action": "on"}
-        assert result.queryParameter == ""
-        assert result.responseBody == ""
-        assert result.status == "COMPLETED"
-        assert result.statusCode == 200
-
-        # pattern where the first attempt fails and the thrid attempt succeeds.
-        # arrange
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "Duplicate requests CPU"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "Duplicate requests CPU"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_response(Response("", status=200))
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_response(OS_BOOT_COMPLETED_RESPONSE)
+        _expect_ordered_responses(
+            httpserver,
+            POWER_OPERATION_URI,
+            "PUT",
+            [DUPLICATE_REQUEST_RESPONSE] * failure_count + [EMPTY_OK_RESPONSE],
         )
-        # act
-        execute_result = api_obj.execute(paylod)
-        result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-
-        # assert
-        assert result.operationID == 1
-        assert result.method == "PUT"
-        assert result.requestBody == {"action": "on"}
-        assert result.queryParameter == ""
-        assert result.responseBody == ""
-        assert result.status == "COMPLETED"
-        assert result.statusCode == 200
 
-        # pattern where the first attempt fails and the last attempt succeeds.
-        # arrange
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "Duplicate requests CPU"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "Duplicate requests CPU"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "Duplicate requests CPU"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_response(Response("", status=200))
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
@@ -410,10 +436,24 @@ class TestHarwareManageAPIBase:
         assert result.status == "COMPLETED"
         assert result.statusCode == 200
 
-    def test_common_no_retry_when_max_retry_is_0(self, httpserver: HTTPServer, init_db_instance):
+    @pytest.mark.parametrize(
+        "backoff, expected_sleeps",
+        [
+            # the interval doubles for each retry and is clamped to the cap.
+            ({"base": 2, "cap": 5, "jitter": "none"}, [2, 4, 5]),
+            # the interval is multiplied by the configured base.
+            ({"base": 3, "cap": 20, "jitter": "none"}, [2, 6, 18]),
+            # with full jitter, a random value between 0 and the backoff interval is used.
+            ({"base": 2, "cap": 5, "jitter": "full"}, [1.0, 2.0, 2.5]),
+        ],
+    )
+    def test_common_retry_interval_backoff_when_backoff_set(
+        self, httpserver: HTTPServer, mocker, procedure, backoff, expected_sleeps, api_sleep, hc, layout_config
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        mock_random = mocker.patch("layoutapply.apiclient.random")
+        mock_random.uniform.side_effect = lambda low, high: (low + high) / 2
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -425,13 +465,14 @@ class TestHarwareManageAPIBase:
                                 "status_code": 503,
                                 "code": "ER005BAS001",
                                 "interval": 2,
-                                "max_count": 0,
+                                "max_count": 5,
                             },
                         ],
                         "default": {
                             "interval": 2,
-                            "max_count": 1,
+                            "max_count": 5,
                         },
+                        "backoff": backoff,
                     },
                     "timeout": 10,
                     "isosboot": {
@@ -450,136 +491,100 @@ class TestHarwareManageAPIBase:
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
-        # initial run with 0 retries, executed only once.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "retry1"}, status=503)
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_response(OS_BOOT_COMPLETED_RESPONSE)
+        _expect_ordered_responses(
+            httpserver,
+            POWER_OPERATION_URI,
+            "PUT",
+            [DUPLICATE_REQUEST_RESPONSE] * 3 + [EMPTY_OK_RESPONSE],
         )
-        # This message is not called.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "retry2", "message": "Something Error."}, status=500)
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
-        assert result.operationID == 1
-        assert result.method == "PUT"
-        assert result.requestBody == {"action": "on"}
-        assert result.queryParameter == ""
-        assert result.responseBody == {
-            "code": "ER005BAS001",
-            "message": "retry1",
-        }
-        assert result.status == "FAILED"
-        assert result.statusCode == 503
+        assert result.status == "COMPLETED"
+        assert result.statusCode == 200
+        assert [call.args[0] for call in api_sleep.call_args_list] == expected_sleeps
 
-    def test_common_no_retry_when_failure_code_not_for_retry(self, httpserver: HTTPServer, init_db_instance):
+    def test_common_api_object_picklable_for_worker_process(self, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = PowerOnAPI(
+        config = layout_config
+        api_obj: HarwareManageAPIBase = ConnectAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
-        # Initial execution with 0 retries, executed only once.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json(
-            # code is not an error code subject to retry.
-            {"code": 504, "message": "Duplicate Requests CPU"},
-            status=503,
-        )
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json(
-            {"code": 504, "message": "Duplicate Requests CPU"},
-            status=503,
-        )
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "retry2", "message": "Something Error."}, status=500)
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
         # act
-        execute_result = api_obj.execute(paylod)
-        result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
+        # The object is pickled in the same way as when it is submitted to the ProcessPoolExecutor.
+        restored = pickle.loads(pickle.dumps(api_obj))
+
         # assert
-        assert result.operationID == 1
-        assert result.method == "PUT"
-        assert result.requestBody == {"action": "on"}
-        assert result.queryParameter == ""
-        assert result.responseBody == {
-            "code": 504,
-            "message": "Duplicate Requests CPU",
-        }
-        assert result.status == "FAILED"
-        assert result.statusCode == 503
+        assert restored.host == api_obj.host
+        assert restored.poweron_api.host == api_obj.poweron_api.host
 
-    def test_common_retry_on_failure_when_status_code_not_for_retry(self, httpserver: HTTPServer, init_db_instance):
+    @pytest.mark.parametrize(
+        "target_max_count, responses, expected_response_body, expected_status_code",
+        [
+            # initial run with 0 retries, executed only once.
+            pytest.param(
+                0,
+                [
+                    ({"code": "ER005BAS001", "message": "retry1"}, 503),
+                    # This message is not called.
+                    ({"code": "retry2", "message": "Something Error."}, 500),
+                ],
+                {"code": "ER005BAS001", "message": "retry1"},
+                503,
+                id="no_retry_when_max_retry_is_0",
+            ),
+            # code is not an error code subject to retry, so the default setting applies.
+            pytest.param(
+                1,
+                [
+                    ({"code": 504, "message": "Duplicate Requests CPU"}, 503),
+                    ({"code": 504, "message": "Duplicate Requests CPU"}, 503),
+                    # This message is not called.
+                    ({"code": "retry2", "message": "Something Error."}, 500),
+                ],
+                {"code": 504, "message": "Duplicate Requests CPU"},
+                503,
+                id="no_retry_when_failure_code_not_for_retry",
+            ),
+            # status code is not subject to retry, so the default setting applies.
+            pytest.param(
+                1,
+                [
+                    ({"code": 504, "message": "Duplicate requests CPU"}, 502),
+                    ({"code": 504, "message": "Duplicate requests CPU"}, 502),
+                    # This message is not called.
+                    ({"code": "retry2", "message": "Something Error."}, 500),
+                ],
+                {"code": 504, "message": "Duplicate requests CPU"},
+                502,
+                id="retry_on_failure_when_status_code_not_for_retry",
+            ),
+        ],
+    )
+    def test_common_failure_result_by_retry_setting(
+        self,
+        httpserver: HTTPServer,
+        procedure,
+        target_max_count,
+        responses,
+        expected_response_body,
+        expected_status_code,
+        hc,
+        layout_config,
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -591,7 +596,7 @@ class TestHarwareManageAPIBase:
                                 "status_code": 503,
                                 "code": "ER005BAS001",
                                 "interval": 2,
-                                "max_count": 1,
+                                "max_count": target_max_count,
                             },
                         ],
                         "default": {
@@ -616,57 +621,25 @@ class TestHarwareManageAPIBase:
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
-        # Initial execution with 0 retries, executed only once.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json(
-            # Execution with retry on error occurrence.
-            {"code": 504, "message": "Duplicate requests CPU"},
-            status=502,
-        )
-        # Execution with retry on error occurrence.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json(
-            # Execution with retry on error occurrence.
-            {"code": 504, "message": "Duplicate requests CPU"},
-            status=502,
-        )
-        # message is not called.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "retry2", "message": "Something Error."}, status=500)
+        for body, status in responses:
+            httpserver.expect_ordered_request(POWER_OPERATION_URI, method="PUT").respond_with_response(
+                _json_response(body, status)
+            )
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
+
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
         assert result.requestBody == {"action": "on"}
         assert result.queryParameter == ""
-        assert result.responseBody == {
-            "code": 504,
-            "message": "Duplicate requests CPU",
-        }
+        assert result.responseBody == expected_response_body
         assert result.status == "FAILED"
-        assert result.statusCode == 502
+        assert result.statusCode == expected_status_code
 
-    def test_common_no_retry_when_timed_out(self, httpserver: HTTPServer, init_db_instance, mocker, caplog):
+    def test_common_no_retry_when_timed_out(self, httpserver: HTTPServer, mocker, caplog, procedure, hc, layout_config):
         timeout_sec = 1
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -674,8 +647,7 @@ class TestHarwareManageAPIBase:
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -713,45 +685,34 @@ class TestHarwareManageAPIBase:
             }
         )
 
-        # Timeout, then cause a timeout after a 5-second sleep.
+        # Respond only after the client has timed out.
         def sleeping(request: Request):
-            sleep(timeout_sec + 5)
+            sleep(timeout_sec + 1)
 
         err_msg = {"message": "Exxxxx", "code": "ER005BAS001"}
-        uri = config.hardware_control.get("uri")
 
         # Initial execution with 0 retries, executed only once.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_handler(sleeping)
+        httpserver.expect_ordered_request(POWER_OPERATION_URI, method="PUT").respond_with_handler(sleeping)
         # message is not called.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json(err_msg, status=503)
+        httpserver.expect_ordered_request(POWER_OPERATION_URI, method="PUT").respond_with_json(err_msg, status=503)
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
         assert result.statusCode == 504
-        assert "[E40003]Timeout: Could not connect to server. operationID:[1]" in caplog.text
+        assert any(
+            "[E40003]Timeout: Could not connect to server. operationID:[1]" in record.getMessage()
+            for record in caplog.records
+        )
 
-    def test_common_retry_each_when_retry_on_status_and_failure(self, httpserver: HTTPServer, init_db_instance):
+    def test_common_retry_each_when_retry_on_status_and_failure(
+        self, httpserver: HTTPServer, procedure, hc, layout_config
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -788,45 +749,29 @@ class TestHarwareManageAPIBase:
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
 
         # A retry is initiated upon receiving an error response. During the process,
         # a retry-eligible response is received, but the retry continues according to the error retry settings.
         # arrange
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "dummy"}, status=500)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "retry0"}, status=500)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "retry1"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "retry2"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "retry3"}, status=500)
-        # retry is not performed because the max_count in the error retry settings is set to 4,
-        # whereas the target requires 5.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "retry3"}, status=500)
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        _expect_ordered_responses(
+            httpserver,
+            POWER_OPERATION_URI,
+            "PUT",
+            [
+                _json_response({"code": "ER005BAS001", "message": "dummy"}, 500),
+                _json_response({"code": "ER005BAS001", "message": "retry0"}, 500),
+                _json_response({"code": "ER005BAS001", "message": "retry1"}, 503),
+                _json_response({"code": "ER005BAS001", "message": "retry2"}, 503),
+                _json_response({"code": "ER005BAS001", "message": "retry3"}, 500),
+                # retry is not performed because the max_count in the error retry settings is set to 4,
+                # whereas the target requires 5.
+                _json_response({"code": "ER005BAS001", "message": "retry3"}, 500),
+            ],
         )
+
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
@@ -836,10 +781,9 @@ class TestHarwareManageAPIBase:
         assert result.status == "FAILED"
         assert result.statusCode == 500
 
-    def test_poweroff_can_request_to_poweroff_api(self, httpserver: HTTPServer, init_db_instance):
+    def test_poweroff_can_request_to_poweroff_api(self, httpserver: HTTPServer, hc, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOffAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -866,205 +810,161 @@ class TestHarwareManageAPIBase:
             }
         )
 
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
+        host = hc.host
+        port = hc.port
+        uri = hc.uri
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_data(
+            '{"type": "memory", "powerState": "Off"}', status=200
         )
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response='{"type": "memory", "powerState": "Off"}', status=200))
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-        index = result.uri.rfind("devices")
-        start_deviceid = result.uri[index + 8 : index + 12]
 
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
-        assert start_deviceid != "None"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-            result.uri,
-        )
+        assert result.uri == f"http://{host}:{port}/{uri}/devices/{targetDeviceID}/power"
         assert result.requestBody == {"action": "off"}
         assert result.queryParameter == ""
         assert result.responseBody == ""
         assert result.status == "COMPLETED"
         assert result.statusCode == 200
 
-    def test_connect_can_request_to_connect_api(self, httpserver: HTTPServer, init_db_instance):
+    @pytest.mark.parametrize(
+        "api_cls, action, api_config, device_power, extra_handlers, device_info_count",
+        [
+            pytest.param(
+                ConnectAPI,
+                "connect",
+                API_CONFIG,
+                {"powerState": "Off", "powerCapability": False},
+                [(POWER_OPERATION_URI, "PUT", EMPTY_OK_RESPONSE)],
+                1,
+                id="connect",
+            ),
+            pytest.param(
+                ConnectAPI,
+                "connect",
+                API_CONFIG,
+                {"powerState": "On", "powerCapability": True},
+                [
+                    (POWER_OPERATION_URI, "PUT", EMPTY_OK_RESPONSE),
+                    (
+                        OS_BOOT_URI,
+                        "GET",
+                        OS_BOOT_NOT_SUPPORTED_RESPONSE,
+                    ),
+                ],
+                2,
+                id="connect_when_powercapability_is_true",
+            ),
+            pytest.param(
+                DisconnectAPI,
+                "disconnect",
+                POWEROFF_API_CONFIG,
+                {"powerState": "Off", "powerCapability": False},
+                [],
+                1,
+                id="disconnect",
+            ),
+            pytest.param(
+                DisconnectAPI,
+                "disconnect",
+                POWEROFF_API_CONFIG,
+                {"powerState": "Off", "powerCapability": True},
+                [(POWER_OPERATION_URI, "PUT", EMPTY_OK_RESPONSE)],
+                2,
+                id="disconnect_when_powercapability_is_true",
+            ),
+        ],
+    )
+    def test_connect_disconnect_can_request_to_api(
+        self,
+        httpserver: HTTPServer,
+        hc,
+        layout_config,
+        api_cls,
+        action,
+        api_config,
+        device_power,
+        extra_handlers,
+        device_info_count,
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = ConnectAPI(
+        config = layout_config
+        api_obj: HarwareManageAPIBase = api_cls(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "api_config": copy.deepcopy(api_config),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "memory", "powerState": "Off", "powerCapability": False},
-            status=200,
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
+        host = hc.host
+        port = hc.port
+        uri = hc.uri
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_json(
+            {"type": "memory", **device_power},
+            status=200,
         )
+        for pattern, method, response in extra_handlers:
+            httpserver.expect_request(pattern, method=method).respond_with_response(response)
+        httpserver.expect_request(OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
 
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "connect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation=action, targetCPUID=hostCpuId, targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-
-        cpu_index = result.uri.rfind("cpu")
-        start_cpuid = result.uri[cpu_index + 4 : cpu_index + 8]
+        device_info_requests = [request for request, _ in httpserver.log if request.path == DEVICE_INFO_URI]
 
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
-        assert start_cpuid != "None"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-            result.uri,
-        )
-        assert result.requestBody == {"action": "connect", "deviceID": targetDeviceID}
+        assert result.uri == f"http://{host}:{port}/{uri}/cpu/{hostCpuId}/aggregations"
+        assert result.requestBody == {"action": action, "deviceID": targetDeviceID}
         assert result.queryParameter == ""
         assert result.responseBody == ""
         assert result.status == "COMPLETED"
         assert result.statusCode == 200
+        # The device type is retrieved once, even when the power is also operated.
+        assert len(device_info_requests) == device_info_count
 
-    def test_connect_becomes_failed_when_failed_to_get_device_info(self, httpserver: HTTPServer, init_db_instance):
+    def test_connect_becomes_failed_when_failed_to_get_device_info(self, httpserver: HTTPServer, hc, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = ConnectAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_json(
             {"code": "EF007BAS000", "message": "invalid request"},
             status=500,
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
+        httpserver.expect_request(OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
 
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "connect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="connect", targetCPUID=hostCpuId, targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == paylod.operationID
@@ -1076,190 +976,93 @@ class TestHarwareManageAPIBase:
         assert result.status == "FAILED"
         assert result.getInformation == {"responseBody": {"code": "EF007BAS000", "message": "invalid request"}}
 
-    def test_connect_can_request_when_powercapability_is_true(self, httpserver: HTTPServer, init_db_instance):
+    def test_connect_result_is_failed_when_failed_power_on_request_with_powercapability_true(
+        self, httpserver: HTTPServer, hc, layout_config
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = ConnectAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
+        host = hc.host
+        port = hc.port
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_json(
             {"type": "memory", "powerState": "On", "powerCapability": True},
             status=200,
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            {
-                "code": "EF003BAS010",
-                "message": "A request that is not supported was made for the specified device ID.",
-            },
-            status=400,
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_data(
+            '{"code":"CF001BAS000", "message":"Unexpected Error"}', status=500
         )
+        httpserver.expect_request(OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_response(OS_BOOT_NOT_SUPPORTED_RESPONSE)
 
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "connect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="connect", targetCPUID=hostCpuId, targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-
-        cpu_index = result.uri.rfind("cpu")
-        start_cpuid = result.uri[cpu_index + 4 : cpu_index + 8]
 
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
-        assert start_cpuid != "None"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-            result.uri,
-        )
-        assert result.requestBody == {"action": "connect", "deviceID": targetDeviceID}
+        assert result.requestBody == {"action": "on"}
         assert result.queryParameter == ""
-        assert result.responseBody == ""
-        assert result.status == "COMPLETED"
-        assert result.statusCode == 200
+        assert result.responseBody == {
+            "code": "CF001BAS000",
+            "message": "Unexpected Error",
+        }
+        assert result.status == "FAILED"
+        assert result.statusCode == 500
 
-    def test_connect_result_is_failed_when_failed_power_on_request_with_powercapability_true(
-        self, httpserver: HTTPServer, init_db_instance
+    def test_disconnect_becomes_failed_when_failed_power_off_request_with_powercapability_true(
+        self, httpserver: HTTPServer, hc, layout_config
     ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = ConnectAPI(
+        config = layout_config
+        api_obj: HarwareManageAPIBase = DisconnectAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "api_config": copy.deepcopy(POWEROFF_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
+        host = hc.host
+        port = hc.port
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "memory", "powerState": "On", "powerCapability": True},
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_json(
+            {"type": "memory", "powerState": "Off", "powerCapability": True},
             status=200,
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response(
-                '{"code":"CF001BAS000", "message":"Unexpected Error"}',
-                status=500,
-            )
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            {
-                "code": "EF003BAS010",
-                "message": "A request that is not supported was made for the specified device ID.",
-            },
-            status=400,
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_data(
+            '{"code":"CF001BAS000", "message":"Unexpected Error"}', status=500
         )
+        httpserver.expect_request(OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
 
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "connect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="disconnect", targetCPUID=hostCpuId, targetDeviceID=targetDeviceID
         )
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
-        assert result.requestBody == {"action": "on"}
+        assert result.requestBody == {"action": "off"}
         assert result.queryParameter == ""
         assert result.responseBody == {
             "code": "CF001BAS000",
@@ -1268,492 +1071,74 @@ class TestHarwareManageAPIBase:
         assert result.status == "FAILED"
         assert result.statusCode == 500
 
-    def test_disconnect_can_request_to_disconnect_api(self, httpserver: HTTPServer, init_db_instance):
+    def test_disconnect_becomes_failed_when_failed_to_get_device_info(self, httpserver: HTTPServer, hc, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = DisconnectAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                    "poweroff": {
-                        "retry": {
-                            "targets": [
-                                {
-                                    "status_code": 503,
-                                    "code": "ER005BAS001",
-                                    "interval": 2,
-                                    "max_count": 1,
-                                },
-                            ],
-                            "default": {
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        },
-                    },
-                },
+                "api_config": copy.deepcopy(POWEROFF_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
+        host = hc.host
+        port = hc.port
+        uri = hc.uri
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "memory", "powerState": "Off", "powerCapability": False},
-            status=200,
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_json(
+            {"code": "EF007BAS000", "message": "invalid request"},
+            status=500,
         )
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
 
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "disconnect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="disconnect", targetCPUID=hostCpuId, targetDeviceID=targetDeviceID
         )
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-
-        cpu_index = result.uri.rfind("cpu")
-        start_cpuid = result.uri[cpu_index + 4 : cpu_index + 8]
 
         # assert
-        assert result.operationID == 1
+        assert result.operationID == paylod.operationID
         assert result.method == "PUT"
-        assert start_cpuid != "None"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-            result.uri,
-        )
+        assert result.uri == f"http://{host}:{port}/{uri}/cpu/{hostCpuId}/aggregations"
         assert result.requestBody == {
             "action": "disconnect",
             "deviceID": targetDeviceID,
         }
         assert result.queryParameter == ""
         assert result.responseBody == ""
-        assert result.status == "COMPLETED"
+        assert result.status == "FAILED"
+        assert result.getInformation == {"responseBody": {"code": "EF007BAS000", "message": "invalid request"}}
         assert result.statusCode == 200
 
-    def test_disconnect_can_request_when_powercapability_is_true(self, httpserver: HTTPServer, init_db_instance):
+    def test_common_result_is_500_when_connect_failure_occurred(self, mocker, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = DisconnectAPI(
+        config = layout_config
+        api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                    "poweroff": {
-                        "retry": {
-                            "targets": [
-                                {
-                                    "status_code": 503,
-                                    "code": "ER005BAS001",
-                                    "interval": 2,
-                                    "max_count": 1,
-                                },
-                            ],
-                            "default": {
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        },
-                    },
-                },
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
+        mocker.patch.object(api_obj, "recent_request_uri", "http://10.000.111.111:8000/test")
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "memory", "powerState": "Off", "powerCapability": True},
-            status=200,
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
+        mocker.patch.object(api_obj, "_requests", side_effect=exceptions.ConnectionError())
 
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "disconnect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-        # act
-        execute_result = api_obj.execute(paylod)
-        result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-
-        cpu_index = result.uri.rfind("cpu")
-        start_cpuid = result.uri[cpu_index + 4 : cpu_index + 8]
-
-        # assert
-        assert result.operationID == 1
-        assert result.method == "PUT"
-        assert start_cpuid != "None"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-            result.uri,
-        )
-        assert result.requestBody == {
-            "action": "disconnect",
-            "deviceID": targetDeviceID,
-        }
-        assert result.queryParameter == ""
-        assert result.responseBody == ""
-        assert result.status == "COMPLETED"
-        assert result.statusCode == 200
-
-    def test_disconnect_becomes_failed_when_failed_power_off_request_with_powercapability_true(
-        self, httpserver: HTTPServer, init_db_instance
-    ):
-        # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = DisconnectAPI(
-            **{
-                "hardware_control_conf": config.hardware_control,
-                "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                    "poweroff": {
-                        "retry": {
-                            "targets": [
-                                {
-                                    "status_code": 503,
-                                    "code": "ER005BAS001",
-                                    "interval": 2,
-                                    "max_count": 1,
-                                },
-                            ],
-                            "default": {
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        },
-                    },
-                },
-                "logger_args": config.log_config,
-                "server_connection_conf": config.server_connection,
-            }
-        )
-
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "memory", "powerState": "Off", "powerCapability": True},
-            status=200,
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response(
-                '{"code":"CF001BAS000", "message":"Unexpected Error"}',
-                status=500,
-            )
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "disconnect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-        # act
-        execute_result = api_obj.execute(paylod)
-        result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-
-        # assert
-        assert result.operationID == 1
-        assert result.method == "PUT"
-        assert result.requestBody == {"action": "off"}
-        assert result.queryParameter == ""
-        assert result.responseBody == {
-            "code": "CF001BAS000",
-            "message": "Unexpected Error",
-        }
-        assert result.status == "FAILED"
-        assert result.statusCode == 500
-
-    def test_disconnect_becomes_failed_when_failed_to_get_device_info(self, httpserver: HTTPServer, init_db_instance):
-        # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = DisconnectAPI(
-            **{
-                "hardware_control_conf": config.hardware_control,
-                "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                    "poweroff": {
-                        "retry": {
-                            "targets": [
-                                {
-                                    "status_code": 503,
-                                    "code": "ER005BAS001",
-                                    "interval": 2,
-                                    "max_count": 1,
-                                },
-                            ],
-                            "default": {
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        },
-                    },
-                },
-                "logger_args": config.log_config,
-                "server_connection_conf": config.server_connection,
-            }
-        )
-
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"code": "EF007BAS000", "message": "invalid request"},
-            status=500,
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "disconnect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-        # act
-        execute_result = api_obj.execute(paylod)
-        result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-
-        cpu_index = result.uri.rfind("cpu")
-        start_cpuid = result.uri[cpu_index + 4 : cpu_index + 8]
-
-        # assert
-        assert result.operationID == paylod.operationID
-        assert result.method == "PUT"
-        assert start_cpuid != "None"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-            result.uri,
-        )
-        assert result.requestBody == {
-            "action": "disconnect",
-            "deviceID": targetDeviceID,
-        }
-        assert result.queryParameter == ""
-        assert result.responseBody == ""
-        assert result.status == "FAILED"
-        assert result.getInformation == {"responseBody": {"code": "EF007BAS000", "message": "invalid request"}}
-        assert result.statusCode == 200
-
-    def test_common_result_is_500_when_connect_failure_occurred(self, init_db_instance, mocker):
-        # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = PowerOnAPI(
-            **{
-                "hardware_control_conf": config.hardware_control,
-                "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
-                "logger_args": config.log_config,
-                "server_connection_conf": config.server_connection,
-            }
-        )
-
-        mocker.patch.object(api_obj, "recent_request_uri", "http://10.000.111.111:8000/test")
-
-        def _requests(self, payload):
-            raise exceptions.ConnectionError()
-
-        api_obj._requests = types.MethodType(_requests, api_obj)
-
-        #        mocker.patch("requests.put")
-        #        requests.put.side_effect = exceptions.ConnectionError()
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        #        mocker.patch("requests.put")
+        #        requests.put.side_effect = exceptions.ConnectionError()
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
@@ -1763,517 +1148,61 @@ class TestHarwareManageAPIBase:
 
         assert result.responseBody == {
             "code": "E40007",
-            "message": "Connection error occurred. Please check if the URL is correct. http://10.000.111.111:8000/test",
-            # "message": f"Connection error occurred. Please check if the URL is correct. http://localhost:48889/cdim/api/v1/devices/{targetDeviceID}/power",
-        }
-        assert result.status == "FAILED"
-        assert result.statusCode == 500
-
-    @pytest.mark.parametrize(
-        "test_response",
-        [
-            ('{"type": "STORAGE", "powerState": "PoweringOn", "powerCapability":true}'),
-            ('{"type": "MEMORY", "powerState": "PoweringOn", "powerCapability":true}'),
-        ],
-    )
-    def test_connect_failure_when_power_check_polling_exceeded(
-        self, httpserver: HTTPServer, capfd, test_response, init_db_instance, mocker, caplog
-    ):
-        # arrange
-        mocker.patch("logging.config.dictConfig")
-        logger = logging.getLogger("logger.py")
-        logger.handlers.clear()
-        logger.addHandler(caplog.handler)
-        logger.setLevel(logging.ERROR)
-
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = ConnectAPI(
-            **{
-                "hardware_control_conf": config.hardware_control,
-                "get_info_conf": {
-                    "host": "localhost",
-                    "port": 48889,
-                    "uri": "cdim/api/v1",
-                    "specs": {
-                        "poweroff": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "connect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "disconnect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "timeout": 10,
-                    },
-                },
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "isosboot": {
-                        "polling": {
-                            "count": 4,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
-                "logger_args": config.log_config,
-                "server_connection_conf": config.server_connection,
-            }
-        )
-
-        def polling_handler(request: Request):
-            print("[Assertion]Called GET API.")
-            return Response(response=test_response, status=200)
-
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            {
-                "code": "EF003BAS010",
-                "message": "A request that is not supported was made for the specified device ID.",
-            },
-            status=400,
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "connect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-
-        # act
-        result = api_obj.execute(paylod)
-
-        # assert
-        if '"powerState": "PoweringOn"' in test_response:
-            current_state = "PoweringOn"
-        else:
-            current_state = None
-        expected_body = {
-            "code": "E40029",
-            "message": "Power state did not change as expected after turning the power Off."
-            + f"deviceID: {targetDeviceID}, current: {current_state}, expect: Off",
-        }
-
-        assert result[0].responseBody == expected_body
-        # API is executed the number of times specified in the polling settings plus one additional time, including execution for determining the device type when the power is initially turned off.
-        out, _ = capfd.readouterr()
-        assert out.count("[Assertion]Called GET API.") == 4
-        # Error logs are being output.
-        assert "[E40029]Power state did not change as expected after turning the power On." in caplog.text
-
-    def test_connect_result_is_success_when_last_polling_attempt_succeeded(
-        self, httpserver: HTTPServer, capfd, init_db_instance, mocker, caplog
-    ):
-        # arrange
-        mocker.patch("logging.config.dictConfig")
-        logger = logging.getLogger("logger.py")
-        logger.handlers.clear()
-        logger.addHandler(caplog.handler)
-        logger.setLevel(logging.ERROR)
-
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = ConnectAPI(
-            **{
-                "hardware_control_conf": config.hardware_control,
-                "get_info_conf": {
-                    "host": "localhost",
-                    "port": 48889,
-                    "uri": "cdim/api/v1",
-                    "specs": {
-                        "poweroff": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "connect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "disconnect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "timeout": 10,
-                    },
-                },
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "isosboot": {
-                        "polling": {
-                            "count": 3,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
-                "logger_args": config.log_config,
-                "server_connection_conf": config.server_connection,
-            }
-        )
-
-        def polling_handler(request: Request):
-            print("[Assertion]Called GET API.")
-            response = '{"type": "MEMORY", "powerState": "PoweringOn", "powerCapability":true}'
-            return Response(
-                response=response,
-                status=200,
-            )
-
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-
-        # Retrieve device information before polling.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(
-            lambda res: Response(
-                response='{"type": "MEMORY", "powerState": "Off", "powerCapability": true}',
-                status=200,
-            )
-        )
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_response(Response("", status=200))
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            {
-                "code": "EF003BAS010",
-                "message": "A request that is not supported was made for the specified device ID.",
-            },
-            status=400,
-        )
-        # Polling started.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
-        # Succeeded on the third attempt.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_json({"type": "MEMORY", "powerState": "On", "powerCapability": True}, status=200)
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "connect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-        # act
-        result: Details = api_obj.execute(paylod)[ApiExecuteResultIdx.DETAIL]
-        # mockup returning a 204 status is called twice, as the polling succeeds on the third attempt.
-        out, _ = capfd.readouterr()
-
-        assert out.count("[Assertion]Called GET API.") == 2
-        # No error logs are being output.
-        assert "ERROR" not in caplog.text
-        assert result.status == "COMPLETED"
-
-    def test_disconnect_becomes_failed_when_failed_to_disconnect(self, httpserver: HTTPServer, capfd, init_db_instance):
-        # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = DisconnectAPI(
-            **{
-                "hardware_control_conf": config.hardware_control,
-                "get_info_conf": {
-                    "host": "localhost",
-                    "port": 48889,
-                    "uri": "cdim/api/v1",
-                    "specs": {
-                        "poweroff": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "connect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "disconnect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "timeout": 10,
-                    },
-                },
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "poweroff": {
-                        "retry": {
-                            "targets": [
-                                {
-                                    "status_code": 503,
-                                    "code": "ER005BAS001",
-                                    "interval": 2,
-                                    "max_count": 1,
-                                },
-                            ],
-                            "default": {
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        },
-                    },
-                },
-                "logger_args": config.log_config,
-                "server_connection_conf": config.server_connection,
-            }
-        )
-
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response('{"type":"MEMORY","powerCapability": true}', status=200))
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response(
-                '{"code": "EF004BAS002","message": "The FM failed to disconnect."}',
-                status=500,
-            )
-        )
-
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "disconnect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-
-        # act
-        result: Details = api_obj.execute(paylod)[ApiExecuteResultIdx.DETAIL]
-
-        assert result.method == "PUT"
-        assert result.operationID == paylod.operationID
-        assert result.status == "FAILED"
-        assert result.statusCode == 500
-        assert result.queryParameter == ""
-        assert result.responseBody == {
-            "code": "EF004BAS002",
-            "message": "The FM failed to disconnect.",
-        }
-        assert result.requestBody == {
-            "action": "disconnect",
-            "deviceID": targetDeviceID,
-        }
-
-    @pytest.mark.parametrize(
-        "test_response",
-        [
-            ('{"type": "STORAGE", "powerState": "PoweringOff", "powerCapability":true}'),
-            ('{"type": "MEMORY", "powerState": "PoweringOff", "powerCapability":true}'),
-        ],
-    )
-    def test_disconnect_failure_when_power_check_polling_exceeded(
-        self, httpserver: HTTPServer, capfd, test_response, init_db_instance, mocker, caplog
-    ):
-        # arrange
-        mocker.patch("logging.config.dictConfig")
-        logger = logging.getLogger("logger.py")
-        logger.handlers.clear()
-        logger.addHandler(caplog.handler)
-        logger.setLevel(logging.ERROR)
-
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = DisconnectAPI(
-            **{
-                "hardware_control_conf": config.hardware_control,
-                "get_info_conf": {
-                    "host": "localhost",
-                    "port": 48889,
-                    "uri": "cdim/api/v1",
-                    "specs": {
-                        "poweroff": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "connect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "disconnect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "timeout": 10,
-                    },
-                },
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "poweroff": {
-                        "retry": {
-                            "targets": [
-                                {
-                                    "status_code": 503,
-                                    "code": "ER005BAS001",
-                                    "interval": 2,
-                                    "max_count": 1,
-                                },
-                            ],
-                            "default": {
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        },
-                    },
-                },
+            "message": "Connection error occurred. Please check if the URL is correct. http://10.000.111.111:8000/test",
+            # "message": f"Connection error occurred. Please check if the URL is correct. http://localhost:48889/cdim/api/v1/devices/{targetDeviceID}/power",
+        }
+        assert result.status == "FAILED"
+        assert result.statusCode == 500
+
+    @pytest.mark.parametrize(
+        "test_response",
+        [
+            ('{"type": "STORAGE", "powerState": "PoweringOn", "powerCapability":true}'),
+            ('{"type": "MEMORY", "powerState": "PoweringOn", "powerCapability":true}'),
+        ],
+    )
+    def test_connect_failure_when_power_check_polling_exceeded(
+        self, httpserver: HTTPServer, test_response, mocker, caplog, hc, layout_config
+    ):
+        # arrange
+        mocker.patch("logging.config.dictConfig")
+        logger = logging.getLogger("logger.py")
+        logger.handlers.clear()
+        logger.addHandler(caplog.handler)
+        logger.setLevel(logging.ERROR)
+
+        config = layout_config
+        api_obj: HarwareManageAPIBase = ConnectAPI(
+            **{
+                "hardware_control_conf": config.hardware_control,
+                "get_info_conf": copy.deepcopy(POLLING_GET_INFO_CONF),
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
+        polling_requests: list[Request] = []
+
         def polling_handler(request: Request):
-            print("[Assertion]Called GET API.")
+            polling_requests.append(request)
             return Response(response=test_response, status=200)
 
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_handler(polling_handler)
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_response(OS_BOOT_NOT_SUPPORTED_RESPONSE)
+        httpserver.expect_request(OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
 
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "disconnect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="connect", targetCPUID=hostCpuId, targetDeviceID=targetDeviceID)
 
         # act
         result = api_obj.execute(paylod)
 
         # assert
-        if '"powerState": "PoweringOff"' in test_response:
-            current_state = "PoweringOff"
+        if '"powerState": "PoweringOn"' in test_response:
+            current_state = "PoweringOn"
         else:
             current_state = None
         expected_body = {
@@ -2284,13 +1213,12 @@ class TestHarwareManageAPIBase:
 
         assert result[0].responseBody == expected_body
         # API is executed the number of times specified in the polling settings plus one additional time, including execution for determining the device type when the power is initially turned off.
-        out, _ = capfd.readouterr()
-        assert out.count("[Assertion]Called GET API.") == 5
+        assert len(polling_requests) == 4
         # Error logs are being output.
-        assert "[E40029]Power state did not change as expected after turning the power Off." in caplog.text
+        assert "[E40029]Power state did not change as expected after turning the power On." in caplog.text
 
-    def test_disconnect_result_is_success_when_last_polling_attempt_succeeded(
-        self, httpserver: HTTPServer, capfd, init_db_instance, mocker, caplog
+    def test_connect_result_is_success_when_last_polling_attempt_succeeded(
+        self, httpserver: HTTPServer, mocker, caplog, hc, layout_config
     ):
         # arrange
         mocker.patch("logging.config.dictConfig")
@@ -2299,37 +1227,11 @@ class TestHarwareManageAPIBase:
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = DisconnectAPI(
+        config = layout_config
+        api_obj: HarwareManageAPIBase = ConnectAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
-                "get_info_conf": {
-                    "host": "localhost",
-                    "port": 48889,
-                    "uri": "cdim/api/v1",
-                    "specs": {
-                        "poweroff": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "connect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "disconnect": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "timeout": 10,
-                    },
-                },
+                "get_info_conf": copy.deepcopy(POLLING_GET_INFO_CONF),
                 "api_config": {
                     "retry": {
                         "targets": [
@@ -2345,21 +1247,16 @@ class TestHarwareManageAPIBase:
                             "max_count": 1,
                         },
                     },
-                    "poweroff": {
-                        "retry": {
-                            "targets": [
-                                {
-                                    "status_code": 503,
-                                    "code": "ER005BAS001",
-                                    "interval": 2,
-                                    "max_count": 1,
-                                },
+                    "isosboot": {
+                        "polling": {
+                            "count": 3,
+                            "interval": 1,
+                            "skip": [
+                                {"status_code": 400, "code": "EF003BAS010"},
                             ],
-                            "default": {
-                                "interval": 2,
-                                "max_count": 1,
-                            },
                         },
+                        "request": {"timeout": 2},
+                        "timeout": 10,
                     },
                 },
                 "logger_args": config.log_config,
@@ -2367,620 +1264,343 @@ class TestHarwareManageAPIBase:
             }
         )
 
-        def polling_handler(request: Request):
-            print("[Assertion]Called GET API.")
-            response = '{"type": "MEMORY", "powerState": "PoweringOff", "powerCapability":true}'
-            return Response(
-                response=response,
-                status=200,
-            )
-
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-
-        # Retrieve device information before polling.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(
-            lambda res: Response(
-                response='{"type": "MEMORY", "powerState": "On", "powerCapability": true}',
-                status=200,
-            )
-        )
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_response(Response("", status=200))
-        # get device type
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_json({"type": "MEMORY"}, status=200)
-        # Polling started.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
-        # Succeeded on the third attempt.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_json({"type": "MEMORY", "powerState": "Off", "powerCapability": True}, status=200)
-
-        hostCpuId = str(uuid4())
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "disconnect",
-                "targetCPUID": hostCpuId,
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        polling_requests: list[Request] = []
 
+        def polling_handler(request: Request):
+            polling_requests.append(request)
+            return MEMORY_POWERING_ON_RESPONSE
+
+        _expect_ordered_sequence(
+            httpserver,
+            [
+                # Retrieve device information before polling.
+                (
+                    DEVICE_INFO_URI,
+                    "GET",
+                    MEMORY_POWERED_OFF_RESPONSE,
+                ),
+                (POWER_OPERATION_URI, "PUT", EMPTY_OK_RESPONSE),
+                (OS_BOOT_URI, "GET", OS_BOOT_NOT_SUPPORTED_RESPONSE),
+                # Polling started.
+                (DEVICE_INFO_URI, "GET", polling_handler),
+                (DEVICE_INFO_URI, "GET", polling_handler),
+                # Succeeded on the third attempt.
+                (
+                    DEVICE_INFO_URI,
+                    "GET",
+                    MEMORY_POWERED_ON_RESPONSE,
+                ),
+                (OPERATION_URI, "PUT", EMPTY_OK_RESPONSE),
+            ],
+        )
+
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="connect", targetCPUID=hostCpuId, targetDeviceID=targetDeviceID)
         # act
         result: Details = api_obj.execute(paylod)[ApiExecuteResultIdx.DETAIL]
-
         # mockup returning a 204 status is called twice, as the polling succeeds on the third attempt.
-        out, _ = capfd.readouterr()
-        assert out.count("[Assertion]Called GET API.") == 2
+        assert len(polling_requests) == 2
         # No error logs are being output.
         assert "ERROR" not in caplog.text
         assert result.status == "COMPLETED"
 
-    def test_common_no_failure_when_raw_code_returned_on_abnormal_exit(self, httpserver: HTTPServer, init_db_instance):
+    def test_disconnect_becomes_failed_when_failed_to_disconnect(self, httpserver: HTTPServer, hc, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = PowerOnAPI(
+        config = layout_config
+        api_obj: HarwareManageAPIBase = DisconnectAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
-                "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "get_info_conf": copy.deepcopy(POLLING_GET_INFO_CONF),
+                "api_config": copy.deepcopy(RETRY_POWEROFF_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_data(
-            "NG",
-            status=502,
-        )
-        # Retry on error occurrence.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_data(
-            "NG",
-            status=502,
+
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_data(
+            '{"type":"MEMORY","powerCapability": true}', status=200
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            {"status": True, "IPAddress": "192.168.122.11"}, status=200
+        httpserver.expect_request(OPERATION_URI, method="PUT").respond_with_data(
+            '{"code": "EF004BAS002","message": "The FM failed to disconnect."}', status=500
         )
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="disconnect", targetCPUID=hostCpuId, targetDeviceID=targetDeviceID
         )
+
         # act
-        execute_result = api_obj.execute(paylod)
-        result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
+        result: Details = api_obj.execute(paylod)[ApiExecuteResultIdx.DETAIL]
 
-        # assert
-        assert result.responseBody == "NG"
-        assert result.statusCode == 502
+        assert result.method == "PUT"
+        assert result.operationID == paylod.operationID
+        assert result.status == "FAILED"
+        assert result.statusCode == 500
+        assert result.queryParameter == ""
+        assert result.responseBody == {
+            "code": "EF004BAS002",
+            "message": "The FM failed to disconnect.",
+        }
+        assert result.requestBody == {
+            "action": "disconnect",
+            "deviceID": targetDeviceID,
+        }
 
-    def test_common_result_is_500_when_unexpected_failure_occurred(self, mocker, init_db_instance):
+    @pytest.mark.parametrize(
+        "test_response",
+        [
+            ('{"type": "STORAGE", "powerState": "PoweringOff", "powerCapability":true}'),
+            ('{"type": "MEMORY", "powerState": "PoweringOff", "powerCapability":true}'),
+        ],
+    )
+    def test_disconnect_failure_when_power_check_polling_exceeded(
+        self, httpserver: HTTPServer, test_response, mocker, caplog, hc, layout_config
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = PowerOnAPI(
+        mocker.patch("logging.config.dictConfig")
+        logger = logging.getLogger("logger.py")
+        logger.handlers.clear()
+        logger.addHandler(caplog.handler)
+        logger.setLevel(logging.ERROR)
+
+        config = layout_config
+        api_obj: HarwareManageAPIBase = DisconnectAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
-                "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "get_info_conf": copy.deepcopy(POLLING_GET_INFO_CONF),
+                "api_config": copy.deepcopy(RETRY_POWEROFF_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        def _requests(self, payload):
-            raise exceptions.TooManyRedirects()
+        polling_requests: list[Request] = []
+
+        def polling_handler(request: Request):
+            polling_requests.append(request)
+            return Response(response=test_response, status=200)
 
-        api_obj._requests = types.MethodType(_requests, api_obj)
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_handler(polling_handler)
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="disconnect", targetCPUID=hostCpuId, targetDeviceID=targetDeviceID
         )
+
         # act
-        execute_result = api_obj.execute(paylod)
-        result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
+        result = api_obj.execute(paylod)
 
         # assert
-        assert result.operationID == 1
-        assert result.status == "FAILED"
-        assert result.statusCode == 500
+        if '"powerState": "PoweringOff"' in test_response:
+            current_state = "PoweringOff"
+        else:
+            current_state = None
+        expected_body = {
+            "code": "E40029",
+            "message": "Power state did not change as expected after turning the power Off."
+            + f"deviceID: {targetDeviceID}, current: {current_state}, expect: Off",
+        }
 
-    def test_common_log_to_stdout_when_failed_to_initialize_log(
-        self, mocker, capfd, httpserver: HTTPServer, init_db_instance
+        assert result[0].responseBody == expected_body
+        # API is executed the number of times specified in the polling settings plus one additional time
+        # for the device type, which the power-off reuses instead of retrieving it again.
+        assert len(polling_requests) == 4
+        # Error logs are being output.
+        assert "[E40029]Power state did not change as expected after turning the power Off." in caplog.text
+
+    def test_disconnect_result_is_success_when_last_polling_attempt_succeeded(
+        self, httpserver: HTTPServer, mocker, caplog, hc, layout_config
     ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = PowerOnAPI(
+        mocker.patch("logging.config.dictConfig")
+        logger = logging.getLogger("logger.py")
+        logger.handlers.clear()
+        logger.addHandler(caplog.handler)
+        logger.setLevel(logging.ERROR)
+
+        config = layout_config
+        api_obj: HarwareManageAPIBase = DisconnectAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
-                "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "get_info_conf": copy.deepcopy(POLLING_GET_INFO_CONF),
+                "api_config": copy.deepcopy(RETRY_POWEROFF_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
-        # Logger some error occurred during initialization.
-        mocker.patch.object(
-            Logger, "__init__", side_effect=Exception("Internal server error. Failed in log initialization")
-        )
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            {"status": True, "IPAddress": "192.168.122.11"}, status=200
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
+        polling_requests: list[Request] = []
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        def polling_handler(request: Request):
+            polling_requests.append(request)
+            return MEMORY_POWERING_OFF_RESPONSE
+
+        _expect_ordered_sequence(
+            httpserver,
+            [
+                (OPERATION_URI, "PUT", EMPTY_OK_RESPONSE),
+                # Retrieve device information before polling.
+                (
+                    DEVICE_INFO_URI,
+                    "GET",
+                    MEMORY_POWERED_ON_RESPONSE,
+                ),
+                (POWER_OPERATION_URI, "PUT", EMPTY_OK_RESPONSE),
+                # Polling started; the power-off reuses the device type retrieved above.
+                (DEVICE_INFO_URI, "GET", polling_handler),
+                (DEVICE_INFO_URI, "GET", polling_handler),
+                # Succeeded on the third attempt.
+                (
+                    DEVICE_INFO_URI,
+                    "GET",
+                    MEMORY_POWERED_OFF_RESPONSE,
+                ),
+            ],
+        )
+
+        hostCpuId = TEST_CPU_ID
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="disconnect", targetCPUID=hostCpuId, targetDeviceID=targetDeviceID
         )
+
         # act
-        execute_result = api_obj.execute(paylod)
-        result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
+        result: Details = api_obj.execute(paylod)[ApiExecuteResultIdx.DETAIL]
 
-        # assert
-        assert result.operationID == 1
-        assert result.method == "PUT"
-        assert result.requestBody == {"action": "on"}
-        assert result.queryParameter == ""
-        assert result.responseBody == ""
+        # mockup returning a 204 status is called twice, as the polling succeeds on the third attempt.
+        assert len(polling_requests) == 2
+        # No error logs are being output.
+        assert "ERROR" not in caplog.text
         assert result.status == "COMPLETED"
-        assert result.statusCode == 200
-
-        out, err = capfd.readouterr()
-        # Info-level log messages are being output to standard output.
-        assert "Start request." in out
-        assert "Request completed." in out
 
-    @pytest.mark.parametrize(
-        "retry_targets",
-        [
-            # no message
-            [{"status_code": 503, "max_count": 2, "interval": 1}],
-            # no status
-            [{"code": "ER005BAS001", "max_count": 2, "interval": 1}],
-            # no status, no message
-            [{"max_count": 2, "interval": 1}],
-        ],
-    )
-    def test_common_no_retry_when_invalid_retry_setting(self, httpserver: HTTPServer, retry_targets, init_db_instance):
+    def test_common_no_failure_when_raw_code_returned_on_abnormal_exit(
+        self, httpserver: HTTPServer, procedure, hc, layout_config
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": retry_targets,
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            {"status": True, "IPAddress": "192.168.122.11"}, status=200
-        )
-        # First execution.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json(
-            {"code": "ER005BAS001", "message": "Duplicate Requests CPU"},
-            status=503,
-        )
-        # Execution with retry on error.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json(
-            {"code": "ER005BAS001", "message": "Duplicate Requests CPU"},
-            status=503,
+        httpserver.expect_ordered_request(POWER_OPERATION_URI, method="PUT").respond_with_data(
+            "NG",
+            status=502,
         )
-        # message is not called.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "retry2", "message": "Something Error."}, status=500)
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
+        # Retry on error occurrence.
+        httpserver.expect_ordered_request(POWER_OPERATION_URI, method="PUT").respond_with_data(
+            "NG",
+            status=502,
         )
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_response(OS_BOOT_COMPLETED_RESPONSE)
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
-        assert result.operationID == 1
-        assert result.method == "PUT"
-        assert result.requestBody == {"action": "on"}
-        assert result.queryParameter == ""
-        assert result.responseBody == {
-            "code": "ER005BAS001",
-            "message": "Duplicate Requests CPU",
-        }
-        assert result.status == "FAILED"
-        assert result.statusCode == 503
+        assert result.responseBody == "NG"
+        assert result.statusCode == 502
 
-    def test_poweron_becomes_failed_when_failed_os_check_after_execution(
-        self, httpserver: HTTPServer, init_db_instance
-    ):
+    def test_common_result_is_500_when_unexpected_failure_occurred(self, mocker, procedure, layout_config):
         # arrange
-        is_os_boot_status_code = 500
-        is_os_boot_response = {"code": "Exxxxx", "message": "something error"}
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            is_os_boot_response, status=is_os_boot_status_code
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
+        mocker.patch.object(api_obj, "_requests", side_effect=exceptions.TooManyRedirects())
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
-        assert_boot_uri = ApiUri.POWERON_API.format(
-            config.hardware_control.get("host"),
-            config.hardware_control.get("port"),
-            config.hardware_control.get("uri"),
-            targetDeviceID,
-        )
         assert result.operationID == 1
-        assert result.method == "PUT"
-        assert result.requestBody == {"action": "on"}
-        assert result.queryParameter == ""
-        assert result.responseBody == ""
         assert result.status == "FAILED"
-        assert result.uri == assert_boot_uri
-        assert result.statusCode == 200
-        assert_is_os_boot_uri = ApiUri.ISOSBOOT_API.format(
-            config.hardware_control.get("host"),
-            config.hardware_control.get("port"),
-            config.hardware_control.get("uri"),
-            targetDeviceID,
-        )
-        assert result.isOSBoot == {
-            "uri": assert_is_os_boot_uri,
-            "queryParameter": {"timeOut": 2},
-            "method": "GET",
-            "statusCode": is_os_boot_status_code,
-            "responseBody": is_os_boot_response,
-        }
+        assert result.statusCode == 500
 
-    def test_poweron_becomes_completed_when_success_os_check_after_execution(
-        self, httpserver: HTTPServer, init_db_instance
+    def test_common_log_to_stdout_when_failed_to_initialize_log(
+        self, mocker, capfd, httpserver: HTTPServer, procedure, hc, layout_config
     ):
         # arrange
-        is_os_boot_status_code = 200
-        is_os_boot_response = {
-            "status": True,
-            "IpAddress": "xxx.xxx.xxx.xxx",
-        }
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
+        # Logger some error occurred during initialization.
+        mocker.patch.object(
+            Logger, "__init__", side_effect=Exception("Internal server error. Failed in log initialization")
         )
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            is_os_boot_response, status=is_os_boot_status_code
-        )
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_response(OS_BOOT_COMPLETED_RESPONSE)
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
-        assert_boot_uri = ApiUri.POWERON_API.format(
-            config.hardware_control.get("host"),
-            config.hardware_control.get("port"),
-            config.hardware_control.get("uri"),
-            targetDeviceID,
-        )
         assert result.operationID == 1
         assert result.method == "PUT"
         assert result.requestBody == {"action": "on"}
         assert result.queryParameter == ""
         assert result.responseBody == ""
         assert result.status == "COMPLETED"
-        assert result.uri == assert_boot_uri
         assert result.statusCode == 200
-        assert_is_os_boot_uri = ApiUri.ISOSBOOT_API.format(
-            config.hardware_control.get("host"),
-            config.hardware_control.get("port"),
-            config.hardware_control.get("uri"),
-            targetDeviceID,
-        )
-        assert result.isOSBoot == {
-            "uri": assert_is_os_boot_uri,
-            "queryParameter": {"timeOut": 2},
-            "method": "GET",
-            "statusCode": is_os_boot_status_code,
-            "responseBody": is_os_boot_response,
-        }
 
-    def test_poweron_os_boot_check_api_not_executed_when_failed(self, httpserver: HTTPServer, init_db_instance):
+        out, err = capfd.readouterr()
+        # Info-level log messages are being output to standard output.
+        assert "Start request." in out
+        assert "Request completed." in out
+
+    @pytest.mark.parametrize(
+        "retry_targets",
+        [
+            # no message
+            [{"status_code": 503, "max_count": 2, "interval": 1}],
+            # no status
+            [{"code": "ER005BAS001", "max_count": 2, "interval": 1}],
+            # no status, no message
+            [{"max_count": 2, "interval": 1}],
+        ],
+    )
+    def test_common_no_retry_when_invalid_retry_setting(
+        self, httpserver: HTTPServer, retry_targets, procedure, hc, layout_config
+    ):
         # arrange
-        is_os_boot_status_code = 200
-        is_os_boot_response = {"status": True, "IpAddress": "xxx.xxx.xxx.xxx"}
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
                 "api_config": {
                     "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 5,
-                                "max_count": 5,
-                            },
-                        ],
+                        "targets": retry_targets,
                         "default": {
                             "interval": 2,
-                            "max_count": 2,
+                            "max_count": 1,
                         },
                     },
                     "timeout": 10,
@@ -3000,146 +1620,123 @@ class TestHarwareManageAPIBase:
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=500)
-        )
-        # Not being called.
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
-            is_os_boot_response, status=is_os_boot_status_code
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_response(OS_BOOT_COMPLETED_RESPONSE)
+        _expect_ordered_responses(
+            httpserver,
+            POWER_OPERATION_URI,
+            "PUT",
+            [
+                # First execution.
+                DUPLICATE_REQUEST_RESPONSE,
+                # Execution with retry on error.
+                DUPLICATE_REQUEST_RESPONSE,
+                # message is not called.
+                _json_response({"code": "retry2", "message": "Something Error."}, 500),
+            ],
         )
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
         # act
-        execute_result = api_obj.execute(paylod)
+        execute_result = api_obj.execute(procedure)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
-        assert_boot_uri = ApiUri.POWERON_API.format(
-            config.hardware_control.get("host"),
-            config.hardware_control.get("port"),
-            config.hardware_control.get("uri"),
-            targetDeviceID,
-        )
         assert result.operationID == 1
         assert result.method == "PUT"
         assert result.requestBody == {"action": "on"}
         assert result.queryParameter == ""
-        assert result.responseBody == ""
+        assert result.responseBody == {
+            "code": "ER005BAS001",
+            "message": "Duplicate requests CPU",
+        }
         assert result.status == "FAILED"
-        assert result.uri == assert_boot_uri
-        assert result.statusCode == 500
-        assert result.isOSBoot == ""
+        assert result.statusCode == 503
 
-    def test_poweron_becomes_completed_when_skipped_status_code_on_os_check(
-        self, httpserver: HTTPServer, init_db_instance
-    ):
-        # arrange
-        is_os_boot_status_code = 400
-        is_os_boot_response = {
-            "code": "EF003BAS010",
-            "message": "A non-existent CPU device was specified.",
-        }
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = PowerOnAPI(
-            **{
-                "hardware_control_conf": config.hardware_control,
-                "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 5,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 10,
-                    },
-                },
+    @pytest.mark.parametrize(
+        "power_on_response, is_os_boot_status_code, is_os_boot_response, expected_status, expected_status_code, "
+        "is_os_boot_recorded",
+        [
+            # The OS boot check fails after the power-on.
+            (EMPTY_OK_RESPONSE, 500, {"code": "Exxxxx", "message": "something error"}, "FAILED", 200, True),
+            # The OS boot check succeeds after the power-on.
+            (EMPTY_OK_RESPONSE, 200, {"status": True, "IpAddress": "xxx.xxx.xxx.xxx"}, "COMPLETED", 200, True),
+            # The OS boot check is not executed when the power-on fails.
+            (EMPTY_ERROR_RESPONSE, 200, {"status": True, "IpAddress": "xxx.xxx.xxx.xxx"}, "FAILED", 500, False),
+            # The OS boot check is skipped for the status code and code in the skip settings.
+            (
+                EMPTY_OK_RESPONSE,
+                400,
+                {"code": "EF003BAS010", "message": "A non-existent CPU device was specified."},
+                "COMPLETED",
+                200,
+                False,
+            ),
+        ],
+        ids=["os_check_failed", "os_check_succeeded", "poweron_failed", "os_check_skipped"],
+    )
+    def test_poweron_result_depends_on_os_check_after_execution(
+        self,
+        httpserver: HTTPServer,
+        power_on_response,
+        is_os_boot_status_code,
+        is_os_boot_response,
+        expected_status,
+        expected_status_code,
+        is_os_boot_recorded,
+        hc,
+        poweron_uri,
+        layout_config,
+    ):
+        # arrange
+        config = layout_config
+        api_obj: HarwareManageAPIBase = PowerOnAPI(
+            **{
+                "hardware_control_conf": config.hardware_control,
+                "get_info_conf": config.get_information,
+                "api_config": copy.deepcopy(API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(power_on_response)
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_json(
             is_os_boot_response, status=is_os_boot_status_code
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
-        assert_boot_uri = ApiUri.POWERON_API.format(
-            config.hardware_control.get("host"),
-            config.hardware_control.get("port"),
-            config.hardware_control.get("uri"),
-            targetDeviceID,
-        )
         assert result.operationID == 1
         assert result.method == "PUT"
         assert result.requestBody == {"action": "on"}
         assert result.queryParameter == ""
         assert result.responseBody == ""
-        assert result.status == "COMPLETED"
-        assert result.uri == assert_boot_uri
-        assert result.statusCode == 200
-        assert result.isOSBoot == ""
+        assert result.status == expected_status
+        assert result.uri == poweron_uri(targetDeviceID)
+        assert result.statusCode == expected_status_code
+        if is_os_boot_recorded:
+            assert result.isOSBoot == {
+                "uri": ApiUri.ISOSBOOT_API.format(hc.host, hc.port, hc.uri, targetDeviceID),
+                "queryParameter": {"timeOut": 2},
+                "method": "GET",
+                "statusCode": is_os_boot_status_code,
+                "responseBody": is_os_boot_response,
+            }
+        else:
+            assert result.isOSBoot == ""
+        if power_on_response.status_code != 200:
+            # The OS boot check API is not called.
+            assert all(request.path != OS_BOOT_URI for request, _ in httpserver.log)
 
-    def test_isosboot_os_boot_check_api_settings_applied(self, httpserver: HTTPServer, init_db_instance):
+    def test_isosboot_os_boot_check_api_settings_applied(self, httpserver: HTTPServer, hc, layout_config):
         # arrange
         # act
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -3177,9 +1774,9 @@ class TestHarwareManageAPIBase:
             }
         )
         # assert
-        assert api_obj.host == config.hardware_control.get("host")
-        assert api_obj.port == config.hardware_control.get("port")
-        assert api_obj.uri == config.hardware_control.get("uri")
+        assert api_obj.host == hc.host
+        assert api_obj.port == hc.port
+        assert api_obj.uri == hc.uri
         assert api_obj.polling_interval == 60
         assert api_obj.polling_count == 100
         assert api_obj.skip_status_codes == [400]
@@ -3187,8 +1784,7 @@ class TestHarwareManageAPIBase:
 
         # arrange
         # act
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -3235,8 +1831,7 @@ class TestHarwareManageAPIBase:
 
         # arrange
         # act
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -3277,11 +1872,10 @@ class TestHarwareManageAPIBase:
         assert api_obj.skip_status_codes == []
 
     def test_isosboot_not_added_to_query_params_when_no_request_timeout_setting(
-        self, httpserver: HTTPServer, init_db_instance
+        self, httpserver: HTTPServer, procedure, hc, layout_config
     ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -3323,29 +1917,16 @@ class TestHarwareManageAPIBase:
             assert request.query_string == b""
             return Response('{"status": true, "IPAddress": "192.168.122.11"}', status=200)
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_handler(
-            assert_query
-        )
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_handler(assert_query)
 
         # act
-        _ = api_obj.execute(paylod)
+        _ = api_obj.execute(procedure)
 
     def test_isosboot_added_to_query_params_when_with_request_timeout_setting(
-        self, httpserver: HTTPServer, init_db_instance
+        self, httpserver: HTTPServer, procedure, hc, layout_config
     ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -3387,25 +1968,13 @@ class TestHarwareManageAPIBase:
             assert request.query_string == b"timeOut=2"
             return Response('{"status":true,"IPAddress": "192.168.122.11"}', status=200)
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_handler(
-            assert_query
-        )
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_handler(assert_query)
 
         # act
-        _ = api_obj.execute(paylod)
+        _ = api_obj.execute(procedure)
 
     def test_isosboot_failure_when_polling_exceeded_limit(
-        self, httpserver: HTTPServer, capfd, init_db_instance, mocker, caplog
+        self, httpserver: HTTPServer, mocker, caplog, hc, layout_config
     ):
         # arrange
         mocker.patch("logging.config.dictConfig")
@@ -3414,63 +1983,27 @@ class TestHarwareManageAPIBase:
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 3,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 200,
-                    },
-                },
+                "api_config": copy.deepcopy(ISOSBOOT_POLLING_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
+        polling_requests: list[Request] = []
+
         def polling_handler(request: Request):
-            print("[Assertion]Called IS OS API.")
-            return Response('{"status": false, "IPAddress": "192.168.122.11"}', status=200)
+            polling_requests.append(request)
+            return OS_BOOT_IN_PROGRESS_RESPONSE
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_handler(
-            polling_handler
-        )
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_handler(polling_handler)
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, targetDeviceID=targetDeviceID)
 
         # act
         result = api_obj.execute(paylod)
@@ -3484,14 +2017,42 @@ class TestHarwareManageAPIBase:
         assert result.statusCode == 200
 
         # API is being executed the number of times specified in the polling settings.
-        out, _ = capfd.readouterr()
-        assert out.count("[Assertion]Called IS OS API.") == 3
+        assert len(polling_requests) == 3
         # Error logs are being output.
         assert "[E40021]Confirmed OS boot failure." in caplog.text
         assert "[E40032]The operating system failed to boot after turning the power on." in caplog.text
 
+    def test_isosboot_polling_interval_backoff_when_backoff_set(
+        self, httpserver: HTTPServer, api_sleep, hc, layout_config
+    ):
+        # arrange
+        config = layout_config
+        api_config = copy.deepcopy(ISOSBOOT_POLLING_API_CONFIG)
+        api_config["isosboot"]["polling"]["count"] = 4
+        api_config["isosboot"]["polling"]["backoff"] = {"base": 2, "cap": 3, "jitter": "none"}
+        api_obj: HarwareManageAPIBase = IsOSBootAPI(
+            **{
+                "hardware_control_conf": config.hardware_control,
+                "get_info_conf": config.get_information,
+                "api_config": api_config,
+                "logger_args": config.log_config,
+                "server_connection_conf": config.server_connection,
+            }
+        )
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_data(
+            '{"status": false, "IPAddress": "192.168.122.11"}', status=200
+        )
+
+        # act
+        result = api_obj.execute(replace(PROCEDURE_TEMPLATE, targetDeviceID=TEST_DEVICE_ID))
+
+        # assert
+        assert result.responseBody["code"] == "E40032"
+        # the interval is doubled for each poll and is clamped to the cap, with no wait after the last poll.
+        assert [call.args[0] for call in api_sleep.call_args_list] == [1, 2, 3]
+
     def test_isosboot_result_is_success_when_last_polling_attempt_succeeded(
-        self, httpserver: HTTPServer, capfd, init_db_instance, mocker, caplog
+        self, httpserver: HTTPServer, mocker, caplog, procedure, hc, layout_config
     ):
         # arrange
         mocker.patch("logging.config.dictConfig")
@@ -3500,8 +2061,7 @@ class TestHarwareManageAPIBase:
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -3539,106 +2099,52 @@ class TestHarwareManageAPIBase:
             }
         )
 
+        polling_requests: list[Request] = []
+
         def polling_handler(request: Request):
-            print("[Assertion]Called IS OS API.")
-            return Response('{"status":false,"IPAddress": "192.168.122.11"}', status=200)
+            polling_requests.append(request)
+            return OS_BOOT_IN_PROGRESS_RESPONSE
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_handler(
-            polling_handler
-        )
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_handler(
-            polling_handler
-        )
+        httpserver.expect_ordered_request(OS_BOOT_URI, method="GET").respond_with_handler(polling_handler)
+        httpserver.expect_ordered_request(OS_BOOT_URI, method="GET").respond_with_handler(polling_handler)
         # Succeeded on the third attempt.
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_response(
-            Response('{"status":true,"IPAddress": "192.168.122.11"}', status=200)
-        )
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        httpserver.expect_ordered_request(OS_BOOT_URI, method="GET").respond_with_data(
+            '{"status":true,"IPAddress": "192.168.122.11"}', status=200
         )
 
         # act
-        result: IsOsBoot = api_obj.execute(paylod)
+        result: IsOsBoot = api_obj.execute(procedure)
 
         # mockup returning a 204 status is called twice, as the polling succeeds on the third attempt.
-        out, _ = capfd.readouterr()
-        assert out.count("[Assertion]Called IS OS API.") == 2
+        assert len(polling_requests) == 2
         # No error logs are being output.
         assert "ERROR" not in caplog.text
         assert result.statusCode == 200
 
-    def test_isosboot_no_polling_when_skipped_status_code_returned(
-        self, httpserver: HTTPServer, capfd, init_db_instance
-    ):
+    def test_isosboot_no_polling_when_skipped_status_code_returned(self, httpserver: HTTPServer, hc, layout_config):
         is_os_boot_status_code = 400
         is_os_boot_response = {
             "code": "EF003BAS010",
             "message": "A non-existent CPU device was specified.",
         }
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 3,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 200,
-                    },
-                },
+                "api_config": copy.deepcopy(ISOSBOOT_POLLING_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_ordered_request(OS_BOOT_URI, method="GET").respond_with_json(
             is_os_boot_response, status=is_os_boot_status_code
         )
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-
     def test_isosboot_failure_when_no_status_in_response_body(
-        self, httpserver: HTTPServer, capfd, init_db_instance, mocker, caplog
+        self, httpserver: HTTPServer, mocker, caplog, procedure, hc, layout_config
     ):
         is_os_boot_status_code = 200
         is_os_boot_response = {
@@ -3651,62 +2157,23 @@ class TestHarwareManageAPIBase:
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 3,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 200,
-                    },
-                },
+                "api_config": copy.deepcopy(ISOSBOOT_POLLING_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_ordered_request(OS_BOOT_URI, method="GET").respond_with_json(
             is_os_boot_response, status=is_os_boot_status_code
         )
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-
         # act
-        result: IsOsBoot = api_obj.execute(paylod)
+        result: IsOsBoot = api_obj.execute(procedure)
 
         assert "ERROR" in caplog.text
         assert "status" not in result.responseBody
@@ -3714,7 +2181,7 @@ class TestHarwareManageAPIBase:
         assert result.statusCode == 200
 
     def test_isosboot_failure_when_response_code_is_500(
-        self, httpserver: HTTPServer, capfd, init_db_instance, mocker, caplog
+        self, httpserver: HTTPServer, mocker, caplog, procedure, hc, layout_config
     ):
         is_os_boot_status_code = 200
         is_os_boot_response = {
@@ -3727,62 +2194,23 @@ class TestHarwareManageAPIBase:
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 3,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 200,
-                    },
-                },
+                "api_config": copy.deepcopy(ISOSBOOT_POLLING_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_ordered_request(OS_BOOT_URI, method="GET").respond_with_json(
             is_os_boot_response, status=is_os_boot_status_code
         )
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-
         # act
-        result: IsOsBoot = api_obj.execute(paylod)
+        result: IsOsBoot = api_obj.execute(procedure)
 
         assert "ERROR" in caplog.text
         assert "status" not in result.responseBody
@@ -3790,7 +2218,7 @@ class TestHarwareManageAPIBase:
         assert result.statusCode == 200
 
     def test_isosboot_failure_when_status_not_bool_in_response(
-        self, httpserver: HTTPServer, capfd, init_db_instance, mocker, caplog
+        self, httpserver: HTTPServer, mocker, caplog, procedure, hc, layout_config
     ):
         is_os_boot_status_code = 200
         is_os_boot_response = {
@@ -3804,62 +2232,23 @@ class TestHarwareManageAPIBase:
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = IsOSBootAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                    "timeout": 10,
-                    "isosboot": {
-                        "polling": {
-                            "count": 3,
-                            "interval": 1,
-                            "skip": [
-                                {"status_code": 400, "code": "EF003BAS010"},
-                            ],
-                        },
-                        "request": {"timeout": 2},
-                        "timeout": 200,
-                    },
-                },
+                "api_config": copy.deepcopy(ISOSBOOT_POLLING_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_ordered_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_ordered_request(OS_BOOT_URI, method="GET").respond_with_json(
             is_os_boot_response, status=is_os_boot_status_code
         )
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-
         # act
-        result: IsOsBoot = api_obj.execute(paylod)
+        result: IsOsBoot = api_obj.execute(procedure)
 
         assert "ERROR" in caplog.text
         assert "status" in result.responseBody
@@ -3868,7 +2257,7 @@ class TestHarwareManageAPIBase:
         assert result.statusCode == 200
 
     def test_poweron_becomes_failed_when_non_skipped_failure_code_on_os_check(
-        self, httpserver: HTTPServer, init_db_instance
+        self, httpserver: HTTPServer, poweron_uri, layout_config
     ):
         # arrange
         is_os_boot_status_code = 400
@@ -3876,8 +2265,7 @@ class TestHarwareManageAPIBase:
             "code": "EF003BAS010",
             "message": "A non-existent CPU device was specified.",
         }
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -3914,41 +2302,21 @@ class TestHarwareManageAPIBase:
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_json(
             is_os_boot_response, status=is_os_boot_status_code
         )
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
-        assert_boot_uri = ApiUri.POWERON_API.format(
-            config.hardware_control.get("host"),
-            config.hardware_control.get("port"),
-            config.hardware_control.get("uri"),
-            targetDeviceID,
-        )
+        assert_boot_uri = poweron_uri(targetDeviceID)
         assert result.operationID == 1
         assert result.method == "PUT"
         assert result.requestBody == {"action": "on"}
@@ -3958,15 +2326,14 @@ class TestHarwareManageAPIBase:
         assert result.uri == assert_boot_uri
 
     def test_poweron_becomes_failed_when_no_status_in_response_on_os_check(
-        self, httpserver: HTTPServer, init_db_instance
+        self, httpserver: HTTPServer, poweron_uri, layout_config
     ):
         # arrange
         is_os_boot_status_code = 200
         is_os_boot_response = {
             "IPAddress": "xxxx.xxxx.xxxx.xxx",
         }
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOnAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -4003,114 +2370,60 @@ class TestHarwareManageAPIBase:
                 "server_connection_conf": config.server_connection,
             }
         )
-        uri = config.hardware_control.get("uri")
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OS_BOOT_URI, method="GET").respond_with_json(
             is_os_boot_response, status=is_os_boot_status_code
         )
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
-            {"type": "CPU"}, status=200
-        )
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "boot",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
-        assert_boot_uri = ApiUri.POWERON_API.format(
-            config.hardware_control.get("host"),
-            config.hardware_control.get("port"),
-            config.hardware_control.get("uri"),
-            targetDeviceID,
-        )
+        assert_boot_uri = poweron_uri(targetDeviceID)
         assert result.operationID == 1
         assert result.method == "PUT"
-        assert result.requestBody == {"action": "on"}
-        assert result.queryParameter == ""
-        assert result.responseBody == ""
-        assert result.status == "FAILED"
-        assert result.uri == assert_boot_uri
-
-    def test_poweroff_can_receive_failure_result_when_abnormal_exit(self, httpserver: HTTPServer, init_db_instance):
-        # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
-        api_obj: HarwareManageAPIBase = PowerOffAPI(
-            **{
-                "hardware_control_conf": config.hardware_control,
-                "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                },
+        assert result.requestBody == {"action": "on"}
+        assert result.queryParameter == ""
+        assert result.responseBody == ""
+        assert result.status == "FAILED"
+        assert result.uri == assert_boot_uri
+
+    def test_poweroff_can_receive_failure_result_when_abnormal_exit(self, httpserver: HTTPServer, hc, layout_config):
+        # arrange
+        config = layout_config
+        api_obj: HarwareManageAPIBase = PowerOffAPI(
+            **{
+                "hardware_control_conf": config.hardware_control,
+                "get_info_conf": config.get_information,
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=500)
+        host = hc.host
+        port = hc.port
+        uri = hc.uri
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_ERROR_RESPONSE)
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_data(
+            '{"type": "CPU", "powerState": "Off"}', status=200
         )
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response='{"type": "CPU", "powerState": "Off"}', status=200))
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-
-        index = result.uri.rfind("devices")
-        start_deviceid = result.uri[index + 8 : index + 12]
 
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
-        assert start_deviceid != "None"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-            result.uri,
-        )
+        assert result.uri == f"http://{host}:{port}/{uri}/devices/{targetDeviceID}/power"
         assert result.requestBody == {"action": "off"}
         assert result.queryParameter == ""
         assert result.responseBody == ""
@@ -4125,7 +2438,7 @@ class TestHarwareManageAPIBase:
         ],
     )
     def test_poweroff_failure_when_power_status_polling_exceeded(
-        self, httpserver: HTTPServer, capfd, test_response, init_db_instance, mocker, caplog
+        self, httpserver: HTTPServer, test_response, mocker, caplog, api_sleep, hc, layout_config
     ):
         # arrange
         mocker.patch("logging.config.dictConfig")
@@ -4134,80 +2447,28 @@ class TestHarwareManageAPIBase:
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.DEBUG)
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOffAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
-                "get_info_conf": {
-                    "host": "localhost",
-                    "port": 48889,
-                    "uri": "cdim/api/v1",
-                    "specs": {
-                        "poweroff": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "connect": {
-                            "polling": {
-                                "count": 15,
-                                "interval": 6,
-                            },
-                        },
-                        "disconnect": {
-                            "polling": {
-                                "count": 15,
-                                "interval": 6,
-                            },
-                        },
-                        "timeout": 10,
-                    },
-                },
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                },
+                "get_info_conf": copy.deepcopy(POWEROFF_POLLING_GET_INFO_CONF),
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
+        polling_requests: list[Request] = []
+
         def polling_handler(request: Request):
-            print("[Assertion]Called IS GET API.")
+            polling_requests.append(request)
             return Response(response=test_response, status=200)
 
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_handler(polling_handler)
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
 
         # act
         result = api_obj.execute(paylod)
@@ -4225,14 +2486,60 @@ class TestHarwareManageAPIBase:
 
         assert result[0].responseBody == expected_body
         # API is executed the number of times specified in the polling settings plus one additional time, including execution for determining the device type when the power is initially turned off.
-        out, _ = capfd.readouterr()
-        assert out.count("[Assertion]Called IS GET API.") == 4
+        assert len(polling_requests) == 4
+        # The polling interval is waited between attempts, but not after the last one.
+        assert api_sleep.call_args_list == [mocker.call(1)] * 2
 
         # Error logs are being output.
         assert "[E40029]Power state did not change as expected after turning the power Off." in caplog.text
 
+    @pytest.mark.parametrize(
+        "backoff, expected_sleeps",
+        [
+            # the interval is multiplied by the base for each poll and is clamped to the cap.
+            ({"base": 2, "cap": 5}, [2, 4, 5]),
+            # a base of 1 keeps the configured interval.
+            ({"base": 1}, [2, 2, 2]),
+            # with full jitter, a random value between 0 and the backoff interval is used.
+            ({"base": 2, "cap": 5, "jitter": "full"}, [1.0, 2.0, 2.5]),
+        ],
+    )
+    def test_poweroff_polling_interval_backoff_when_backoff_set(
+        self, httpserver: HTTPServer, mocker, api_sleep, backoff, expected_sleeps, hc, layout_config
+    ):
+        # arrange
+        mock_random = mocker.patch("layoutapply.apiclient.random")
+        mock_random.uniform.side_effect = lambda low, high: (low + high) / 2
+        config = layout_config
+        get_info_conf = copy.deepcopy(POWEROFF_POLLING_GET_INFO_CONF)
+        get_info_conf["specs"]["poweroff"]["polling"] = {
+            "count": 4,
+            "interval": 2,
+            "backoff": {"base": 1.3, "cap": 240, "jitter": "none", **backoff},
+        }
+        api_obj: HarwareManageAPIBase = PowerOffAPI(
+            **{
+                "hardware_control_conf": config.hardware_control,
+                "get_info_conf": get_info_conf,
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
+                "logger_args": config.log_config,
+                "server_connection_conf": config.server_connection,
+            }
+        )
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_data(
+            '{"type": "CPU", "powerState": "PoweringOff"}', status=200
+        )
+
+        # act
+        result = api_obj.execute(replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=TEST_DEVICE_ID))
+
+        # assert
+        assert result[0].responseBody["code"] == "E40029"
+        assert [call.args[0] for call in api_sleep.call_args_list] == expected_sleeps
+
     def test_poweroff_result_is_success_when_last_power_status_polling_succeeded(
-        self, httpserver: HTTPServer, capfd, init_db_instance, mocker, caplog, docker_services
+        self, httpserver: HTTPServer, mocker, caplog, hc, layout_config
     ):
         # arrange
         mocker.patch("logging.config.dictConfig")
@@ -4241,165 +2548,110 @@ class TestHarwareManageAPIBase:
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOffAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
-                "get_info_conf": {
-                    "host": "localhost",
-                    "port": 48889,
-                    "uri": "cdim/api/v1",
-                    "specs": {
-                        "poweroff": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "connect": {
-                            "polling": {
-                                "count": 15,
-                                "interval": 6,
-                            },
-                        },
-                        "disconnect": {
-                            "polling": {
-                                "count": 15,
-                                "interval": 6,
-                            },
-                        },
-                        "timeout": 10,
-                    },
-                },
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                },
+                "get_info_conf": copy.deepcopy(POWEROFF_POLLING_GET_INFO_CONF),
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
+        polling_requests: list[Request] = []
+
         def polling_handler(request: Request):
-            print("[Assertion]Called IS GET API.")
-            return Response(response='{"type": "CPU", "powerState": "PoweringOff"}', status=200)
-
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-        # During the execution of the poweroff API.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"message": "success case"}, status=200)
-        # Checking the power status.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
-        # Succeeded on the third attempt.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response='{"type": "CPU", "powerState": "Off"}', status=200))
+            polling_requests.append(request)
+            return CPU_POWERING_OFF_RESPONSE
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        _expect_ordered_sequence(
+            httpserver,
+            [
+                # During the execution of the poweroff API.
+                (POWER_OPERATION_URI, "PUT", Response('{"message": "success case"}', status=200)),
+                # Checking the power status.
+                (DEVICE_INFO_URI, "GET", polling_handler),
+                (DEVICE_INFO_URI, "GET", polling_handler),
+                # Succeeded on the third attempt.
+                (DEVICE_INFO_URI, "GET", CPU_POWERED_OFF_RESPONSE),
+            ],
         )
 
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
+
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
 
-        httpserver.clear()
         # mock returning "PoweringOff" is called twice (since it succeeds on the third polling attempt).
-        out, _ = capfd.readouterr()
-        assert out.count("[Assertion]Called IS GET API.") == 2
+        assert len(polling_requests) == 2
         # No error logs are being output.
         assert "ERROR" not in caplog.text
         assert result.statusCode == 200
 
-    def test_deviceinfo_failure_log_output_when_non_200_response_for_device_info(
-        self, httpserver: HTTPServer, capfd, init_db_instance
+    def test_poweroff_polling_not_waited_when_power_state_is_off_on_first_attempt(
+        self, httpserver: HTTPServer, api_sleep, hc, layout_config
     ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOffAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
-                "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                },
+                "get_info_conf": copy.deepcopy(POWEROFF_POLLING_GET_INFO_CONF),
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
-
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_data(
+            '{"type": "CPU", "powerState": "Off"}', status=200
         )
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response='{"type": "CPU", "powerState": "Off"}', status=500))
 
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
+        # act
+        result = api_obj.execute(replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=TEST_DEVICE_ID))
+
+        # assert
+        assert result[ApiExecuteResultIdx.DETAIL].statusCode == 200
+        # Device type check and a single polling attempt.
+        assert len([request for request, _ in httpserver.log if request.path == DEVICE_INFO_URI]) == 2
+        api_sleep.assert_not_called()
+
+    def test_deviceinfo_failure_log_output_when_non_200_response_for_device_info(
+        self, httpserver: HTTPServer, hc, layout_config
+    ):
+        # arrange
+        config = layout_config
+        api_obj: HarwareManageAPIBase = PowerOffAPI(
             **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
+                "hardware_control_conf": config.hardware_control,
+                "get_info_conf": config.get_information,
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
+                "logger_args": config.log_config,
+                "server_connection_conf": config.server_connection,
             }
         )
+
+        host = hc.host
+        port = hc.port
+        uri = hc.uri
+        httpserver.expect_request(POWER_OPERATION_URI, method="PUT").respond_with_response(EMPTY_OK_RESPONSE)
+        httpserver.expect_request(DEVICE_INFO_URI, method="GET").respond_with_data(
+            '{"type": "CPU", "powerState": "Off"}', status=500
+        )
+
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-            result.uri,
-        )
+        assert result.uri == f"http://{host}:{port}/{uri}/devices/{targetDeviceID}/power"
         assert result.requestBody == {"action": "off"}
         assert result.queryParameter == ""
         assert result.responseBody is None
@@ -4407,106 +2659,54 @@ class TestHarwareManageAPIBase:
         assert result.statusCode == 500
 
     def test_deviceinfo_failure_when_failure_during_device_info_polling(
-        self, httpserver: HTTPServer, capfd, init_db_instance
+        self, httpserver: HTTPServer, hc, layout_config
     ):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOffAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
-                "get_info_conf": {
-                    "host": "localhost",
-                    "port": 48889,
-                    "uri": "cdim/api/v1",
-                    "specs": {
-                        "poweroff": {
-                            "polling": {
-                                "count": 3,
-                                "interval": 1,
-                            },
-                        },
-                        "connect": {
-                            "polling": {
-                                "count": 15,
-                                "interval": 6,
-                            },
-                        },
-                        "disconnect": {
-                            "polling": {
-                                "count": 15,
-                                "interval": 6,
-                            },
-                        },
-                        "timeout": 10,
-                    },
-                },
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                },
+                "get_info_conf": copy.deepcopy(POWEROFF_POLLING_GET_INFO_CONF),
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
+        polling_requests: list[Request] = []
+
         def polling_handler(request: Request):
-            print("[Assertion]Called IS GET API.")
-            return Response(response='{"type": "CPU", "powerState": "PoweringOff"}', status=200)
-
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-        # During the execution of the poweroff API.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_response(Response("", status=200))
-        # Checking the power status.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_handler(polling_handler)
-        # Power state validation error.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response='{"type": "CPU", "powerState": "dummy"}', status=200))
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
+            polling_requests.append(request)
+            return CPU_POWERING_OFF_RESPONSE
+
+        _expect_ordered_sequence(
+            httpserver,
+            [
+                # During the execution of the poweroff API.
+                (POWER_OPERATION_URI, "PUT", EMPTY_OK_RESPONSE),
+                # Checking the power status.
+                (DEVICE_INFO_URI, "GET", polling_handler),
+                # Power state validation error.
+                (DEVICE_INFO_URI, "GET", Response('{"type": "CPU", "powerState": "dummy"}', status=200)),
+            ],
+        )
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
 
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
         # mock returning "PoweringOff" is called twice
         # (since it encounters an error on the second polling attempt, it is effectively called once successfully).
-        out, _ = capfd.readouterr()
-        assert out.count("[Assertion]Called IS GET API.") == 1
+        assert len(polling_requests) == 1
         # poweroff API succeeded and returned a 200 status code,
         # but the process failed due to an error in concluding device information retrieval, resulting in a FAILED state.
         assert result.statusCode == 200
         assert result.status == "FAILED"
 
-    def test_poweroff_poweroff_can_retry_by_settings(self, httpserver: HTTPServer, init_db_instance):
+    def test_poweroff_poweroff_can_retry_by_settings(self, httpserver: HTTPServer, hc, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = PowerOffAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
@@ -4532,53 +2732,38 @@ class TestHarwareManageAPIBase:
             }
         )
 
-        host = config.hardware_control.get("host")
-        port = config.hardware_control.get("port")
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
+        host = hc.host
+        port = hc.port
+        uri = hc.uri
         # While executing the device information retrieval API in the power-off device type branching.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "1st take"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"code": "ER005BAS001", "message": "retry 1st"}, status=503)
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json({"message": "success case"}, status=200)
+        _expect_ordered_responses(
+            httpserver,
+            POWER_OPERATION_URI,
+            "PUT",
+            [
+                _json_response({"code": "ER005BAS001", "message": "1st take"}, 503),
+                _json_response({"code": "ER005BAS001", "message": "retry 1st"}, 503),
+                _json_response({"message": "success case"}, 200),
+            ],
+        )
         # Checking the power status.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response='{"type": "CPU", "powerState": "Off"}', status=200))
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response='{"type": "CPU", "powerState": "Off"}', status=200))
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        _expect_ordered_responses(
+            httpserver,
+            DEVICE_INFO_URI,
+            "GET",
+            [CPU_POWERED_OFF_RESPONSE] * 2,
         )
+
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
-
-        index = result.uri.rfind("devices")
-        start_deviceid = result.uri[index + 8 : index + 12]
 
         # assert
         assert result.operationID == 1
         assert result.method == "PUT"
-        assert start_deviceid != "None"
-        assert re.fullmatch(
-            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-            result.uri,
-        )
+        assert result.uri == f"http://{host}:{port}/{uri}/devices/{targetDeviceID}/power"
         assert result.requestBody == {"action": "off"}
         assert result.queryParameter == ""
         assert result.responseBody == {"message": "success case"}
@@ -4586,189 +2771,114 @@ class TestHarwareManageAPIBase:
         assert result.statusCode == 200
         assert result.getInformation.get("responseBody") == {"powerState": "Off"}
 
-    @pytest.mark.parametrize(
-        "test_response",
-        [
-            ('{"type": "cpu", "powerState": "Off"}'),
-            ('{"type": "Cpu", "powerState": "Off"}'),
-            ('{"type": "CPU", "powerState": "Off"}'),
-        ],
-    )
-    def test_deviceinfo_success_when_device_info_case_mixed(
-        self, httpserver: HTTPServer, test_response, init_db_instance
-    ):
+    def test_deviceinfo_success_when_device_info_case_mixed(self, httpserver: HTTPServer, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = GetDeviceInformationAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                },
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response=test_response, status=200))
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        test_responses = [
+            '{"type": "cpu", "powerState": "Off"}',
+            '{"type": "Cpu", "powerState": "Off"}',
+            '{"type": "CPU", "powerState": "Off"}',
+        ]
+        _expect_ordered_responses(
+            httpserver,
+            DEVICE_INFO_URI,
+            "GET",
+            [Response(response=test_response, status=200) for test_response in test_responses],
         )
-        # act
-        result = api_obj.execute(paylod)
 
-        # assert
-        assert result["code"] == 200
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
+        for test_response in test_responses:
+            # act
+            result = api_obj.execute(paylod)
 
-    @pytest.mark.parametrize(
-        "test_response",
-        [
-            ('{"type": "Accelerator", "powerState": "Off"}'),
-            ('{"type": "DSP", "powerState": "Off"}'),
-            ('{"type": "FPGA", "powerState": "Off"}'),
-            ('{"type": "GPU", "powerState": "Off"}'),
-            ('{"type": "UnknownProcessor", "powerState": "Off"}'),
-            ('{"type": "memory", "powerState": "Off"}'),
-            ('{"type": "storage", "powerState": "Off"}'),
-            ('{"type": "networkInterface", "powerState": "Off"}'),
-            ('{"type": "graphicController", "powerState": "Off"}'),
-            ('{"type": "virtualMedia", "powerState": "Off"}'),
-            ('{"type": "switch", "powerState": "Off"}'),
-        ],
-    )
-    def test_deviceinfo_success_when_previous_device_info_value(
-        self, httpserver: HTTPServer, test_response, init_db_instance
-    ):
+            # assert
+            assert result["code"] == 200, test_response
+
+    def test_deviceinfo_success_when_previous_device_info_value(self, httpserver: HTTPServer, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = GetDeviceInformationAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                },
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response=test_response, status=200))
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
-        )
-        # act
-        result = api_obj.execute(paylod)
-
-        # assert
-        assert result["code"] == 200
-
-    @pytest.mark.parametrize(
-        "test_response",
-        [
-            ("test"),
-            ('{"powerState": "Off"}'),
-            ('{"type": "", "powerState": "Off"}'),
-            ('{"type": "error", "powerState": "Off"}'),
-        ],
-    )
-    def test_deviceinfo_failure_when_invalid_device_info_value(
-        self, httpserver: HTTPServer, test_response, init_db_instance
-    ):
+        test_responses = [
+            '{"type": "Accelerator", "powerState": "Off"}',
+            '{"type": "DSP", "powerState": "Off"}',
+            '{"type": "FPGA", "powerState": "Off"}',
+            '{"type": "GPU", "powerState": "Off"}',
+            '{"type": "UnknownProcessor", "powerState": "Off"}',
+            '{"type": "memory", "powerState": "Off"}',
+            '{"type": "storage", "powerState": "Off"}',
+            '{"type": "networkInterface", "powerState": "Off"}',
+            '{"type": "graphicController", "powerState": "Off"}',
+            '{"type": "virtualMedia", "powerState": "Off"}',
+            '{"type": "switch", "powerState": "Off"}',
+        ]
+        # One API object and one registration serve every response in turn.
+        _expect_ordered_responses(
+            httpserver,
+            DEVICE_INFO_URI,
+            "GET",
+            [Response(response=test_response, status=200) for test_response in test_responses],
+        )
+
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
+        for test_response in test_responses:
+            # act
+            result = api_obj.execute(paylod)
+
+            # assert
+            assert result["code"] == 200, test_response
+
+    def test_deviceinfo_failure_when_invalid_device_info_value(self, httpserver: HTTPServer, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         api_obj: HarwareManageAPIBase = GetDeviceInformationAPI(
             **{
                 "hardware_control_conf": config.hardware_control,
                 "get_info_conf": config.get_information,
-                "api_config": {
-                    "retry": {
-                        "targets": [
-                            {
-                                "status_code": 503,
-                                "code": "ER005BAS001",
-                                "interval": 2,
-                                "max_count": 1,
-                            },
-                        ],
-                        "default": {
-                            "interval": 2,
-                            "max_count": 1,
-                        },
-                    },
-                },
+                "api_config": copy.deepcopy(RETRY_API_CONFIG),
                 "logger_args": config.log_config,
                 "server_connection_conf": config.server_connection,
             }
         )
 
-        get_information_uri = config.get_information.get("uri")
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(Response(response=test_response, status=200))
-
-        targetDeviceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "shutdown",
-                "targetDeviceID": targetDeviceID,
-                "dependencies": [],
-            }
+        test_responses = [
+            "test",
+            '{"powerState": "Off"}',
+            '{"type": "", "powerState": "Off"}',
+            '{"type": "error", "powerState": "Off"}',
+        ]
+        _expect_ordered_responses(
+            httpserver,
+            DEVICE_INFO_URI,
+            "GET",
+            [Response(response=test_response, status=200) for test_response in test_responses],
         )
 
-        # act
-        result = api_obj.execute(paylod)
+        targetDeviceID = TEST_DEVICE_ID
+        paylod = replace(PROCEDURE_TEMPLATE, operation="shutdown", targetDeviceID=targetDeviceID)
+        for test_response in test_responses:
+            # act
+            result = api_obj.execute(paylod)
 
-        # assert
-        assert result["code"] == 400
+            # assert
+            assert result["code"] == 400, test_response
@@ -42,13 +42,12 @@ from layoutapply.main import run
 from layoutapply.setting import LayoutApplyConfig, LayoutApplyLogConfig
 from layoutapply.util import create_randomname
 from tests.layoutapply.conftest import (
-    DEVICE_INFO_URL,
+    DEVICE_INFO_PATTERN,
     EXTENDED_PROCEDURE_URI,
-    GET_INFORMATION_URI,
     HARDWARE_CONTROL_URI,
-    OPERATION_URL,
-    OS_BOOT_URL,
-    POWER_OPERATION_URL,
+    OPERATION_PATTERN,
+    OS_BOOT_PATTERN,
+    POWER_OPERATION_PATTERN,
     WORKFLOW_MANAGER_PORT,
 )
 from tests.layoutapply.test_data import checkvalid, procedure, sql
@@ -197,6 +196,9 @@ LOG_BASE_CONFIG = {
 }
 
 SELECT_SQL = "SELECT * FROM applystatus WHERE applyid = %s"
+# Messages expected at the start of stderr.
+INVALID_PROCEDURE_ERROR_REGEX = re.compile(r"^\[E40001\]")
+CONFIG_LOAD_ERROR_REGEX = re.compile(r"^\[E40002\]Failed to load layoutapply_config.yaml.")
 
 get_list_assert_target = {
     "count": 9,
@@ -294,15 +296,19 @@ get_list_assert_target = {
 
 @pytest.fixture
 def get_list_assert_target_no_fields():
-    # Create a deep copy to avoid modifying the original data.
-    no_fields_target = copy.deepcopy(get_list_assert_target)
-
-    # Delete the procedures of the IN_PROGRESS entry.
-    for result_dict in no_fields_target["applyResults"]:
-        if result_dict.get("status") == "IN_PROGRESS" and "procedures" in result_dict:
-            del result_dict["procedures"]
-
-    return no_fields_target
+    # Copy each entry without the procedures of the IN_PROGRESS entry.
+    # The tests only replace top-level values such as applyID, so a copy of each entry is enough.
+    return {
+        "count": get_list_assert_target["count"],
+        "applyResults": [
+            {
+                key: value
+                for key, value in result_dict.items()
+                if not (result_dict.get("status") == "IN_PROGRESS" and key == "procedures")
+            }
+            for result_dict in get_list_assert_target["applyResults"]
+        ],
+    }
 
 
 get_list_assert_target_default = {
@@ -415,13 +421,9 @@ class TestApplyCli:
         return id_list
 
     @pytest.mark.usefixtures("hardwaremgr_fixture", "extended_procedure_fixture")
-    def test_cmd_apply_success_when_migration_step_with_rel_path(self, capfd, mocker, init_db_instance, get_applyID):
-        # Ensure no active data exists before the test
-        with init_db_instance.cursor(cursor_factory=DictCursor) as cursor:
-            cursor.execute(query="UPDATE applystatus SET status = 'TEST_PROG' WHERE status = 'IN_PROGRESS'")
-            cursor.execute(query="UPDATE applystatus SET status = 'TEST_CANC' WHERE status = 'CANCELING'")
-            cursor.execute(query="UPDATE applystatus SET status = 'TEST_SUSPEND' WHERE status = 'SUSPENDED'")
-            init_db_instance.commit()
+    def test_cmd_apply_success_when_migration_step_with_rel_path(
+        self, capfd, mocker, init_db_instance, get_applyID, layout_config
+    ):
         # arrange
         mocker.patch("layoutapply.db.create_randomname", return_value=get_applyID)
 
@@ -436,8 +438,7 @@ class TestApplyCli:
                 rel_path = os.path.relpath(arg_procedure, os.getcwd())
                 sys.argv = ["cli.py", "request", "-p", rel_path]
 
-                config = LayoutApplyConfig()
-                config.load_log_configs()
+                config = copy.deepcopy(layout_config)
                 config.workflow_manager["host"] = "localhost"
                 # act
                 procces_mock = mocker.patch(
@@ -470,7 +471,8 @@ class TestApplyCli:
                     if row.get("status") == "IN_PROGRESS":
                         assert row.get("status") == "IN_PROGRESS"
                         for _ in range(15):
-                            sleep(2)
+                            # Returns as soon as the apply process exits, so the status is read without a fixed wait.
+                            procces_mock.return_value.join(2)
                             try:
                                 cursor.execute(query=f"SELECT * FROM applystatus WHERE applyid = '{id_}'")
                                 init_db_instance.commit()
@@ -495,10 +497,13 @@ class TestApplyCli:
                 host = config.hardware_control.get("host")
                 port = config.hardware_control.get("port")
                 uri = config.hardware_control.get("uri")
+                # The URI prefixes do not depend on the procedure, so they are built once per pattern.
+                hardware_control_uri = f"http://{host}:{port}/{uri}"
+                extended_procedure_uri = f"http://{host}:{WORKFLOW_MANAGER_PORT}/{uri}/{EXTENDED_PROCEDURE_URI}"
+                # Index the result details by operationID to look up the one for each migration procedure
+                details_by_operation_id = {detail["operationID"]: detail for detail in details}
                 for proc in procedures["procedures"]:
-                    # Search for items corresponding to the migration procedure from
-                    # result details using operationID as a condition
-                    detail = [i for i in details if i["operationID"] == proc["operationID"]][0]
+                    detail = details_by_operation_id[proc["operationID"]]
                     assert proc["operationID"] == detail["operationID"]
                     assert "COMPLETED" == detail["status"]
                     # Check the URI, etc. of the hardware control API
@@ -506,10 +511,7 @@ class TestApplyCli:
                     # Review the mockup method with hardwaremgr_fixture as well
                     match proc["operation"]:
                         case "connect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
-                            )
+                            assert detail["uri"] == f"{hardware_control_uri}/cpu/{proc['targetCPUID']}/aggregations"
                             assert "PUT" == detail["method"]
                             assert "queryParameter" not in detail
                             assert detail["requestBody"] == {
@@ -519,10 +521,7 @@ class TestApplyCli:
                             assert 200 == detail["statusCode"]
 
                         case "disconnect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
-                            )
+                            assert detail["uri"] == f"{hardware_control_uri}/cpu/{proc['targetCPUID']}/aggregations"
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {
                                 "action": "disconnect",
@@ -532,18 +531,15 @@ class TestApplyCli:
                             assert 200 == detail["statusCode"]
 
                         case "boot":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
-                            )
+                            assert detail["uri"] == f"{hardware_control_uri}/devices/{proc['targetDeviceID']}/power"
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {"action": "on"}
                             assert "queryParameter" not in detail
                             assert 200 == detail["statusCode"]
                             is_os_boot_detail = detail["isOSBoot"]
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OS_BOOT_URL}",
-                                is_os_boot_detail["uri"],
+                            assert (
+                                is_os_boot_detail["uri"]
+                                == f"{hardware_control_uri}/cpu/{proc['targetDeviceID']}/is-os-ready"
                             )
                             assert "GET" == is_os_boot_detail["method"]
                             assert "queryParameter" in is_os_boot_detail
@@ -551,29 +547,20 @@ class TestApplyCli:
                             assert is_os_boot_detail["statusCode"] == 200
 
                         case "shutdown":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
-                            )
+                            assert detail["uri"] == f"{hardware_control_uri}/devices/{proc['targetDeviceID']}/power"
                             assert "PUT" == detail["method"]
                             assert {"action": "off"} == detail["requestBody"]
                             assert detail["getInformation"]["responseBody"] == {"powerState": "Off"}
                             assert "queryParameter" not in detail
                             assert 200 == detail["statusCode"]
                         case "start":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                                detail["uri"],
-                            )
+                            assert detail["uri"] == extended_procedure_uri
                             assert "POST" == detail["method"]
                             assert "start" == detail["requestBody"].get("operation")
                             assert "queryParameter" not in detail
                             assert 202 == detail["statusCode"]
                         case "stop":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                                detail["uri"],
-                            )
+                            assert detail["uri"] == extended_procedure_uri
                             assert "POST" == detail["method"]
                             assert "stop" == detail["requestBody"].get("operation")
                             assert "queryParameter" not in detail
@@ -584,7 +571,9 @@ class TestApplyCli:
             procces_mock.return_value.join()
 
     @pytest.mark.usefixtures("hardwaremgr_fixture")
-    def test_cmd_apply_success_when_migration_step_empty(self, capfd, mocker, init_db_instance, get_applyID):
+    def test_cmd_apply_success_when_migration_step_empty(
+        self, capfd, mocker, init_db_instance, get_applyID, layout_config
+    ):
         # arrange
 
         mocker.patch("layoutapply.db.create_randomname", return_value=get_applyID)
@@ -598,7 +587,7 @@ class TestApplyCli:
                     json.dump(procedures, file)
                 sys.argv = ["cli.py", "request", "-p", arg_procedure]
 
-                config = LayoutApplyConfig()
+                config = layout_config
                 log_config = LayoutApplyLogConfig()
                 # act
                 procces_mock = mocker.patch(
@@ -654,102 +643,93 @@ class TestApplyCli:
             # There is no standard output
             assert out == ""
             # There is an error message in the standard error output that starts with the specified error code
-            regex = re.compile(r"^\[E40001\]")
-            assert regex.search(err)
+            assert INVALID_PROCEDURE_ERROR_REGEX.search(err)
 
     @pytest.mark.parametrize("procedures", checkvalid.invalid_data_type)
-    def test_cmd_apply_failure_when_invalid_migration_step(self, capfd, procedures):
+    def test_cmd_apply_failure_when_invalid_migration_step(self, capfd, procedures, tmp_path):
         # arrange
-        with tempfile.TemporaryDirectory() as tempdir:
-            arg_procedure = os.path.join(tempdir, "procedure.json")
-            with open(arg_procedure, "w", encoding="utf-8") as file:
-                json.dump(procedures, file)
-            sys.argv = ["cli.py", "request", "-p", arg_procedure]
+        procedure_path = str(tmp_path / "procedure.json")
+        with open(procedure_path, "w", encoding="utf-8") as file:
+            json.dump(procedures, file, separators=(",", ":"))
+        sys.argv = ["cli.py", "request", "-p", procedure_path]
 
-            # act
-            with pytest.raises(SystemExit) as excinfo:
-                main()
+        # act
+        with pytest.raises(SystemExit) as excinfo:
+            main()
 
-            # assert
+        # assert
 
-            assert excinfo.value.code == 1
-            out, err = capfd.readouterr()
-            # There is no standard output
-            assert out == ""
-            # There is an error message in the standard error output that starts with the specified error code
-            regex = re.compile(r"^\[E40001\]")
-            assert regex.search(err)
+        assert excinfo.value.code == 1
+        out, err = capfd.readouterr()
+        # There is no standard output
+        assert out == ""
+        # There is an error message in the standard error output that starts with the specified error code
+        assert INVALID_PROCEDURE_ERROR_REGEX.search(err)
 
     @pytest.mark.parametrize("procedures", checkvalid.without_required_key)
-    def test_cmd_apply_failure_when_missing_required_migration_item(self, capfd, procedures):
+    def test_cmd_apply_failure_when_missing_required_migration_item(self, capfd, procedures, tmp_path):
         # arrange
-        with tempfile.TemporaryDirectory() as tempdir:
-            arg_procedure = os.path.join(tempdir, "procedure.json")
-            with open(arg_procedure, "w", encoding="utf-8") as file:
-                json.dump(procedures, file)
+        procedure_path = str(tmp_path / "procedure.json")
+        with open(procedure_path, "w", encoding="utf-8") as file:
+            json.dump(procedures, file, separators=(",", ":"))
 
-            sys.argv = ["cli.py", "request", "-p", arg_procedure]
+        sys.argv = ["cli.py", "request", "-p", procedure_path]
 
-            # act
-            with pytest.raises(SystemExit) as excinfo:
-                main()
+        # act
+        with pytest.raises(SystemExit) as excinfo:
+            main()
 
-            # assert
+        # assert
 
-            assert excinfo.value.code == 1
-            out, err = capfd.readouterr()
-            # There is no standard output
-            assert out == ""
-            # There is an error message in the standard error output that starts with the specified error code
-            regex = re.compile(r"^\[E40001\]")
-            assert regex.search(err)
+        assert excinfo.value.code == 1
+        out, err = capfd.readouterr()
+        # There is no standard output
+        assert out == ""
+        # There is an error message in the standard error output that starts with the specified error code
+        assert INVALID_PROCEDURE_ERROR_REGEX.search(err)
 
     @pytest.mark.parametrize("procedures", checkvalid.any_key_combination)
-    def test_cmd_apply_failure_when_any_key_combination(self, capfd, procedures):
+    def test_cmd_apply_failure_when_any_key_combination(self, capfd, procedures, tmp_path):
         # arrange
-        with tempfile.TemporaryDirectory() as tempdir:
-            arg_procedure = os.path.join(tempdir, "procedure.json")
-            with open(arg_procedure, "w", encoding="utf-8") as file:
-                json.dump(procedures, file)
+        procedure_path = str(tmp_path / "procedure.json")
+        with open(procedure_path, "w", encoding="utf-8") as file:
+            json.dump(procedures, file, separators=(",", ":"))
 
-            sys.argv = ["cli.py", "request", "-p", arg_procedure]
+        sys.argv = ["cli.py", "request", "-p", procedure_path]
 
-            # act
-            with pytest.raises(SystemExit) as excinfo:
-                main()
+        # act
+        with pytest.raises(SystemExit) as excinfo:
+            main()
 
-            # assert
+        # assert
 
-            assert excinfo.value.code == 1
-            out, err = capfd.readouterr()
-            # There is no standard output
-            assert out == ""
-            # There is an error message in the standard error output that starts with the specified error code
-            regex = re.compile(r"^\[E40001\]")
-            assert regex.search(err)
+        assert excinfo.value.code == 1
+        out, err = capfd.readouterr()
+        # There is no standard output
+        assert out == ""
+        # There is an error message in the standard error output that starts with the specified error code
+        assert INVALID_PROCEDURE_ERROR_REGEX.search(err)
 
     @pytest.mark.parametrize("procedures", checkvalid.invalid_value)
-    def test_cmd_apply_failure_when_invalid_migration_value(self, capfd, procedures):
+    def test_cmd_apply_failure_when_invalid_migration_value(self, capfd, procedures, tmp_path):
         # arrange
-        with tempfile.TemporaryDirectory() as tempdir:
-            arg_procedure = os.path.join(tempdir, "procedure.json")
-            with open(arg_procedure, "w", encoding="utf-8") as file:
-                json.dump(procedures, file)
-            sys.argv = ["cli.py", "request", "-p", arg_procedure]
+        procedure_path = str(tmp_path / "procedure.json")
+        with open(procedure_path, "w", encoding="utf-8") as file:
+            json.dump(procedures, file, separators=(",", ":"))
+        sys.argv = ["cli.py", "request", "-p", procedure_path]
 
-            # act
-            with pytest.raises(SystemExit) as excinfo:
-                main()
+        # act
+        with pytest.raises(SystemExit) as excinfo:
+            main()
 
-            # assert
+        # assert
 
-            assert excinfo.value.code == 1
-            out, err = capfd.readouterr()
-            # There is no standard output
-            assert out == ""
-            # There is an error message in the standard error output that starts with the specified error code
-            regex = re.compile(r"^\[E40001\]")
-            assert regex.search(err)
+        assert excinfo.value.code == 1
+        out, err = capfd.readouterr()
+        # There is no standard output
+        assert out == ""
+        # There is an error message in the standard error output that starts with the specified error code
+        assert INVALID_PROCEDURE_ERROR_REGEX.search(err)
 
     def test_cmd_apply_failure_when_failed_to_load_config_file(self, mocker, capfd):
         mocker.patch(
@@ -773,8 +753,7 @@ class TestApplyCli:
             # There is no standard output
             assert out == ""
             # There is an error message in the standard error output that starts with the specified error code
-            regex = re.compile(r"^\[E40002\]Failed to load layoutapply_config.yaml.")
-            assert regex.search(err)
+            assert CONFIG_LOAD_ERROR_REGEX.search(err)
 
     def test_cmd_apply_failure_when_failed_to_read_secret_file(self, mocker, capfd):
         mocker.patch.object(LayoutApplyConfig, "_get_secret", side_effect=[Exception("Dummy message")])
@@ -936,8 +915,7 @@ class TestApplyCli:
             # There is no standard output
             assert out == ""
             # There is an error message in the standard error output that starts with the specified error code
-            regex = re.compile(r"^\[E40002\]Failed to load layoutapply_config.yaml.")
-            assert regex.search(err)
+            assert CONFIG_LOAD_ERROR_REGEX.search(err)
 
     @pytest.mark.parametrize(
         "args",
@@ -1443,8 +1421,7 @@ class TestApplyCli:
         # There is no standard output
         assert out == ""
         # There is an error message in the standard error output that starts with the specified error code
-        regex = re.compile(r"^\[E40002\]Failed to load layoutapply_config.yaml.")
-        assert regex.search(err)
+        assert CONFIG_LOAD_ERROR_REGEX.search(err)
 
     @pytest.mark.parametrize("args", [["cancel", "--apply-id", "012345678d"]])
     def test_cmd_cancel_failure_when_failed_db_connection(self, mocker, args, capfd):
@@ -3771,8 +3748,7 @@ class TestApplyCli:
         # There is no standard output
         assert out == ""
         # There is an error message in the standard error output that starts with the specified error code
-        regex = re.compile(r"^\[E40002\]Failed to load layoutapply_config.yaml.")
-        assert regex.search(err)
+        assert CONFIG_LOAD_ERROR_REGEX.search(err)
 
     @pytest.mark.parametrize("args", [["delete", "--apply-id", "012345678a"]])
     def test_cmd_delete_failure_when_failed_db_connection(self, mocker, args, capfd):
@@ -3833,12 +3809,9 @@ class TestApplyCli:
         assert err == assert_print
 
     @pytest.mark.parametrize("args", [["resume", "--apply-id", "300000004d"]])
-    def test_cmd_resume_success(self, mocker, init_db_instance, args, httpserver):
+    def test_cmd_resume_success(self, mocker, init_db_instance, args, httpserver, layout_config):
         uri = HARDWARE_CONTROL_URI
 
-        httpserver.clear()
-        httpserver.clear_all_handlers()
-
         # Data adjustment before testing.
         with init_db_instance.cursor(cursor_factory=DictCursor) as cursor:
             cursor.execute(
@@ -3856,8 +3829,7 @@ class TestApplyCli:
 
         sys.argv = ["cli.py", *args]
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         # act
         procces_mock = mocker.patch(
             "subprocess.Popen",
@@ -3884,24 +3856,14 @@ class TestApplyCli:
             procces_mock.return_value.start()
             main()
         # with httpserver.wait(stop_on_nohandler=False, timeout=0.1) as waiter:
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
             {"status": True, "IPAddress": "192.168.122.11"}, status=200
         )
-        httpserver.expect_request(
-            re.compile(f"\/{GET_INFORMATION_URI}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_json(
             {"type": "CPU", "powerState": "Off", "powerCapability": False},
             status=200,
         )
@@ -3939,19 +3901,16 @@ class TestApplyCli:
         host = config.hardware_control.get("host")
         port = config.hardware_control.get("port")
         uri = config.hardware_control.get("uri")
+        # Index the result details by operationID to look up the one for each migration procedure
+        details_by_operation_id = {detail["operationID"]: detail for detail in details}
         for proc in procedures:
-            # Search for items corresponding to the migration procedure from
-            # result details using operationID as a condition
-            detail = [i for i in details if i["operationID"] == proc["operationID"]][0]
+            detail = details_by_operation_id[proc["operationID"]]
             assert proc["operationID"] == detail["operationID"]
             assert "COMPLETED" == detail["status"]
             # Check the URI, etc. of the hardware control API
             match proc["operation"]:
                 case "shutdown":
-                    assert re.fullmatch(
-                        f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                        detail["uri"],
-                    )
+                    assert detail["uri"] == f"http://{host}:{port}/{uri}/devices/{proc['targetDeviceID']}/power"
                     assert "PUT" == detail["method"]
                     assert "queryParameter" not in detail
                     assert 200 == detail["statusCode"]
@@ -3963,35 +3922,22 @@ class TestApplyCli:
             procces_mock.return_value.terminate()
             procces_mock.return_value.join()
         sleep(1)
-        httpserver.clear()
-        httpserver.clear_all_handlers()
 
     @pytest.mark.parametrize("args", [["resume", "--apply-id", "300000013d"]])
-    def test_cmd_resume_success_when_rollback_state_suspended(self, mocker, init_db_instance, args, httpserver):
+    def test_cmd_resume_success_when_rollback_state_suspended(
+        self, mocker, init_db_instance, args, httpserver, layout_config
+    ):
         uri = HARDWARE_CONTROL_URI
 
-        httpserver.clear()
-        httpserver.clear_all_handlers()
-
         # with httpserver.wait(stop_on_nohandler=False, timeout=0.1) as waiter:
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
             {"status": True, "IPAddress": "192.168.122.11"}, status=200
         )
-        httpserver.expect_request(
-            re.compile(f"\/{GET_INFORMATION_URI}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_json(
             {"type": "CPU", "powerState": "Off", "powerCapability": False},
             status=200,
         )
@@ -4012,8 +3958,7 @@ class TestApplyCli:
 
         sys.argv = ["cli.py", *args]
 
-        config = LayoutApplyConfig()
-        config.load_log_configs()
+        config = layout_config
         # act
         procces_mock = mocker.patch(
             "subprocess.Popen",
@@ -4071,19 +4016,16 @@ class TestApplyCli:
         host = config.hardware_control.get("host")
         port = config.hardware_control.get("port")
         uri = config.hardware_control.get("uri")
+        # Index the result details by operationID to look up the one for each migration procedure
+        details_by_operation_id = {detail["operationID"]: detail for detail in details}
         for proc in procedures:
-            # Search for items corresponding to the migration procedure from
-            # result details using operationID as a condition
-            detail = [i for i in details if i["operationID"] == proc["operationID"]][0]
+            detail = details_by_operation_id[proc["operationID"]]
             assert proc["operationID"] == detail["operationID"]
             assert "COMPLETED" == detail["status"]
             # Check the URI, etc. of the hardware control API
             match proc["operation"]:
                 case "shutdown":
-                    assert re.fullmatch(
-                        f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                        detail["uri"],
-                    )
+                    assert detail["uri"] == f"http://{host}:{port}/{uri}/devices/{proc['targetDeviceID']}/power"
                     assert "PUT" == detail["method"]
                     assert "queryParameter" not in detail
                     assert 200 == detail["statusCode"]
@@ -4095,8 +4037,6 @@ class TestApplyCli:
             procces_mock.return_value.terminate()
             procces_mock.return_value.join()
         sleep(1)
-        httpserver.clear()
-        httpserver.clear_all_handlers()
 
     @pytest.mark.parametrize(
         "args",
@@ -4207,8 +4147,7 @@ class TestApplyCli:
         # There is no standard output
         assert out == ""
         # There is an error message in the standard error output that starts with the specified error code
-        regex = re.compile(r"^\[E40002\]Failed to load layoutapply_config.yaml.")
-        assert regex.search(err)
+        assert CONFIG_LOAD_ERROR_REGEX.search(err)
 
     @pytest.mark.parametrize("args", [["resume", "--apply-id", "012345678d"]])
     def test_cmd_resume_failure_when_failed_db_connection(self, mocker, args, capfd):
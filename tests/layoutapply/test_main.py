@@ -15,11 +15,9 @@
 
 import io
 import logging.config
-import re
 from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import asdict
 from time import sleep
-from uuid import uuid4
 
 import psycopg2
 import pytest
@@ -51,13 +49,14 @@ from layoutapply.main import (
 from layoutapply.setting import LayoutApplyConfig, LayoutApplyLogConfig
 from layoutapply.util import create_randomname
 from tests.layoutapply.conftest import (
-    DEVICE_INFO_URL,
+    DEVICE_INFO_PATTERN,
     EXTENDED_PROCEDURE_URI,
-    OPERATION_URL,
-    OS_BOOT_URL,
-    POWER_OPERATION_URL,
+    OPERATION_PATTERN,
+    OS_BOOT_PATTERN,
+    POWER_OPERATION_PATTERN,
     WORKFLOW_MANAGER_HOST,
     WORKFLOW_MANAGER_PORT,
+    fake_uuid,
 )
 from tests.layoutapply.test_data import sql
 from tests.layoutapply.test_data.procedure import multi_pattern, single_pattern, single_pattern_cancel
@@ -127,9 +126,8 @@ class TestMain:
                 assert "queryParameter" not in detail
                 match procedure["operation"]:
                     case "connect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -139,9 +137,8 @@ class TestMain:
                         assert 200 == detail["statusCode"]
 
                     case "disconnect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -151,18 +148,16 @@ class TestMain:
                         assert 200 == detail["statusCode"]
 
                     case "boot":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {"action": "on"}
                         assert 200 == detail["statusCode"]
 
                     case "shutdown":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -228,9 +223,8 @@ class TestMain:
 
                 match procedure["operation"]:
                     case "connect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -243,9 +237,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "disconnect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -258,9 +251,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "boot":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {"action": "on"}
@@ -270,9 +262,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "shutdown":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -281,9 +272,9 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "start":
-                        assert re.fullmatch(
-                            f"http:\/\/{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"]
+                            == f"http://{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}/{uri}/{EXTENDED_PROCEDURE_URI}"
                         )
                         assert "POST" == detail["method"]
                         assert "queryParameter" not in detail
@@ -292,9 +283,9 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "stop":
-                        assert re.fullmatch(
-                            f"http:\/\/{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"]
+                            == f"http://{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}/{uri}/{EXTENDED_PROCEDURE_URI}"
                         )
                         assert "POST" == detail["method"]
                         assert "queryParameter" not in detail
@@ -358,9 +349,8 @@ class TestMain:
 
                 match procedure["operation"]:
                     case "connect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -373,9 +363,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "disconnect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -388,9 +377,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "boot":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {"action": "on"}
@@ -400,9 +388,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "shutdown":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -411,9 +398,9 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "start":
-                        assert re.fullmatch(
-                            f"http:\/\/{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"]
+                            == f"http://{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}/{uri}/{EXTENDED_PROCEDURE_URI}"
                         )
                         assert "POST" == detail["method"]
                         assert "queryParameter" not in detail
@@ -422,9 +409,9 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "stop":
-                        assert re.fullmatch(
-                            f"http:\/\/{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"]
+                            == f"http://{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}/{uri}/{EXTENDED_PROCEDURE_URI}"
                         )
                         assert "POST" == detail["method"]
                         assert "queryParameter" not in detail
@@ -488,9 +475,8 @@ class TestMain:
 
                 match procedure["operation"]:
                     case "connect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -503,9 +489,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "disconnect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -518,9 +503,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "boot":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {"action": "on"}
@@ -530,9 +514,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "shutdown":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -596,9 +579,8 @@ class TestMain:
 
                 match procedure["operation"]:
                     case "connect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -611,9 +593,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "disconnect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -626,9 +607,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "boot":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {"action": "on"}
@@ -638,9 +618,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "shutdown":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -649,9 +628,9 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "start":
-                        assert re.fullmatch(
-                            f"http:\/\/{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"]
+                            == f"http://{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}/{uri}/{EXTENDED_PROCEDURE_URI}"
                         )
                         assert "POST" == detail["method"]
                         assert "queryParameter" not in detail
@@ -660,9 +639,9 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "stop":
-                        assert re.fullmatch(
-                            f"http:\/\/{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"]
+                            == f"http://{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}/{uri}/{EXTENDED_PROCEDURE_URI}"
                         )
                         assert "POST" == detail["method"]
                         assert "queryParameter" not in detail
@@ -725,9 +704,9 @@ class TestMain:
                     assert "FAILED" == detail["status"]
                     match procedure["operation"]:
                         case "connect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                             )
                             assert "PUT" == detail["method"]
                             assert "queryParameter" not in detail
@@ -741,9 +720,9 @@ class TestMain:
                                 "message": "Internal Server Error.",
                             } == detail["responseBody"]
                         case "disconnect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {
@@ -757,9 +736,9 @@ class TestMain:
                                 "message": "Internal Server Error.",
                             } == detail["responseBody"]
                         case "boot":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {"action": "on"}
@@ -770,9 +749,9 @@ class TestMain:
                                 "message": "Internal Server Error.",
                             } == detail["responseBody"]
                         case "shutdown":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                             )
                             assert "PUT" == detail["method"]
                             assert "queryParameter" not in detail
@@ -842,9 +821,9 @@ class TestMain:
 
                     match procedure["operation"]:
                         case "connect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {
@@ -860,9 +839,9 @@ class TestMain:
                             assert detail["startedAt"] is not None
                             assert detail["endedAt"] is not None
                         case "disconnect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {
@@ -879,9 +858,9 @@ class TestMain:
                             assert detail["endedAt"] is not None
                         case "boot":
                             assert detail["requestBody"] == {"action": "on"}
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                             )
                             assert "PUT" == detail["method"]
                             assert "queryParameter" not in detail
@@ -893,9 +872,9 @@ class TestMain:
                             assert detail["startedAt"] is not None
                             assert detail["endedAt"] is not None
                         case "shutdown":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                             )
                             assert "PUT" == detail["method"]
                             assert "queryParameter" not in detail
@@ -907,9 +886,10 @@ class TestMain:
                             assert detail["startedAt"] is not None
                             assert detail["endedAt"] is not None
                         case "start":
-                            assert re.fullmatch(
-                                f"http:\/\/{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}"
+                                f"/{uri}/{EXTENDED_PROCEDURE_URI}"
                             )
                             assert "POST" == detail["method"]
                             assert "queryParameter" not in detail
@@ -921,9 +901,10 @@ class TestMain:
                             assert detail["startedAt"] is not None
                             assert detail["endedAt"] is not None
                         case "stop":
-                            assert re.fullmatch(
-                                f"http:\/\/{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}\/{uri}\/{EXTENDED_PROCEDURE_URI}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{WORKFLOW_MANAGER_HOST}:{WORKFLOW_MANAGER_PORT}"
+                                f"/{uri}/{EXTENDED_PROCEDURE_URI}"
                             )
                             assert "POST" == detail["method"]
                             assert "queryParameter" not in detail
@@ -1019,41 +1000,41 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "boot",
-                        "targetDeviceID": str(uuid4()),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 2,
                         "operation": "shutdown",
-                        "targetDeviceID": str(uuid4()),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1],
                     },
                     {
                         "operationID": 3,
                         "operation": "disconnect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [2],
                     },
                     {
                         "operationID": 4,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [3],
                     },
                     {
                         "operationID": 5,
                         "operation": "start",
-                        "targetCPUID": str(uuid4()),
-                        "targetServiceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetServiceID": fake_uuid(),
                         "dependencies": [4],
                     },
                     {
                         "operationID": 6,
                         "operation": "shutdown",
-                        "targetCPUID": str(uuid4()),
-                        "targetServiceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetServiceID": fake_uuid(),
                         "dependencies": [5],
                     },
                 ],
@@ -1064,41 +1045,41 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "boot",
-                        "targetDeviceID": str(uuid4()),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 2,
                         "operation": "shutdown",
-                        "targetDeviceID": str(uuid4()),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 3,
                         "operation": "disconnect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1, 2],
                     },
                     {
                         "operationID": 4,
                         "operation": "disconnect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [3],
                     },
                     {
                         "operationID": 5,
                         "operation": "start",
-                        "targetCPUID": str(uuid4()),
-                        "targetServiceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetServiceID": fake_uuid(),
                         "dependencies": [4],
                     },
                     {
                         "operationID": 6,
                         "operation": "shutdown",
-                        "targetCPUID": str(uuid4()),
-                        "targetServiceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetServiceID": fake_uuid(),
                         "dependencies": [5],
                     },
                 ],
@@ -1107,8 +1088,6 @@ class TestMain:
         ]
         config = LayoutApplyConfig()
         config.load_log_configs()
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
 
         def change_cancel_request(request: Request):
             with init_db_instance.cursor(cursor_factory=DictCursor) as cursor:
@@ -1116,24 +1095,14 @@ class TestMain:
                 init_db_instance.commit()
             return Response("", status=200)
 
-        httpserver.expect_oneshot_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_handler(
-            change_cancel_request
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_handler(
-            change_cancel_request
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_handler(
-            change_cancel_request
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_oneshot_request(OPERATION_PATTERN, method="PUT").respond_with_handler(change_cancel_request)
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_handler(change_cancel_request)
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_handler(change_cancel_request)
+        httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
             {"status": True, "IPAddress": "192.168.122.11"}, status=200
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_handler(
-            change_cancel_request
-        )
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_handler(change_cancel_request)
+        httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_response(
             Response(
                 response=b'{"type": "CPU", "powerState": "Off", "powerCapability": false}',
                 status=200,
@@ -1187,8 +1156,6 @@ class TestMain:
             assert details is not None
             assert len(details) == len(procedures["procedures"])
 
-            uri = config.hardware_control.get("uri")
-
             for procedure in procedures["procedures"]:
                 # Search for items corresponding to the migration procedure from the result details using operationID as a condition
                 detail = [i for i in details if i["operationID"] == procedure["operationID"]][0]
@@ -1208,7 +1175,6 @@ class TestMain:
                     assert "statusCode" not in detail
                     assert "startedAt" not in detail
                     assert "endedAt" not in detail
-        httpserver.clear()
 
     def test_run_status_not_canceled_when_true_cancel_flag_on_last_api_execution(
         self,
@@ -1224,29 +1190,29 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 2,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 3,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 4,
                         "operation": "disconnect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1, 2, 3],
                     },
                 ],
@@ -1257,29 +1223,29 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 2,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 3,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 4,
                         "operation": "disconnect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1, 2, 3],
                     },
                 ],
@@ -1288,8 +1254,6 @@ class TestMain:
         ]
         config = LayoutApplyConfig()
         config.load_log_configs()
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
 
         def change_cancel_request(request: Request):
             with init_db_instance.cursor(cursor_factory=DictCursor) as cursor:
@@ -1297,26 +1261,18 @@ class TestMain:
                 init_db_instance.commit()
             return Response("", status=200)
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
         httpserver.expect_oneshot_request(
-            re.compile(f"\/{uri}\/{OPERATION_URL}"),
+            OPERATION_PATTERN,
             method="PUT",
             data='{"action":"disconnect","deviceID":' + param_list[0]["procedures"][3]["targetDeviceID"] + "}",
         ).respond_with_handler(change_cancel_request)
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
             {"status": True, "IPAddress": "192.168.122.11"}, status=200
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_response(
             Response(
                 response=b'{"type": "CPU", "powerState": "Off", "powerCapability": false}',
                 status=200,
@@ -1349,7 +1305,6 @@ class TestMain:
             details = row.get("applyresult")
             assert details is not None
             assert len(details) == len(procedures["procedures"])
-            uri = config.hardware_control.get("uri")
 
             for procedure in procedures["procedures"]:
                 # Search for items corresponding to the migration procedure
@@ -1359,7 +1314,6 @@ class TestMain:
                 # Check the URI, etc. of the hardware control API
                 # Review the mockup method with hardwaremgr_fixture as well
                 assert "COMPLETED" == detail["status"]
-        httpserver.clear()
 
     def test_run_status_suspended_when_true_cancel_flag_on_api_failure(
         self,
@@ -1374,8 +1328,8 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "disconnect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                 ],
@@ -1386,21 +1340,21 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "disconnect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [],
                     },
                     {
                         "operationID": 2,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1],
                     },
                     {
                         "operationID": 3,
                         "operation": "shutdown",
-                        "targetDeviceID": str(uuid4()),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [2],
                     },
                 ],
@@ -1410,9 +1364,6 @@ class TestMain:
         config = LayoutApplyConfig()
         config.load_log_configs()
 
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-
         def change_cancel_request(request: Request):
             if request.json["action"] == "disconnect":
                 with init_db_instance.cursor(cursor_factory=DictCursor) as cursor:
@@ -1426,21 +1377,13 @@ class TestMain:
             else:
                 return Response("", status=200)
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_handler(
-            change_cancel_request
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_handler(change_cancel_request)
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
             {"status": True, "IPAddress": "192.168.122.11"}, status=200
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_response(
             Response(
                 response=b'{"type": "CPU", "powerState": "Off", "powerCapability": false}',
                 status=200,
@@ -1470,7 +1413,6 @@ class TestMain:
                         break
             # assert
             assert row.get("status") == "SUSPENDED"
-        httpserver.clear()
 
     def test_find_first_proc_returns_first_migration_plan(self):
 
@@ -1478,25 +1420,25 @@ class TestMain:
         proc_list = [
             Procedure(
                 operationID=1,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[],
             ),
             Procedure(
                 operationID=2,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[1],
             ),
             Procedure(
                 operationID=3,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[],
             ),
             Procedure(
                 operationID=4,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[3],
             ),
@@ -1508,7 +1450,7 @@ class TestMain:
         proc_list = [
             Procedure(
                 operationID=1,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[],
             ),
@@ -1521,25 +1463,25 @@ class TestMain:
         proc_list = [
             Procedure(
                 operationID=1,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWEROFF,
                 dependencies=[0],
             ),
             Procedure(
                 operationID=2,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWERON,
                 dependencies=[1],
             ),
             Procedure(
                 operationID=3,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWEROFF,
                 dependencies=[2],
             ),
             Procedure(
                 operationID=4,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWERON,
                 dependencies=[3],
             ),
@@ -1553,19 +1495,19 @@ class TestMain:
         proc_list = [
             Procedure(
                 operationID=5,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWERON,
                 dependencies=[4],
             ),
             Procedure(
                 operationID=6,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWERON,
                 dependencies=[5],
             ),
             Procedure(
                 operationID=7,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWERON,
                 dependencies=[6],
             ),
@@ -1582,19 +1524,19 @@ class TestMain:
         proc_list = [
             Procedure(
                 operationID=5,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[4],
             ),
             Procedure(
                 operationID=6,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.DISCONNECT,
                 dependencies=[2, 3],
             ),
             Procedure(
                 operationID=7,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[6],
             ),
@@ -1610,19 +1552,19 @@ class TestMain:
         proc_list = [
             Procedure(
                 operationID=5,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[4],
             ),
             Procedure(
                 operationID=6,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.DISCONNECT,
                 dependencies=[2, 3],
             ),
             Procedure(
                 operationID=7,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWEROFF,
                 dependencies=[6],
             ),
@@ -1660,19 +1602,19 @@ class TestMain:
         proc_list = [
             Procedure(
                 operationID=2,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWEROFF,
                 dependencies=[1],
             ),
             Procedure(
                 operationID=3,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWERON,
                 dependencies=[2],
             ),
             Procedure(
                 operationID=4,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[3],
             ),
@@ -1684,25 +1626,25 @@ class TestMain:
         proc_list = [
             Procedure(
                 operationID=2,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[1],
             ),
             Procedure(
                 operationID=3,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWEROFF,
                 dependencies=[1, 2],
             ),
             Procedure(
                 operationID=4,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.DISCONNECT,
                 dependencies=[1, 2, 3],
             ),
             Procedure(
                 operationID=5,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWERON,
                 dependencies=[6],
             ),
@@ -1718,7 +1660,7 @@ class TestMain:
             applyid = create_randomname(IdParameter.LENGTH)
             procedure = Procedure(
                 operationID=1,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.CONNECT,
                 dependencies=[1],
             )
@@ -1726,7 +1668,7 @@ class TestMain:
 
             procedure = Procedure(
                 operationID=1,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.DISCONNECT,
                 dependencies=[1],
             )
@@ -1734,7 +1676,7 @@ class TestMain:
 
             procedure = Procedure(
                 operationID=1,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWERON,
                 dependencies=[1],
             )
@@ -1742,7 +1684,7 @@ class TestMain:
 
             procedure = Procedure(
                 operationID=1,
-                targetDeviceID=uuid4(),
+                targetDeviceID=fake_uuid(),
                 operation=Operation.POWEROFF,
                 dependencies=[1],
             )
@@ -1750,8 +1692,8 @@ class TestMain:
 
             procedure = Procedure(
                 operationID=1,
-                targetCPUID=uuid4(),
-                targetServiceID=uuid4(),
+                targetCPUID=fake_uuid(),
+                targetServiceID=fake_uuid(),
                 operation=Operation.START,
                 dependencies=[1],
             )
@@ -1759,8 +1701,8 @@ class TestMain:
 
             procedure = Procedure(
                 operationID=1,
-                targetCPUID=uuid4(),
-                targetServiceID=uuid4(),
+                targetCPUID=fake_uuid(),
+                targetServiceID=fake_uuid(),
                 operation=Operation.STOP,
                 dependencies=[1],
             )
@@ -1770,7 +1712,7 @@ class TestMain:
             with pytest.raises(Exception):
                 procedure = Procedure(
                     operationID=1,
-                    targetDeviceID=uuid4(),
+                    targetDeviceID=fake_uuid(),
                     operation="dummy",
                     dependencies=[1],
                 )
@@ -1783,8 +1725,8 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "connect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 Operation.DISCONNECT,
@@ -1793,8 +1735,8 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "disconnect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 Operation.CONNECT,
@@ -1803,7 +1745,7 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "boot",
-                    "targetDeviceID": str(uuid4()),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 Operation.POWEROFF,
@@ -1812,7 +1754,7 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "shutdown",
-                    "targetDeviceID": str(uuid4()),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 Operation.POWERON,
@@ -1821,8 +1763,8 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "start",
-                    "targetCPUID": str(uuid4()),
-                    "targetServiceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetServiceID": fake_uuid(),
                     "dependencies": [],
                 },
                 Operation.STOP,
@@ -1831,8 +1773,8 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "stop",
-                    "targetCPUID": str(uuid4()),
-                    "targetServiceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetServiceID": fake_uuid(),
                     "dependencies": [],
                 },
                 Operation.START,
@@ -1842,7 +1784,7 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "shutdowns",
-                    "targetDeviceID": str(uuid4()),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 "shutdowns",
@@ -1862,15 +1804,15 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "connect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 {
                     "operationID": 2,
                     "operation": "connect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [1],
                 },
             ),
@@ -1879,15 +1821,15 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "connect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [3, 4],
                 },
                 {
                     "operationID": 2,
                     "operation": "connect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [1, 3, 4],
                 },
             ),
@@ -1914,15 +1856,15 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [3],  # delete
                     },
                     {
                         "operationID": 2,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1],
                     },
                 ],
@@ -1933,22 +1875,22 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [5],  # delete
                     },
                     {
                         "operationID": 2,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1],
                     },
                     {
                         "operationID": 3,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [4],  # delete
                     },
                 ],
@@ -1979,22 +1921,22 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [3],
                     },
                     {
                         "operationID": 2,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1],
                     },
                     {
                         "operationID": 3,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [2],
                     },
                 ],
@@ -2009,22 +1951,22 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [3],
                     },
                     {
                         "operationID": 2,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1],
                     },
                     {
                         "operationID": 3,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [2],
                     },
                 ],
@@ -2039,22 +1981,22 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [3],
                     },
                     {
                         "operationID": 2,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1],
                     },
                     {
                         "operationID": 3,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [2],
                     },
                 ],
@@ -2070,22 +2012,22 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [3],
                     },
                     {
                         "operationID": 2,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [1],
                     },
                     {
                         "operationID": 3,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [2],
                     },
                 ],
@@ -2102,8 +2044,8 @@ class TestMain:
                     {
                         "operationID": 1,
                         "operation": "connect",
-                        "targetCPUID": str(uuid4()),
-                        "targetDeviceID": str(uuid4()),
+                        "targetCPUID": fake_uuid(),
+                        "targetDeviceID": fake_uuid(),
                         "dependencies": [3],
                     }
                 ],
@@ -3511,28 +3453,28 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "disconnect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 {
                     "operationID": 2,
                     "operation": "shutdown",
-                    "targetDeviceID": str(uuid4()),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [1],
                 },
                 {
                     "operationID": 3,
                     "operation": "connect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [2],
                 },
                 {
                     "operationID": 4,
                     "operation": "disconnect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [3],
                 },
             ],
@@ -3550,25 +3492,14 @@ class TestMain:
         logger = Logger(config.log_config)
         database = DbAccess(logger)
 
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_json(
             {"type": "CPU", "powerState": "Off", "powerCapability": False},
             status=200,
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
             {"status": True, "IPAddress": "192.168.122.11"}, status=200
         )
 
@@ -3599,7 +3530,6 @@ class TestMain:
             row = cursor.fetchone()
         assert row.get("status") == Result.CANCELED
         assert row.get("rollbackstatus") == Result.COMPLETED
-        httpserver.clear()
 
     def test_update_layoutapply_rollback_state_suspended_when_failure_on_rollback(
         self,
@@ -3623,28 +3553,28 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "disconnect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 {
                     "operationID": 2,
                     "operation": "shutdown",
-                    "targetDeviceID": str(uuid4()),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [1],
                 },
                 {
                     "operationID": 3,
                     "operation": "connect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [2],
                 },
                 {
                     "operationID": 4,
                     "operation": "disconnect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [3],
                 },
             ],
@@ -3662,25 +3592,14 @@ class TestMain:
         logger = Logger(config.log_config)
         database = DbAccess(logger)
 
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_json(
             {"type": "CPU", "powerState": "Off", "powerCapability": False},
             status=200,
         )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=500)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=500))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
             {"status": True, "IPAddress": "192.168.122.11"}, status=200
         )
 
@@ -3710,7 +3629,6 @@ class TestMain:
             assert row.get("rollbackstatus") == Result.SUSPENDED
             cursor.execute(query=f"DELETE FROM applystatus WHERE applyid = '{applyID}';")
             init_db_instance.commit()
-        httpserver.clear()
 
     @pytest.mark.usefixtures("hardwaremgr_fixture")
     def test_cancel_run_status_completed_when_single_migration_step(
@@ -3754,9 +3672,8 @@ class TestMain:
                 assert "queryParameter" not in detail
                 match procedure["operation"]:
                     case "connect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -3766,9 +3683,8 @@ class TestMain:
                         assert 200 == detail["statusCode"]
 
                     case "disconnect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -3778,9 +3694,8 @@ class TestMain:
                         assert 200 == detail["statusCode"]
 
                     case "boot":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {"action": "on"}
@@ -3791,9 +3706,8 @@ class TestMain:
                         #     f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
                         #     detail["uri"],
                         # )
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -3843,9 +3757,8 @@ class TestMain:
 
                 match procedure["operation"]:
                     case "connect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -3858,9 +3771,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "disconnect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -3873,9 +3785,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "boot":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {"action": "on"}
@@ -3885,9 +3796,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "shutdown":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -3937,9 +3847,8 @@ class TestMain:
 
                 match procedure["operation"]:
                     case "connect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -3952,9 +3861,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "disconnect":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {
@@ -3967,9 +3875,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "boot":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert detail["requestBody"] == {"action": "on"}
@@ -3979,9 +3886,8 @@ class TestMain:
                         assert detail["endedAt"] is not None
 
                     case "shutdown":
-                        assert re.fullmatch(
-                            f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                            detail["uri"],
+                        assert (
+                            detail["uri"] == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                         )
                         assert "PUT" == detail["method"]
                         assert "queryParameter" not in detail
@@ -3999,26 +3905,15 @@ class TestMain:
         init_db_instance.commit()
         config = LayoutApplyConfig()
         config.load_log_configs()
-        uri = config.hardware_control.get("uri")
 
         err_msg = {"code": "xxxx", "message": "Internal Server Error."}
         err_code = 500
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_json(
-            err_msg, status=err_code
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_json(
-            err_msg, status=err_code
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_json(
-            err_msg, status=err_code
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_json(
-            err_msg, status=err_code
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_json(
-            err_msg, status=err_code
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{DEVICE_INFO_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=err_code)
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=err_code)
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=err_code)
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=err_code)
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=err_code)
+        httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_json(
             {"type": "CPU", "powerState": "Off", "powerCapability": False},
             status=200,
         )
@@ -4048,7 +3943,6 @@ class TestMain:
                 }
                 assert detail["startedAt"] is not None
                 assert detail["endedAt"] is not None
-        httpserver.clear()
 
     @pytest.mark.usefixtures("hardwaremgr_error_fixture")
     def test_cancel_run_status_failed_when_failed_single_migration_step(
@@ -4090,9 +3984,9 @@ class TestMain:
 
                     match procedure["operation"]:
                         case "connect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {
@@ -4106,9 +4000,9 @@ class TestMain:
                                 "message": "Internal Server Error.",
                             } == detail["responseBody"]
                         case "disconnect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {
@@ -4122,9 +4016,9 @@ class TestMain:
                                 "message": "Internal Server Error.",
                             } == detail["responseBody"]
                         case "boot":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {"action": "on"}
@@ -4139,9 +4033,9 @@ class TestMain:
                             #     f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
                             #     detail["uri"],
                             # )
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                             )
                             assert "PUT" == detail["method"]
                             assert "queryParameter" not in detail
@@ -4191,9 +4085,9 @@ class TestMain:
 
                     match procedure["operation"]:
                         case "connect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {
@@ -4209,9 +4103,9 @@ class TestMain:
                             assert detail["startedAt"] is not None
                             assert detail["endedAt"] is not None
                         case "disconnect":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/cpu/{procedure['targetCPUID']}/aggregations"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {
@@ -4227,9 +4121,9 @@ class TestMain:
                             assert detail["startedAt"] is not None
                             assert detail["endedAt"] is not None
                         case "boot":
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                             )
                             assert "PUT" == detail["method"]
                             assert detail["requestBody"] == {"action": "on"}
@@ -4246,9 +4140,9 @@ class TestMain:
                             #     f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
                             #     detail["uri"],
                             # )
-                            assert re.fullmatch(
-                                f"http:\/\/{host}:{port}\/{uri}\/{POWER_OPERATION_URL}",
-                                detail["uri"],
+                            assert (
+                                detail["uri"]
+                                == f"http://{host}:{port}/{uri}/devices/{procedure['targetDeviceID']}/power"
                             )
                             assert "PUT" == detail["method"]
                             assert "queryParameter" not in detail
@@ -4293,28 +4187,28 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "disconnect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 {
                     "operationID": 2,
                     "operation": "shutdown",
-                    "targetDeviceID": str(uuid4()),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [1],
                 },
                 {
                     "operationID": 3,
                     "operation": "connect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [2],
                 },
                 {
                     "operationID": 4,
                     "operation": "disconnect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [3],
                 },
             ],
@@ -4332,21 +4226,11 @@ class TestMain:
         logger = Logger(config.log_config)
         database = DbAccess(logger)
 
-        uri = config.hardware_control.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
             {"status": True, "IPAddress": "192.168.122.11"}, status=200
         )
 
@@ -4378,8 +4262,6 @@ class TestMain:
             {"operationID": 4, "status": "COMPLETED"},
         ]
 
-        httpserver.clear()
-
     def test_update_layoutapply_success_when_resume_rollback(
         self,
         httpserver: HTTPServer,
@@ -4404,28 +4286,28 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "disconnect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
                 {
                     "operationID": 2,
                     "operation": "shutdown",
-                    "targetDeviceID": str(uuid4()),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [1],
                 },
                 {
                     "operationID": 3,
                     "operation": "connect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [2],
                 },
                 {
                     "operationID": 4,
                     "operation": "disconnect",
-                    "targetCPUID": str(uuid4()),
-                    "targetDeviceID": str(uuid4()),
+                    "targetCPUID": fake_uuid(),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [3],
                 },
             ],
@@ -4443,21 +4325,11 @@ class TestMain:
         logger = Logger(config.log_config)
         database = DbAccess(logger)
 
-        uri = config.hardware_control.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT").respond_with_response(
-            Response("", status=200)
-        )
-        httpserver.expect_request(re.compile(f"\/{uri}\/{OS_BOOT_URL}"), method="GET").respond_with_json(
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_response(Response("", status=200))
+        httpserver.expect_request(OS_BOOT_PATTERN, method="GET").respond_with_json(
             {"status": True, "IPAddress": "192.168.122.11"}, status=200
         )
 
@@ -4476,7 +4348,6 @@ class TestMain:
             False,
             Action.ROLLBACK_RESUME,
         )
-        httpserver.clear()
         # assert
         with init_db_instance.cursor(cursor_factory=DictCursor) as cursor:
             cursor.execute(query=f"SELECT * FROM applystatus WHERE applyid = '{applyID}'")
@@ -4507,7 +4378,7 @@ class TestMain:
                 {
                     "operationID": 1,
                     "operation": "boot",
-                    "targetDeviceID": str(uuid4()),
+                    "targetDeviceID": fake_uuid(),
                     "dependencies": [],
                 },
             ],
@@ -4517,8 +4388,6 @@ class TestMain:
         config = LayoutApplyConfig()
         config.load_log_configs()
 
-        uri = config.hardware_control.get("uri")
-        get_information_uri = config.get_information.get("uri")
         config.hardware_control["poweron"]["timeout"] = 5
 
         # raise timeout by sleeping longer than the timeout duration (5s).
@@ -4528,23 +4397,16 @@ class TestMain:
             sleep(timeout_sec)
 
         err_msg = {"message": "Exxxxx", "code": "ER005BAS001"}
-        uri = config.hardware_control.get("uri")
         # Initial execution with 0 retries, executed only once.
-        httpserver.expect_request(
-            re.compile(f"\/{get_information_uri}\/{DEVICE_INFO_URL}"), method="GET"
-        ).respond_with_response(
+        httpserver.expect_request(DEVICE_INFO_PATTERN, method="GET").respond_with_response(
             Response(
                 response=b'{"type": "CPU", "powerState": "Off", "powerCapability": false}',
                 status=200,
             )
         )
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_handler(sleeping)
+        httpserver.expect_ordered_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_handler(sleeping)
         # message is not called.
-        httpserver.expect_ordered_request(
-            re.compile(f"\/{uri}\/{POWER_OPERATION_URL}"), method="PUT"
-        ).respond_with_json(err_msg, status=503)
+        httpserver.expect_ordered_request(POWER_OPERATION_PATTERN, method="PUT").respond_with_json(err_msg, status=503)
 
         procedures = {"procedures": param["procedures"]}
         # Data adjustment before testing.
@@ -4558,7 +4420,6 @@ class TestMain:
             cursor.execute(query=SELECT_SQL, vars=[applyid])
             init_db_instance.commit()
             row = cursor.fetchone()
-        httpserver.clear()
 
         if row.get("status") == "IN_PROGRESS":
             assert row.get("status") == "IN_PROGRESS"
@@ -15,7 +15,6 @@
 
 import json
 import logging
-import re
 from logging import ERROR
 
 import pytest
@@ -26,7 +25,7 @@ from werkzeug import Response
 from layoutapply.common.logger import Logger
 from layoutapply.const import ApiUri
 from layoutapply.migration_apiclient import ConfigManagerAPI, GetAvailableResourcesAPI, MigrationAPI
-from layoutapply.setting import LayoutApplyConfig, LayoutApplyLogConfig
+from tests.layoutapply.conftest import AVAILABLE_RESOURCES_PATTERN, MIGRATION_PROCEDURES_PATTERN, NODES_PATTERN
 from tests.layoutapply.test_data.migration import (
     CONF_NODES_API_RESP_DATA,
     GET_AVAILABLE_RESOURCES_API_RESP,
@@ -80,30 +79,29 @@ def get_migration_layout() -> dict:
 
 
 class TestMigrationClient:
-    def test_execute_migrationproc_success(self, httpserver: HTTPServer, get_migration_layout, docker_services):
+    def test_execute_migrationproc_success(
+        self, httpserver: HTTPServer, get_migration_layout, docker_services, layout_config
+    ):
         # arrange
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         api = MigrationAPI(logger, config.migration_procedure, config.server_connection, get_migration_layout)
 
-        uri = config.migration_procedure.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/migration-procedures"), method="POST").respond_with_response(
+        httpserver.expect_request(MIGRATION_PROCEDURES_PATTERN, method="POST").respond_with_response(
             Response(bytes(json.dumps(MIGRATION_API_RESP_DATA), encoding="utf-8"), status=200)
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 200
         assert body == MIGRATION_API_RESP_DATA
 
     def test_execute_migrationproc_failure_when_non_200_status_code(
-        self, httpserver: HTTPServer, get_migration_layout, caplog, mocker, docker_services
+        self, httpserver: HTTPServer, get_migration_layout, caplog, mocker, docker_services, layout_config
     ):
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
 
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
@@ -111,13 +109,12 @@ class TestMigrationClient:
         logger.setLevel(logging.ERROR)
         api = MigrationAPI(logger, config.migration_procedure, config.server_connection, get_migration_layout)
 
-        uri = config.migration_procedure.get("uri")
         api_err_msg = {
             "code": "xxxx",
             "message": "desiredLayout is a required property.",
         }
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/migration-procedures"), method="POST").respond_with_response(
+        httpserver.expect_request(MIGRATION_PROCEDURES_PATTERN, method="POST").respond_with_response(
             Response(
                 bytes(json.dumps(api_err_msg), encoding="utf-8"),
                 status=500,
@@ -125,17 +122,18 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 500
         assert body.get("code") == "E50004"
         assert body.get("message") == f"Failed to request: status:[500], response[{api_err_msg}]"
         assert "[E50004]Failed to request:" in caplog.text
 
-    def test_execute_migrationproc_failure_when_timed_out(self, get_migration_layout, caplog, mocker, docker_services):
+    def test_execute_migrationproc_failure_when_timed_out(
+        self, get_migration_layout, caplog, mocker, docker_services, layout_config
+    ):
         mocker.patch.object(MigrationAPI, "_requests").side_effect = exceptions.ConnectTimeout("Log Error")
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
@@ -150,11 +148,11 @@ class TestMigrationClient:
         assert "[E50003]Timeout: Could not connect to server." in caplog.text
 
     def test_execute_migrationproc_failure_when_invalid_request_target(
-        self, get_migration_layout, caplog, mocker, docker_services
+        self, get_migration_layout, caplog, mocker, docker_services, layout_config
     ):
         mocker.patch.object(MigrationAPI, "_post").side_effect = exceptions.ConnectionError("Log Error")
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
@@ -174,11 +172,11 @@ class TestMigrationClient:
         assert f"[E50006]Connection error occurred. Please check if the URL is correct. {request_uri}" in caplog.text
 
     def test_execute_migrationproc_failure_when_request_failure_occurred(
-        self, get_migration_layout, caplog, mocker, docker_services
+        self, get_migration_layout, caplog, mocker, docker_services, layout_config
     ):
         mocker.patch.object(MigrationAPI, "_requests").side_effect = exceptions.RequestException("Log Error")
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
@@ -192,15 +190,13 @@ class TestMigrationClient:
         assert body.get("message") == "Unexpected requests error occurred.Log Error"
         assert "[E50007]Unexpected requests error occurred.Log Error" in caplog.text
 
-    def test_execute_configmgr_success(self, httpserver: HTTPServer, docker_services):
+    def test_execute_configmgr_success(self, httpserver: HTTPServer, docker_services, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        logger = Logger(LayoutApplyLogConfig().log_config)
+        config = layout_config
+        logger = Logger(config.log_config)
         api = ConfigManagerAPI(logger, config.configuration_manager, config.server_connection)
 
-        uri = config.configuration_manager.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/nodes"), method="GET").respond_with_response(
+        httpserver.expect_request(NODES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(CONF_NODES_API_RESP_DATA), encoding="utf-8"),
                 status=200,
@@ -208,24 +204,24 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 200
         assert body == CONF_NODES_API_RESP_DATA
 
-    def test_execute_configmgr_success_when_empty_response(self, httpserver: HTTPServer, docker_services):
+    def test_execute_configmgr_success_when_empty_response(
+        self, httpserver: HTTPServer, docker_services, layout_config
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        logger = Logger(LayoutApplyLogConfig().log_config)
+        config = layout_config
+        logger = Logger(config.log_config)
         api = ConfigManagerAPI(logger, config.configuration_manager, config.server_connection)
 
-        uri = config.configuration_manager.get("uri")
         conf_empty_nodes = {
             "count": 0,
             "nodes": [],
         }
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/nodes"), method="GET").respond_with_response(
+        httpserver.expect_request(NODES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(conf_empty_nodes), encoding="utf-8"),
                 status=200,
@@ -233,7 +229,6 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 200
         assert body == conf_empty_nodes
@@ -472,20 +467,18 @@ class TestMigrationClient:
         ],
     )
     def test_execute_configmgr_success_when_invalid_response(
-        self, httpserver: HTTPServer, resp_data, caplog, mocker, docker_services
+        self, httpserver: HTTPServer, resp_data, caplog, mocker, docker_services, layout_config
     ):
         # arrange
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
         api = ConfigManagerAPI(logger, config.configuration_manager, config.server_connection)
 
-        uri = config.configuration_manager.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/nodes"), method="GET").respond_with_response(
+        httpserver.expect_request(NODES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(resp_data), encoding="utf-8"),
                 status=200,
@@ -493,30 +486,28 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 400
         assert body.get("code") == "E50001"
         assert "[E50001]" in caplog.text
 
     def test_execute_configmgr_failure_when_non_200_status_code(
-        self, httpserver: HTTPServer, caplog, mocker, docker_services
+        self, httpserver: HTTPServer, caplog, mocker, docker_services, layout_config
     ):
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
         logger.setLevel(logging.ERROR)
         api = ConfigManagerAPI(logger, config.configuration_manager, config.server_connection)
 
-        uri = config.configuration_manager.get("uri")
         api_err_msg = {
             "code": "xxxx",
             "message": "Failed to access to DB",
         }
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/nodes"), method="GET").respond_with_response(
+        httpserver.expect_request(NODES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(api_err_msg), encoding="utf-8"),
                 status=500,
@@ -524,17 +515,16 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 500
         assert body.get("code") == "E50004"
         assert body.get("message") == f"Failed to request: status:[500], response[{api_err_msg}]"
         assert "[E50004]Failed to request: " in caplog.text
 
-    def test_execute_configmgr_failure_when_timed_out(self, caplog, mocker, docker_services):
+    def test_execute_configmgr_failure_when_timed_out(self, caplog, mocker, docker_services, layout_config):
         mocker.patch.object(ConfigManagerAPI, "_requests").side_effect = exceptions.ConnectTimeout("Log Error")
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
@@ -548,10 +538,12 @@ class TestMigrationClient:
         assert body.get("message") == "Timeout: Could not connect to server."
         assert "[E50003]Timeout: Could not connect to server." in caplog.text
 
-    def test_execute_configmgr_failure_when_invalid_request_target(self, caplog, mocker, docker_services):
+    def test_execute_configmgr_failure_when_invalid_request_target(
+        self, caplog, mocker, docker_services, layout_config
+    ):
         mocker.patch.object(ConfigManagerAPI, "_get").side_effect = exceptions.ConnectionError("Log Error")
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
@@ -570,10 +562,12 @@ class TestMigrationClient:
         assert body.get("message") == f"Connection error occurred. Please check if the URL is correct. {request_uri}"
         assert f"[E50006]Connection error occurred. Please check if the URL is correct. {request_uri}" in caplog.text
 
-    def test_execute_configmgr_failure_when_request_failure_occurred(self, caplog, mocker, docker_services):
+    def test_execute_configmgr_failure_when_request_failure_occurred(
+        self, caplog, mocker, docker_services, layout_config
+    ):
         mocker.patch.object(ConfigManagerAPI, "_requests").side_effect = exceptions.RequestException("Log Error")
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
@@ -587,15 +581,13 @@ class TestMigrationClient:
         assert body.get("message") == "Unexpected requests error occurred.Log Error"
         assert "[E50007]Unexpected requests error occurred.Log Error" in caplog.text
 
-    def test_execute_get_available_resources_success(self, httpserver: HTTPServer, docker_services):
+    def test_execute_get_available_resources_success(self, httpserver: HTTPServer, docker_services, layout_config):
         # arrange
-        config = LayoutApplyConfig()
-        logger = Logger(LayoutApplyLogConfig().log_config)
+        config = layout_config
+        logger = Logger(config.log_config)
         api = GetAvailableResourcesAPI(logger, config.configuration_manager, config.server_connection)
 
-        uri = config.configuration_manager.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/resources/available"), method="GET").respond_with_response(
+        httpserver.expect_request(AVAILABLE_RESOURCES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(GET_AVAILABLE_RESOURCES_API_RESP), encoding="utf-8"),
                 status=200,
@@ -603,20 +595,19 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 200
         assert body == GET_AVAILABLE_RESOURCES_API_RESP
 
-    def test_execute_get_available_resources_success_multi(self, httpserver: HTTPServer, docker_services):
+    def test_execute_get_available_resources_success_multi(
+        self, httpserver: HTTPServer, docker_services, layout_config
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        logger = Logger(LayoutApplyLogConfig().log_config)
+        config = layout_config
+        logger = Logger(config.log_config)
         api = GetAvailableResourcesAPI(logger, config.configuration_manager, config.server_connection)
 
-        uri = config.configuration_manager.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/resources/available"), method="GET").respond_with_response(
+        httpserver.expect_request(AVAILABLE_RESOURCES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(GET_AVAILABLE_RESOURCES_API_RESP_MULTI), encoding="utf-8"),
                 status=200,
@@ -624,24 +615,24 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 200
         assert body == GET_AVAILABLE_RESOURCES_API_RESP_MULTI
 
-    def test_execute_get_available_resources_success_when_empty_response(self, httpserver: HTTPServer, docker_services):
+    def test_execute_get_available_resources_success_when_empty_response(
+        self, httpserver: HTTPServer, docker_services, layout_config
+    ):
         # arrange
-        config = LayoutApplyConfig()
-        logger = Logger(LayoutApplyLogConfig().log_config)
+        config = layout_config
+        logger = Logger(config.log_config)
         api = GetAvailableResourcesAPI(logger, config.configuration_manager, config.server_connection)
 
-        uri = config.configuration_manager.get("uri")
         conf_empty_nodes = {
             "count": 0,
             "resources": [],
         }
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/resources/available"), method="GET").respond_with_response(
+        httpserver.expect_request(AVAILABLE_RESOURCES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(conf_empty_nodes), encoding="utf-8"),
                 status=200,
@@ -649,7 +640,6 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 200
         assert body == conf_empty_nodes
@@ -861,20 +851,18 @@ class TestMigrationClient:
         ],
     )
     def test_execute_get_available_resources_success_when_invalid_response(
-        self, httpserver: HTTPServer, resp_data, caplog, mocker, docker_services
+        self, httpserver: HTTPServer, resp_data, caplog, mocker, docker_services, layout_config
     ):
         mocker.patch("logging.config.dictConfig")
         # arrange
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
         logger.setLevel(ERROR)
         api = GetAvailableResourcesAPI(logger, config.configuration_manager, config.server_connection)
 
-        uri = config.configuration_manager.get("uri")
-
-        httpserver.expect_request(re.compile(f"\/{uri}\/resources/available"), method="GET").respond_with_response(
+        httpserver.expect_request(AVAILABLE_RESOURCES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(resp_data), encoding="utf-8"),
                 status=200,
@@ -882,17 +870,16 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 400
         assert body.get("code") == "E50001"
         assert "[E50001]" in caplog.text
 
     def test_execute_get_available_resources_failure_when_non_200_status_code(
-        self, httpserver: HTTPServer, caplog, mocker, docker_services
+        self, httpserver: HTTPServer, caplog, mocker, docker_services, layout_config
     ):
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
@@ -900,13 +887,12 @@ class TestMigrationClient:
 
         api = GetAvailableResourcesAPI(logger, config.configuration_manager, config.server_connection)
 
-        uri = config.configuration_manager.get("uri")
         api_err_msg = {
             "code": "xxxx",
             "message": "Failed to access to DB",
         }
 
-        httpserver.expect_request(re.compile(f"\/{uri}\/resources/available"), method="GET").respond_with_response(
+        httpserver.expect_request(AVAILABLE_RESOURCES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(api_err_msg), encoding="utf-8"),
                 status=500,
@@ -914,17 +900,18 @@ class TestMigrationClient:
         )
 
         code, body = api.execute()
-        httpserver.clear()
         # assert
         assert code == 500
         assert body.get("code") == "E50004"
         assert body.get("message") == f"Failed to request: status:[500], response[{api_err_msg}]"
         assert "[E50004]Failed to request:" in caplog.text
 
-    def test_execute_get_available_resources_failure_when_timed_out(self, caplog, mocker, docker_services):
+    def test_execute_get_available_resources_failure_when_timed_out(
+        self, caplog, mocker, docker_services, layout_config
+    ):
         mocker.patch.object(GetAvailableResourcesAPI, "_requests").side_effect = exceptions.ConnectTimeout("Log Error")
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
@@ -939,10 +926,12 @@ class TestMigrationClient:
         assert body.get("message") == "Timeout: Could not connect to server."
         assert "[E50003]Timeout: Could not connect to server." in caplog.text
 
-    def test_execute_get_available_resources_failure_when_invalid_request_target(self, caplog, mocker, docker_services):
+    def test_execute_get_available_resources_failure_when_invalid_request_target(
+        self, caplog, mocker, docker_services, layout_config
+    ):
         mocker.patch.object(GetAvailableResourcesAPI, "_get").side_effect = exceptions.ConnectionError("Log Error")
         mocker.patch("logging.config.dictConfig")
-        config = LayoutApplyConfig()
+        config = layout_config
         logger = logging.getLogger("logger.py")
         logger.handlers.clear()
         logger.addHandler(caplog.handler)
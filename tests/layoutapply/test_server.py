@@ -38,7 +38,7 @@ from layoutapply.db import DbAccess
 from layoutapply.server import _exec_subprocess, _initialize, app, main
 from layoutapply.setting import LayoutApplyConfig, LayoutApplyLogConfig
 from layoutapply.util import create_randomname
-from tests.layoutapply.conftest import CONF_NODES_URL
+from tests.layoutapply.conftest import NODES_PATTERN
 from tests.layoutapply.test_data import checkvalid, migration, procedure, sql
 
 client = TestClient(app)
@@ -2965,7 +2965,7 @@ class TestMigrateAPIServer:
     ):
         mocker.patch("logging.config.dictConfig")
 
-        httpserver.expect_request(re.compile(rf"\/cdim/api\/v1\/{CONF_NODES_URL}"), method="GET").respond_with_response(
+        httpserver.expect_request(NODES_PATTERN, method="GET").respond_with_response(
             Response(
                 bytes(json.dumps(migration.CONF_NODES_API_RESP_DATA), encoding="utf-8"),
                 status=200,
@@ -2978,7 +2978,6 @@ class TestMigrateAPIServer:
             "code": "xxxx",
             "message": "desiredLayout is a required property.",
         }
-        httpserver.clear()
 
         # assert
         assert body.get("code") == "E50004"
@@ -13,16 +13,14 @@
 #  under the License.
 """Test of the API Client Package"""
 
-
+import copy
 import io
 import json
 import logging
 import logging.config
-import re
-import types
+from dataclasses import replace
 from logging import ERROR
 from time import sleep
-from uuid import uuid4
 
 import pytest
 import requests
@@ -37,16 +35,21 @@ from layoutapply.service_apiclient import ExtendedProcedureAPIBase, GetServiceIn
 from layoutapply.setting import LayoutApplyConfig, LayoutApplyLogConfig
 from tests.layoutapply.conftest import (
     EXTENDED_PROCEDURE_ID,
-    WORKFLOW_MANAGER_HOST,
-    WORKFLOW_MANAGER_PORT,
-    WORKFLOW_MANAGER_URI,
+    EXTENDED_PROCEDURE_PATTERN,
+    EXTENDED_PROCEDURE_STATUS_PATTERN,
+    fake_uuid,
 )
 
+# Procedure shared by the tests, each of which only replaces the target IDs.
+# The stop tests also replace the operation.
+PROCEDURE_TEMPLATE = Procedure(operationID=1, operation="start", dependencies=[])
+
 
 class TestServiceAPIBase:
     @pytest.fixture(autouse=True)
-    def setup_config(self, httpserver):
-        config = LayoutApplyConfig()
+    def setup_config(self, httpserver, layout_config):
+        # The tests change the workflow manager settings, so each one works on its own copy.
+        config = copy.deepcopy(layout_config)
         config.workflow_manager["host"] = httpserver.host
         config.workflow_manager["port"] = httpserver.port
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 1
@@ -56,36 +59,30 @@ class TestServiceAPIBase:
 
         self.config = config
 
-    def test_service_can_request_to_start_api(self, httpserver, capsys, init_db_instance):
+    def test_service_can_request_to_start_api(self, httpserver, capsys):
         # arrange
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -93,7 +90,7 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "COMPLETED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -101,7 +98,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -111,33 +107,27 @@ class TestServiceAPIBase:
         assert result.status == "COMPLETED"
         assert result.statusCode == 202
 
-    def test_service_request_to_start_api_when_failed_to_load_the_logs(
-        self, mocker, httpserver, capfd, init_db_instance
-    ):
+    def test_service_request_to_start_api_when_failed_to_load_the_logs(self, mocker, httpserver, capfd):
         # arrange
         config = self.config
 
         mocker.patch.object(
             Logger, "__init__", side_effect=Exception("Internal server error. Failed in log initialization")
         )
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
         # act
@@ -153,7 +143,7 @@ class TestServiceAPIBase:
             in err
         )
 
-    def test_service_request_to_start_api_when_retry_success(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_retry_success(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -164,24 +154,20 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["retry"]["default"]["max_count"] = 3
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
         call_count = 0
@@ -213,13 +199,9 @@ class TestServiceAPIBase:
                     response=json.dumps(response_data), status=202, headers={"Content-Type": "application/json"}
                 )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_handler(custom_handler)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_handler(custom_handler)
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -227,7 +209,7 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "COMPLETED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -235,7 +217,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "COMPLETED"
@@ -243,7 +224,7 @@ class TestServiceAPIBase:
         assert result.queryParameter == ""
         assert result.responseBody == {"extendedProcedureID": f"{EXTENDED_PROCEDURE_ID}"}
 
-    def test_service_request_to_start_api_when_recieve_500_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_recieve_500_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -253,29 +234,23 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "code": "150001",
                 "message": "Error occured when calling another REST API internally",
@@ -291,9 +266,7 @@ class TestServiceAPIBase:
             },
             status=500,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "code": "150001",
                 "message": "Error occured when calling another REST API internally",
@@ -313,7 +286,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -334,7 +306,7 @@ class TestServiceAPIBase:
         }
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_start_api_when_recieve_503_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_recieve_503_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -344,35 +316,27 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {},
             status=503,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {},
             status=503,
         )
@@ -380,7 +344,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -389,7 +352,7 @@ class TestServiceAPIBase:
         assert result.responseBody == {}
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_start_api_when_recieve_404_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_recieve_404_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -399,37 +362,32 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"code": "340402", "message": f"targetCPUID {hostCpuId} not found"}, status=404)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"code": "340402", "message": f"targetCPUID {hostCpuId} not found"}, status=404)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"code": "340402", "message": f"targetCPUID {hostCpuId} not found"}, status=404
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"code": "340402", "message": f"targetCPUID {hostCpuId} not found"}, status=404
+        )
 
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -441,7 +399,7 @@ class TestServiceAPIBase:
         }
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_start_api_when_recieve_409_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_recieve_409_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -451,38 +409,30 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "code": "340901",
                 "message": f"Another extended procedure for the same instance already running: targetRequestInstanceID={targetRequestInstanceID}",
             },
             status=409,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "code": "340901",
                 "message": f"Another extended procedure for the same instance already running: targetRequestInstanceID={targetRequestInstanceID}",
@@ -493,7 +443,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -505,7 +454,7 @@ class TestServiceAPIBase:
         }
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_start_api_when_recieve_422_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_recieve_422_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -516,37 +465,32 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["retry"]["default"]["max_count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}, status=422)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}, status=422)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}, status=422
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}, status=422
+        )
 
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -555,7 +499,7 @@ class TestServiceAPIBase:
         assert result.responseBody == {"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_start_api_when_time_out(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_time_out(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -568,38 +512,31 @@ class TestServiceAPIBase:
         workflow_manager_conf = config.workflow_manager.copy()
         workflow_manager_conf["timeout"] = timeout_sec
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": workflow_manager_conf,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
         def sleeping(request: Request):
-            sleep(timeout_sec + 5)  # Timeout value + 5-second delay
+            sleep(timeout_sec + 1)  # Timeout value + 1-second delay
             return Response("", status=200)
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_handler(sleeping)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_handler(sleeping)
 
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -611,7 +548,7 @@ class TestServiceAPIBase:
         }
         assert "[E40003]Timeout: Could not connect to server." in caplog.text
 
-    def test_service_request_to_start_api_when_connection_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_connection_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -621,32 +558,25 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
         mocker.patch.object(api_obj, "recent_request_uri", "http://10.000.111.111:8000/test")
 
-        def _requests(self, payload):
-            raise exceptions.ConnectionError()
-
-        api_obj._requests = types.MethodType(_requests, api_obj)
+        mocker.patch.object(api_obj, "_requests", side_effect=exceptions.ConnectionError())
 
         # act
         execute_result = api_obj.execute(paylod)
@@ -662,7 +592,7 @@ class TestServiceAPIBase:
         assert result.status == "FAILED"
         assert "Connection error occurred. Please check if the URL is correct." in caplog.text
 
-    def test_service_request_to_start_api_when_request_exception(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_request_exception(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -672,32 +602,23 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        mocker.patch.object(api_obj, "_requests", side_effect=exceptions.RequestException("Unexpected error"))
-
-        def _requests(self, payload):
-            raise exceptions.RequestException()
-
-        api_obj._requests = types.MethodType(_requests, api_obj)
+        mocker.patch.object(api_obj, "_requests", side_effect=exceptions.RequestException())
 
         # act
         execute_result = api_obj.execute(paylod)
@@ -713,7 +634,7 @@ class TestServiceAPIBase:
         assert result.status == "FAILED"
         assert "[E40008]Unexpected requests error occurred." in caplog.text
 
-    def test_service_request_to_start_api_when_polling_success(self, httpserver, mocker, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_polling_success(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -724,29 +645,25 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
 
         call_count = 0
 
@@ -762,7 +679,7 @@ class TestServiceAPIBase:
                     "operation": "start",
                     "id": EXTENDED_PROCEDURE_ID,
                     "status": "IN_PROGRESS",
-                    "serviceInstanceID": str(uuid4()),
+                    "serviceInstanceID": fake_uuid(),
                 }
             else:
                 response_data = {
@@ -772,21 +689,20 @@ class TestServiceAPIBase:
                     "operation": "start",
                     "id": EXTENDED_PROCEDURE_ID,
                     "status": "COMPLETED",
-                    "serviceInstanceID": str(uuid4()),
+                    "serviceInstanceID": fake_uuid(),
                 }
 
             return Response(
                 response=json.dumps(response_data), status=200, headers={"Content-Type": "application/json"}
             )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_handler(custom_get_handler)
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_handler(
+            custom_get_handler
+        )
 
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -796,7 +712,7 @@ class TestServiceAPIBase:
         assert result.status == "COMPLETED"
         assert result.statusCode == 202
 
-    def test_service_request_to_start_api_when_polling_exceeded(self, httpserver, mocker, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_polling_exceeded(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -807,32 +723,26 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -840,13 +750,11 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "IN_PROGRESS",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -854,7 +762,7 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "IN_PROGRESS",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -862,7 +770,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -879,9 +786,7 @@ class TestServiceAPIBase:
             in caplog.text
         )
 
-    def test_service_request_to_start_api_when_GetServiceInfo_receive_FAILED(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_start_api_when_GetServiceInfo_receive_FAILED(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -891,32 +796,26 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -924,7 +823,7 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "FAILED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -932,7 +831,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -949,9 +847,7 @@ class TestServiceAPIBase:
             in caplog.text
         )
 
-    def test_service_request_to_start_api_when_polling_receive_FAILED(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_start_api_when_polling_receive_FAILED(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -962,32 +858,26 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -995,13 +885,11 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "FAILED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -1009,7 +897,7 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "FAILED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -1017,7 +905,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -1034,9 +921,7 @@ class TestServiceAPIBase:
             in caplog.text
         )
 
-    def test_service_request_to_start_api_when_polling_receive_404_error(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_start_api_when_polling_receive_404_error(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1047,32 +932,26 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {"code": "340401", "message": f"Extended procedure {EXTENDED_PROCEDURE_ID} not found"},
             status=404,
         )
@@ -1080,7 +959,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -1094,9 +972,7 @@ class TestServiceAPIBase:
         assert result.statusCode == 202
         assert "[E40034]Failed to get extended process information." in caplog.text
 
-    def test_service_request_to_start_api_when_polling_receive_422_error(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_start_api_when_polling_receive_422_error(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1107,32 +983,26 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]},
             status=422,
         )
@@ -1140,7 +1010,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -1154,9 +1023,7 @@ class TestServiceAPIBase:
         assert result.statusCode == 202
         assert "[E40034]Failed to get extended process information." in caplog.text
 
-    def test_service_request_to_start_api_when_polling_receive_500_error(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_start_api_when_polling_receive_500_error(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1167,32 +1034,26 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {},
             status=500,
         )
@@ -1200,7 +1061,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -1214,7 +1074,7 @@ class TestServiceAPIBase:
         assert result.statusCode == 202
         assert "[E40034]Failed to get extended process information." in caplog.text
 
-    def test_service_request_to_start_api_when_validate_error(self, httpserver, mocker, caplog, init_db_instance):
+    def test_service_request_to_start_api_when_validate_error(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1224,32 +1084,26 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -1257,7 +1111,7 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "dummy",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -1265,7 +1119,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -1278,7 +1131,7 @@ class TestServiceAPIBase:
 
         assert "[E40001]'dummy' is not one of ['IN_PROGRESS', 'COMPLETED', 'FAILED']" in caplog.text
 
-    def test_start_api_without_extended_procedure_id(self, httpserver, mocker, caplog, init_db_instance):
+    def test_start_api_without_extended_procedure_id(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1289,30 +1142,24 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StartAPI = StartAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
 
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        procedure = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        procedure = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "message": "Request accepted",
                 # The response does not contain the extendedProcedureID.
@@ -1331,36 +1178,28 @@ class TestServiceAPIBase:
         assert "extendedProcedureID:" not in caplog.text
         assert api_obj.get_service_api.extended_procedure_id is None
 
-    def test_service_can_request_to_stop_api(self, httpserver, init_db_instance):
+    def test_service_can_request_to_stop_api(self, httpserver):
         # arrange
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -1368,7 +1207,7 @@ class TestServiceAPIBase:
                 "operation": "stop",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "COMPLETED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -1376,7 +1215,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -1386,33 +1224,25 @@ class TestServiceAPIBase:
         assert result.status == "COMPLETED"
         assert result.statusCode == 202
 
-    def test_service_can_request_to_stop_api_when_failed_to_load_the_logs(
-        self, mocker, httpserver, capfd, init_db_instance
-    ):
+    def test_service_can_request_to_stop_api_when_failed_to_load_the_logs(self, mocker, httpserver, capfd):
         # arrange
         config = self.config
 
         mocker.patch.object(
             Logger, "__init__", side_effect=Exception("Internal server error. Failed in log initialization")
         )
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
         # act
@@ -1428,7 +1258,7 @@ class TestServiceAPIBase:
             in err
         )
 
-    def test_service_request_to_stop_api_when_retry_success(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_retry_success(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1440,24 +1270,18 @@ class TestServiceAPIBase:
         config.workflow_manager["extended-procedure"]["retry"]["default"]["max_count"] = 2
         config.workflow_manager["extended-procedure"]["retry"]["default"]["interval"] = 1
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
         call_count = 0
@@ -1489,13 +1313,9 @@ class TestServiceAPIBase:
                     response=json.dumps(response_data), status=202, headers={"Content-Type": "application/json"}
                 )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_handler(custom_handler)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_handler(custom_handler)
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -1503,7 +1323,7 @@ class TestServiceAPIBase:
                 "operation": "stop",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "COMPLETED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -1511,7 +1331,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "COMPLETED"
@@ -1519,7 +1338,7 @@ class TestServiceAPIBase:
         assert result.queryParameter == ""
         assert result.responseBody == {"extendedProcedureID": f"{EXTENDED_PROCEDURE_ID}"}
 
-    def test_service_request_to_stop_api_when_recieve_500_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_recieve_500_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1529,29 +1348,21 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "code": "150001",
                 "message": "Error occured when calling another REST API internally",
@@ -1567,9 +1378,7 @@ class TestServiceAPIBase:
             },
             status=500,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "code": "150001",
                 "message": "Error occured when calling another REST API internally",
@@ -1589,7 +1398,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -1610,7 +1418,7 @@ class TestServiceAPIBase:
         }
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_stop_api_when_recieve_503_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_recieve_503_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1620,35 +1428,25 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {},
             status=503,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {},
             status=503,
         )
@@ -1656,7 +1454,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -1665,7 +1462,7 @@ class TestServiceAPIBase:
         assert result.responseBody == {}
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_stop_api_when_recieve_404_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_recieve_404_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1678,37 +1475,30 @@ class TestServiceAPIBase:
         config.workflow_manager["extended-procedure"]["retry"]["default"]["max_count"] = 2
         config.workflow_manager["extended-procedure"]["retry"]["default"]["interval"] = 1
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"code": "340402", "message": f"targetCPUID {hostCpuId} not found"}, status=404)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"code": "340402", "message": f"targetCPUID {hostCpuId} not found"}, status=404)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"code": "340402", "message": f"targetCPUID {hostCpuId} not found"}, status=404
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"code": "340402", "message": f"targetCPUID {hostCpuId} not found"}, status=404
+        )
 
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -1720,7 +1510,7 @@ class TestServiceAPIBase:
         }
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_stop_api_when_recieve_409_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_recieve_409_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1733,38 +1523,28 @@ class TestServiceAPIBase:
         config.workflow_manager["extended-procedure"]["retry"]["default"]["max_count"] = 2
         config.workflow_manager["extended-procedure"]["retry"]["default"]["interval"] = 1
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "code": "340901",
                 "message": f"Another extended procedure for the same instance already running: targetRequestInstanceID={targetRequestInstanceID}",
             },
             status=409,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "code": "340901",
                 "message": f"Another extended procedure for the same instance already running: targetRequestInstanceID={targetRequestInstanceID}",
@@ -1775,7 +1555,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -1787,7 +1566,7 @@ class TestServiceAPIBase:
         }
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_stop_api_when_recieve_422_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_recieve_422_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1800,37 +1579,30 @@ class TestServiceAPIBase:
         config.workflow_manager["extended-procedure"]["retry"]["default"]["max_count"] = 2
         config.workflow_manager["extended-procedure"]["retry"]["default"]["interval"] = 1
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}, status=422)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}, status=422)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}, status=422
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}, status=422
+        )
 
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -1839,7 +1611,7 @@ class TestServiceAPIBase:
         assert result.responseBody == {"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]}
         assert "[E40025]A serious error has occurred. It suspends processing." in caplog.text
 
-    def test_service_request_to_stop_api_when_time_out(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_time_out(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1852,38 +1624,29 @@ class TestServiceAPIBase:
         workflow_manager_conf = config.workflow_manager.copy()
         workflow_manager_conf["timeout"] = timeout_sec
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": workflow_manager_conf,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
         def sleeping(request: Request):
-            sleep(timeout_sec + 5)  # Timeout value + 5-second delay
+            sleep(timeout_sec + 1)  # Timeout value + 1-second delay
             return Response("", status=202)
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_handler(sleeping)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_handler(sleeping)
 
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -1895,7 +1658,7 @@ class TestServiceAPIBase:
         }
         assert "[E40003]Timeout: Could not connect to server." in caplog.text
 
-    def test_service_request_to_stop_api_when_connection_error(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_connection_error(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1908,32 +1671,23 @@ class TestServiceAPIBase:
         config.workflow_manager["extended-procedure"]["retry"]["default"]["max_count"] = 2
         config.workflow_manager["extended-procedure"]["retry"]["default"]["interval"] = 1
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
         mocker.patch.object(api_obj, "recent_request_uri", "http://10.000.111.111:8000/test")
 
-        def _requests(self, payload):
-            raise exceptions.ConnectionError()
-
-        api_obj._requests = types.MethodType(_requests, api_obj)
+        mocker.patch.object(api_obj, "_requests", side_effect=exceptions.ConnectionError())
 
         # act
         execute_result = api_obj.execute(paylod)
@@ -1950,7 +1704,7 @@ class TestServiceAPIBase:
         assert result.status == "FAILED"
         assert "Connection error occurred. Please check if the URL is correct." in caplog.text
 
-    def test_service_request_to_stop_api_when_request_exception(self, mocker, httpserver, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_request_exception(self, mocker, httpserver, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -1963,32 +1717,21 @@ class TestServiceAPIBase:
         config.workflow_manager["extended-procedure"]["retry"]["default"]["max_count"] = 2
         config.workflow_manager["extended-procedure"]["retry"]["default"]["interval"] = 1
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        mocker.patch.object(api_obj, "_requests", side_effect=exceptions.RequestException("Unexpected error"))
-
-        def _requests(self, payload):
-            raise exceptions.RequestException()
-
-        api_obj._requests = types.MethodType(_requests, api_obj)
+        mocker.patch.object(api_obj, "_requests", side_effect=exceptions.RequestException())
 
         # act
         execute_result = api_obj.execute(paylod)
@@ -2004,7 +1747,7 @@ class TestServiceAPIBase:
         assert result.status == "FAILED"
         assert "[E40008]Unexpected requests error occurred." in caplog.text
 
-    def test_service_request_to_stop_api_when_polling_success(self, httpserver, mocker, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_polling_success(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2015,29 +1758,23 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
 
         call_count = 0
 
@@ -2053,7 +1790,7 @@ class TestServiceAPIBase:
                     "operation": "stop",
                     "id": EXTENDED_PROCEDURE_ID,
                     "status": "IN_PROGRESS",
-                    "serviceInstanceID": str(uuid4()),
+                    "serviceInstanceID": fake_uuid(),
                 }
             else:
                 response_data = {
@@ -2063,21 +1800,20 @@ class TestServiceAPIBase:
                     "operation": "stop",
                     "id": EXTENDED_PROCEDURE_ID,
                     "status": "COMPLETED",
-                    "serviceInstanceID": str(uuid4()),
+                    "serviceInstanceID": fake_uuid(),
                 }
 
             return Response(
                 response=json.dumps(response_data), status=200, headers={"Content-Type": "application/json"}
             )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_handler(custom_get_handler)
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_handler(
+            custom_get_handler
+        )
 
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -2087,7 +1823,7 @@ class TestServiceAPIBase:
         assert result.status == "COMPLETED"
         assert result.statusCode == 202
 
-    def test_service_request_to_stop_api_when_polling_exceeded(self, httpserver, mocker, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_polling_exceeded(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2098,32 +1834,24 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -2131,13 +1859,11 @@ class TestServiceAPIBase:
                 "operation": "stop",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "IN_PROGRESS",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -2145,7 +1871,7 @@ class TestServiceAPIBase:
                 "operation": "stop",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "IN_PROGRESS",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -2153,7 +1879,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -2170,9 +1895,7 @@ class TestServiceAPIBase:
             in caplog.text
         )
 
-    def test_service_request_to_stop_api_when_GetServiceInfo_receive_FAILED(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_stop_api_when_GetServiceInfo_receive_FAILED(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2182,32 +1905,24 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -2215,7 +1930,7 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "FAILED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -2223,7 +1938,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -2240,9 +1954,7 @@ class TestServiceAPIBase:
             in caplog.text
         )
 
-    def test_service_request_to_stop_api_when_polling_receive_FAILED(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_stop_api_when_polling_receive_FAILED(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2253,32 +1965,24 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -2286,13 +1990,11 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "FAILED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -2300,7 +2002,7 @@ class TestServiceAPIBase:
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "FAILED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -2308,7 +2010,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -2325,9 +2026,7 @@ class TestServiceAPIBase:
             in caplog.text
         )
 
-    def test_service_request_to_stop_api_when_polling_receive_404_error(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_stop_api_when_polling_receive_404_error(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2338,32 +2037,24 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {"code": "340401", "message": f"Extended procedure {EXTENDED_PROCEDURE_ID} not found"},
             status=404,
         )
@@ -2371,7 +2062,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -2385,9 +2075,7 @@ class TestServiceAPIBase:
         assert result.statusCode == 202
         assert "[E40034]Failed to get extended process information." in caplog.text
 
-    def test_service_request_to_stop_api_when_polling_receive_422_error(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_stop_api_when_polling_receive_422_error(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2398,32 +2086,24 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {"detail": [{"loc": ["string", 0], "msg": "string", "type": "string"}]},
             status=422,
         )
@@ -2431,7 +2111,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -2445,9 +2124,7 @@ class TestServiceAPIBase:
         assert result.statusCode == 202
         assert "[E40034]Failed to get extended process information." in caplog.text
 
-    def test_service_request_to_stop_api_when_polling_receive_500_error(
-        self, httpserver, mocker, caplog, init_db_instance
-    ):
+    def test_service_request_to_stop_api_when_polling_receive_500_error(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2458,32 +2135,24 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {},
             status=500,
         )
@@ -2491,7 +2160,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.operationID == 1
@@ -2505,7 +2173,7 @@ class TestServiceAPIBase:
         assert result.statusCode == 202
         assert "[E40034]Failed to get extended process information." in caplog.text
 
-    def test_service_request_to_stop_api_when_validate_error(self, httpserver, mocker, caplog, init_db_instance):
+    def test_service_request_to_stop_api_when_validate_error(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2515,32 +2183,24 @@ class TestServiceAPIBase:
 
         config = self.config
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetRequestInstanceID → targetServiceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json({"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202)
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
+            {"extendedProcedureID": EXTENDED_PROCEDURE_ID}, status=202
+        )
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
                 "applyID": applyID,
                 "targetCPUID": hostCpuId,
@@ -2548,7 +2208,7 @@ class TestServiceAPIBase:
                 "operation": "stop",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "dummy",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
@@ -2556,7 +2216,6 @@ class TestServiceAPIBase:
         # act
         execute_result = api_obj.execute(paylod)
         result: Details = execute_result[ApiExecuteResultIdx.DETAIL]
-        httpserver.clear()
 
         # assert
         assert result.status == "FAILED"
@@ -2569,7 +2228,7 @@ class TestServiceAPIBase:
 
         assert "[E40001]'dummy' is not one of ['IN_PROGRESS', 'COMPLETED', 'FAILED']" in caplog.text
 
-    def test_stop_api_without_extended_procedure_id(self, httpserver, mocker, caplog, init_db_instance):
+    def test_stop_api_without_extended_procedure_id(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2580,30 +2239,22 @@ class TestServiceAPIBase:
         config = self.config
         config.workflow_manager["extended-procedure"]["polling"]["count"] = 2
 
-        applyID = str(uuid4())
+        applyID = fake_uuid()
         api_obj: StopAPI = StopAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
                 "applyID": applyID,
             }
         )
 
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        procedure = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "stop",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        procedure = replace(
+            PROCEDURE_TEMPLATE, operation="stop", targetCPUID=hostCpuId, targetRequestInstanceID=targetRequestInstanceID
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure"), method="POST"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_PATTERN, method="POST").respond_with_json(
             {
                 "message": "Request accepted",
                 # The response does not contain the extendedProcedureID.
@@ -2622,7 +2273,7 @@ class TestServiceAPIBase:
         assert "extendedProcedureID:" not in caplog.text
         assert api_obj.get_service_api.extended_procedure_id is None
 
-    def test_service_can_request_to_get_service_infromation_api(self, httpserver, mocker, caplog, init_db_instance):
+    def test_service_can_request_to_get_service_infromation_api(self, httpserver, mocker, caplog):
         # arrange
         mocker.patch("logging.config.dictConfig")
         logger = logging.getLogger("logger.py")
@@ -2635,42 +2286,35 @@ class TestServiceAPIBase:
         api_obj: GetServiceInformationAPI = GetServiceInformationAPI(
             **{
                 "workflow_manager_conf": config.workflow_manager,
-                "logger_args": LayoutApplyLogConfig().log_config,
+                "logger_args": config.log_config,
             }
         )
 
         api_obj.extended_procedure_id = EXTENDED_PROCEDURE_ID
 
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        procedure = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,  # targetServiceID → targetRequestInstanceID
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        procedure = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
 
-        httpserver.expect_request(
-            re.compile(f"\/{WORKFLOW_MANAGER_URI}\/extended-procedure\/{EXTENDED_PROCEDURE_ID}"), method="GET"
-        ).respond_with_json(
+        httpserver.expect_request(EXTENDED_PROCEDURE_STATUS_PATTERN, method="GET").respond_with_json(
             {
-                "applyID": str(uuid4()),
+                "applyID": fake_uuid(),
                 "targetCPUID": hostCpuId,
                 "targetRequestInstanceID": targetRequestInstanceID,
                 "operation": "start",
                 "id": EXTENDED_PROCEDURE_ID,
                 "status": "COMPLETED",
-                "serviceInstanceID": str(uuid4()),
+                "serviceInstanceID": fake_uuid(),
             },
             status=200,
         )
 
         # act
         result = api_obj.execute(procedure)
-        httpserver.clear()
 
         # assert
         assert result["code"] == 200
@@ -2678,9 +2322,7 @@ class TestServiceAPIBase:
         assert result["service_information"]["id"] == EXTENDED_PROCEDURE_ID
         assert "Request completed. status:[200]" in caplog.text
 
-    def test_service_can_request_to_get_service_information_api_when_failed_to_load_the_logs(
-        self, mocker, init_db_instance
-    ):
+    def test_service_can_request_to_get_service_information_api_when_failed_to_load_the_logs(self, mocker):
         # arrange
         config = LayoutApplyConfig()
         mocker.patch.object(
@@ -2692,16 +2334,12 @@ class TestServiceAPIBase:
                 "logger_args": LayoutApplyLogConfig().log_config,
             }
         )
-        hostCpuId = str(uuid4())
-        targetRequestInstanceID = str(uuid4())
-        paylod = Procedure(
-            **{
-                "operationID": 1,
-                "operation": "start",
-                "targetCPUID": hostCpuId,
-                "targetRequestInstanceID": targetRequestInstanceID,
-                "dependencies": [],
-            }
+        hostCpuId = fake_uuid()
+        targetRequestInstanceID = fake_uuid()
+        paylod = replace(
+            PROCEDURE_TEMPLATE,
+            targetCPUID=hostCpuId,
+            targetRequestInstanceID=targetRequestInstanceID,
         )
         # act
         result = api_obj.execute(paylod)
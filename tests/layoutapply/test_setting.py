@@ -2080,6 +2080,115 @@ class TestLayoutApplyConfig:
         with pytest.raises(Exception):
             LayoutApplyConfig().hardware_control
 
+    @pytest.mark.parametrize(
+        "backoff, expected",
+        [
+            # unset values will default.
+            ({}, {"base": 2, "cap": 60, "jitter": "full"}),
+            ({"base": 1.5, "cap": 10}, {"base": 1.5, "cap": 10, "jitter": "full"}),
+            ({"cap": 10, "jitter": "none"}, {"base": 2, "cap": 10, "jitter": "none"}),
+        ],
+    )
+    def test_setting_config_value_applied_when_retry_backoff_config(self, mocker, backoff, expected):
+        config = copy.deepcopy(BASE_CONFIG)
+        config["hardware_control"]["disconnect"]["retry"]["backoff"] = backoff
+        mocker.patch("yaml.safe_load").side_effect = [config, LOG_BASE_CONFIG]
+        mocker.patch("requests.get")
+        conf = LayoutApplyConfig().disconnect
+        assert conf["retry"]["backoff"] == expected
+
+    def test_setting_no_backoff_when_no_retry_backoff_config(self, mocker):
+        config = copy.deepcopy(BASE_CONFIG)
+        mocker.patch("yaml.safe_load").side_effect = [config, LOG_BASE_CONFIG]
+        mocker.patch("requests.get")
+        conf = LayoutApplyConfig().disconnect
+        assert "backoff" not in conf["retry"]
+
+    @pytest.mark.parametrize(
+        "backoff",
+        [
+            {"base": 0.5},
+            {"base": 5},
+            {"cap": -1},
+            {"cap": 241},
+            {"cap": "10"},
+            {"jitter": "equal"},
+            "full",
+        ],
+    )
+    def test_setting_failure_when_invalid_retry_backoff_config(self, mocker, backoff):
+        config = copy.deepcopy(BASE_CONFIG)
+        config["hardware_control"]["disconnect"]["retry"]["backoff"] = backoff
+        mocker.patch("yaml.safe_load").side_effect = [config, LOG_BASE_CONFIG]
+        with pytest.raises(Exception):
+            LayoutApplyConfig().disconnect
+
+    @pytest.mark.parametrize(
+        "backoff, expected",
+        [
+            # unset values will default.
+            ({}, {"base": 1.3, "cap": 240, "jitter": "none"}),
+            ({"base": 2, "cap": 10}, {"base": 2, "cap": 10, "jitter": "none"}),
+            ({"base": 1.5, "cap": 10, "jitter": "full"}, {"base": 1.5, "cap": 10, "jitter": "full"}),
+        ],
+    )
+    def test_setting_config_value_applied_when_isosboot_polling_backoff_config(self, mocker, backoff, expected):
+        config = copy.deepcopy(BASE_CONFIG)
+        config["hardware_control"]["isosboot"]["polling"]["backoff"] = backoff
+        mocker.patch("yaml.safe_load").side_effect = [config, LOG_BASE_CONFIG]
+        mocker.patch("requests.get")
+        conf = LayoutApplyConfig().isosboot
+        assert conf["polling"]["backoff"] == expected
+
+    @pytest.mark.parametrize("operation", ["poweroff", "connect", "disconnect"])
+    def test_setting_config_value_applied_when_get_information_polling_backoff_config(self, mocker, operation):
+        config = copy.deepcopy(BASE_CONFIG)
+        config["get_information"]["specs"][operation]["polling"]["backoff"] = {"cap": 10}
+        mocker.patch("yaml.safe_load").side_effect = [config, LOG_BASE_CONFIG]
+        mocker.patch("requests.get")
+        specs_conf = LayoutApplyConfig().get_information["specs"]
+        assert specs_conf[operation]["polling"]["backoff"] == {"base": 1.3, "cap": 10, "jitter": "none"}
+        assert all(
+            "backoff" not in specs_conf[o]["polling"] for o in ["poweroff", "connect", "disconnect"] if o != operation
+        )
+
+    def test_setting_no_backoff_when_no_polling_backoff_config(self, mocker):
+        config = copy.deepcopy(BASE_CONFIG)
+        mocker.patch("yaml.safe_load").side_effect = [config, LOG_BASE_CONFIG]
+        mocker.patch("requests.get")
+        layout_config = LayoutApplyConfig()
+        assert "backoff" not in layout_config.isosboot["polling"]
+        assert "backoff" not in layout_config.get_information["specs"]["poweroff"]["polling"]
+
+    @pytest.mark.parametrize(
+        "backoff",
+        [
+            {"base": 0.5},
+            {"base": 5},
+            {"base": "2"},
+            {"cap": -1},
+            {"cap": 241},
+            {"jitter": "equal"},
+            "full",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "polling_path",
+        [
+            ["hardware_control", "isosboot", "polling"],
+            ["get_information", "specs", "poweroff", "polling"],
+        ],
+    )
+    def test_setting_failure_when_invalid_polling_backoff_config(self, mocker, backoff, polling_path):
+        config = copy.deepcopy(BASE_CONFIG)
+        polling_conf = config
+        for key in polling_path:
+            polling_conf = polling_conf[key]
+        polling_conf["backoff"] = backoff
+        mocker.patch("yaml.safe_load").side_effect = [config, LOG_BASE_CONFIG]
+        with pytest.raises(SettingFileLoadException):
+            LayoutApplyConfig()
+
     def test_setting_default_set_when_invalid_logging_level(self, mocker):
         mocker.patch("yaml.safe_load").return_value = LOG_BASE_CONFIG
 